@@ -1,6 +1,8 @@
+from collections import OrderedDict
+from threading import Lock
+from weakref import WeakValueDictionary
 import os.path
 
-from pyrsistent import pvector
 from zope.interface import implementer
 import attr
 
@@ -12,11 +14,186 @@ if _PY3:
     basestring = bytes, str
 
 
+#: Paths previously created by ``from_string(..., intern=True)``.
+_INTERNED = WeakValueDictionary()
+
+
+def _split(path):
+    """
+    Split an OS-specific string into whether it is relative and its segments.
+    """
+
+    if not path:
+        raise InvalidPath(path)
+
+    drive, rest = os.path.splitdrive(path.rstrip(os.sep))
+    split = tuple(rest.split(os.sep))
+    if split[0]:
+        return True, split
+    return False, split[1:]
+
+
+@attr.s
+class _ParseCache(object):
+    """
+    A bounded, least recently used cache of split path strings.
+
+    Lowering ``maxsize`` takes effect the next time a string is split, and a
+    ``maxsize`` of 0 (or less) disables caching entirely.
+    """
+
+    maxsize = attr.ib(default=4096)
+    hits = attr.ib(default=0)
+    misses = attr.ib(default=0)
+    _entries = attr.ib(factory=OrderedDict, repr=False)
+    _lock = attr.ib(factory=Lock, repr=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def split(self, path):
+        return self.split_many([path])[0]
+
+    def split_many(self, paths):
+        """
+        Split each of the given strings, taking the lock at most twice.
+        """
+
+        entries = self._entries
+        results, missing = [], {}
+        with self._lock:
+            self._trim()
+            for path in paths:
+                parsed = entries.pop(path, None)
+                if parsed is None:
+                    missing.setdefault(path, []).append(len(results))
+                else:
+                    entries[path] = parsed
+                    self.hits += 1
+                results.append(parsed)
+
+        if not missing:
+            return results
+
+        for path, indices in missing.items():
+            parsed = _split(path)
+            for index in indices:
+                results[index] = parsed
+
+        with self._lock:
+            self.misses += len(missing)
+            if self.maxsize > 0:
+                for path in missing:
+                    entries[path] = results[missing[path][0]]
+                self._trim()
+        return results
+
+    def _trim(self):
+        """
+        Evict the least recently used entries beyond ``maxsize``.
+        """
+        if self.maxsize <= 0:
+            self._entries.clear()
+            return
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _lineage(cls, segments):
+    """
+    Paths for each (top-down) non-empty prefix of the given segments.
+
+    Each but the first is a child of the one before it, sharing its segments
+    rather than holding its own copy of them.
+    """
+
+    path = cls._from_segments(segments[:1])
+    lineage = [path]
+    for segment in segments[1:]:
+        path = cls._child(parent=path, name=segment)
+        lineage.append(path)
+    return lineage
+
+
 @implementer(interfaces.Path)
-@attr.s(these={"segments": attr.ib()}, init=False, repr=False, hash=True)
+@attr.s(these={"segments": attr.ib()}, init=False, repr=False, hash=False)
 class Path(object):
+
+    #: The cache shared by every call to `Path.from_string`.
+    parse_cache = _ParseCache()
+
+    # A path either holds its segments, or (if it was created as the child of
+    # another) just its parent and name, until its segments are asked for.
+    __slots__ = (
+        "_segments",
+        "_parent",
+        "_name",
+        "_length",
+        "_rendered",
+        "_hash",
+        "__weakref__",
+    )
+
     def __init__(self, *segments):
-        self.segments = pvector(segments)
+        self._segments = segments
+        self._parent = None
+        self._name = None
+        self._length = len(segments)
+        self._rendered = None
+        self._hash = None
+
+    @classmethod
+    def _from_segments(cls, segments):
+        """
+        Create a path directly from a tuple of segments.
+        """
+        path = cls.__new__(cls)
+        path._segments = segments
+        path._parent = None
+        path._name = None
+        path._length = len(segments)
+        path._rendered = None
+        path._hash = None
+        return path
+
+    @classmethod
+    def _child(cls, parent, name):
+        """
+        Create a path one segment below another, without copying its segments.
+        """
+        path = cls.__new__(cls)
+        path._segments = None
+        path._parent = parent
+        path._name = name
+        path._length = parent._length + 1
+        path._rendered = None
+        path._hash = None
+        return path
+
+    @property
+    def segments(self):
+        if self._segments is None:
+            names, path = [], self
+            while path._segments is None:
+                names.append(path._name)
+                path = path._parent
+            names.reverse()
+            self._segments = path._segments + tuple(names)
+        return self._segments
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self.__class__, self.segments))
+        return self._hash
+
+    def __reduce__(self):
+        # String hashes vary between processes, so don't pickle our cache.
+        return self.__class__, self.segments
 
     def __div__(self, other):
         if not isinstance(other, basestring):  # FIXME: Unicode paths
@@ -27,7 +204,13 @@ class Path(object):
         return "<Path {}>".format(self)
 
     def __str__(self):
-        return os.sep + os.sep.join(self.segments)
+        if self._rendered is None:
+            parent = self._parent
+            if parent is not None and parent._length and parent._rendered:
+                self._rendered = parent._rendered + os.sep + self.segments[-1]
+            else:
+                self._rendered = os.sep + os.sep.join(self.segments)
+        return self._rendered
 
     if _PY3:
         __truediv__ = __div__
@@ -46,21 +229,50 @@ class Path(object):
         return cls()
 
     @classmethod
-    def from_string(cls, path):
+    def from_string(cls, path, intern=False):
         """
         Create a path out of an OS-specific string.
+
+        If ``intern`` is true, repeated calls with the same string return
+        the same path object for as long as it remains alive.
+        """
+
+        if not intern:
+            return cls._parse(path)
+
+        key = cls, path
+        interned = _INTERNED.get(key)
+        if interned is None:
+            interned = _INTERNED[key] = cls._parse(path)
+        return interned
+
+    @classmethod
+    def from_strings(cls, paths, intern=False):
         """
+        Create a list of paths out of an iterable of OS-specific strings.
+        """
+
+        if intern:
+            return [cls.from_string(path, intern=True) for path in paths]
+        return [
+            cls._from_split(relative=relative, segments=segments)
+            for relative, segments in cls.parse_cache.split_many(paths)
+        ]
 
-        if not path:
-            raise InvalidPath(path)
+    @classmethod
+    def _parse(cls, path):
+        relative, segments = cls.parse_cache.split(path)
+        return cls._from_split(relative=relative, segments=segments)
 
-        drive, rest = os.path.splitdrive(path.rstrip(os.sep))
-        split = rest.split(os.sep)
-        if split[0]:
-            return RelativePath(*split)
-        return cls(*split[1:])
+    @classmethod
+    def _from_split(cls, relative, segments):
+        if relative:
+            return RelativePath._from_segments(segments)
+        return cls._from_segments(segments)
 
     def basename(self):
+        if self._segments is None:
+            return self._name
         return (self.segments or [""])[-1]
 
     def dirname(self):
@@ -71,17 +283,35 @@ class Path(object):
         The (top-down) direct ancestors of this path, including itself.
         """
 
-        segments = pvector()
-        for segment in self.segments[:-1]:
-            segments = segments.append(segment)
-            yield self.__class__(*segments)
-        yield self
+        return reversed(list(self.ancestors()))
+
+    def ancestors(self):
+        """
+        The (bottom-up) direct ancestors of this path, including itself.
+
+        Parents already known are reused, and the rest are created together
+        as a chain sharing their segments, so that none are copied.
+        """
+
+        path = self
+        yield path
+        while path._length > 1 and path._parent is not None:
+            path = path._parent
+            yield path
+        if path._length > 1:
+            lineage = _lineage(cls=type(path), segments=path.segments[:-1])
+            for ancestor in reversed(lineage):
+                yield ancestor
 
     def descendant(self, *segments):
-        return self.__class__(*self.segments.extend(segments))
+        if len(segments) == 1:
+            return self._child(parent=self, name=segments[0])
+        return self._from_segments(self.segments + segments)
 
     def parent(self):
-        return self.__class__(*self.segments[:-1])
+        if self._parent is None:
+            return self._from_segments(self.segments[:-1])
+        return self._parent
 
     def sibling(self, name):
         if not self.segments:
@@ -99,10 +329,75 @@ class Path(object):
 
 
 @implementer(interfaces.Path)
-@attr.s(these={"segments": attr.ib()}, init=False, repr=False, hash=True)
+@attr.s(these={"segments": attr.ib()}, init=False, repr=False, hash=False)
 class RelativePath(object):
+    # A path either holds its segments, or (if it was created as the child of
+    # another) just its parent and name, until its segments are asked for.
+    __slots__ = (
+        "_segments",
+        "_parent",
+        "_name",
+        "_length",
+        "_rendered",
+        "_hash",
+        "__weakref__",
+    )
+
     def __init__(self, *segments):
-        self.segments = pvector(segments)
+        self._segments = segments
+        self._parent = None
+        self._name = None
+        self._length = len(segments)
+        self._rendered = None
+        self._hash = None
+
+    @classmethod
+    def _from_segments(cls, segments):
+        """
+        Create a path directly from a tuple of segments.
+        """
+        path = cls.__new__(cls)
+        path._segments = segments
+        path._parent = None
+        path._name = None
+        path._length = len(segments)
+        path._rendered = None
+        path._hash = None
+        return path
+
+    @classmethod
+    def _child(cls, parent, name):
+        """
+        Create a path one segment below another, without copying its segments.
+        """
+        path = cls.__new__(cls)
+        path._segments = None
+        path._parent = parent
+        path._name = name
+        path._length = parent._length + 1
+        path._rendered = None
+        path._hash = None
+        return path
+
+    @property
+    def segments(self):
+        if self._segments is None:
+            names, path = [], self
+            while path._segments is None:
+                names.append(path._name)
+                path = path._parent
+            names.reverse()
+            self._segments = path._segments + tuple(names)
+        return self._segments
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self.__class__, self.segments))
+        return self._hash
+
+    def __reduce__(self):
+        # String hashes vary between processes, so don't pickle our cache.
+        return self.__class__, self.segments
 
     def __div__(self, other):
         if not isinstance(other, basestring):  # FIXME: Unicode paths
@@ -113,34 +408,60 @@ class RelativePath(object):
         return "<Path {}>".format(self)
 
     def __str__(self):
-        return os.sep.join(self.segments)
+        if self._rendered is None:
+            parent = self._parent
+            if parent is not None and parent._length and parent._rendered:
+                self._rendered = parent._rendered + os.sep + self.segments[-1]
+            else:
+                self._rendered = os.sep.join(self.segments)
+        return self._rendered
 
     if _PY3:
         __truediv__ = __div__
         __fspath__ = __str__
 
     def basename(self):
+        if self._segments is None:
+            return self._name
         return (self.segments or [""])[-1]
 
     def dirname(self):
         return str(self.parent())
 
     def parent(self):
-        return self.__class__(*self.segments[:-1])
+        if self._parent is None:
+            return self._from_segments(self.segments[:-1])
+        return self._parent
 
     def heritage(self):
         """
         The (top-down) direct ancestors of this path, including itself.
         """
 
-        segments = pvector()
-        for segment in self.segments[:-1]:
-            segments = segments.append(segment)
-            yield self.__class__(*segments)
-        yield self
+        return reversed(list(self.ancestors()))
+
+    def ancestors(self):
+        """
+        The (bottom-up) direct ancestors of this path, including itself.
+
+        Parents already known are reused, and the rest are created together
+        as a chain sharing their segments, so that none are copied.
+        """
+
+        path = self
+        yield path
+        while path._length > 1 and path._parent is not None:
+            path = path._parent
+            yield path
+        if path._length > 1:
+            lineage = _lineage(cls=type(path), segments=path.segments[:-1])
+            for ancestor in reversed(lineage):
+                yield ancestor
 
     def descendant(self, *segments):
-        return self.__class__(*self.segments.extend(segments))
+        if len(segments) == 1:
+            return self._child(parent=self, name=segments[0])
+        return self._from_segments(self.segments + segments)
 
     def sibling(self, name):
         return self.parent() / name
@@ -0,0 +1,298 @@
+"""
+An asyncio interface to filesystems.
+
+Each operation returns an awaitable rather than blocking. Filesystems whose
+operations may block (like native ones) have them run in a bounded pool of
+threads, while those which never do (like memory ones) may instead complete
+them immediately.
+
+Nothing here uses ``async`` syntax, so that the package as a whole still
+compiles on Python 2.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+import asyncio
+
+import attr
+
+
+#: The most threads used (by default) to run filesystems' operations.
+_MAX_WORKERS = 8
+_EXECUTOR = None
+_EXECUTOR_LOCK = Lock()
+
+_get_running_loop = getattr(
+    asyncio, "get_running_loop", asyncio.get_event_loop,  # Python < 3.7
+)
+
+#: Operations which are run as-is, returning whatever they return.
+_OPERATIONS = (
+    "create_directory",
+    "list_directory",
+    "remove_empty_directory",
+    "temporary_directory",
+
+    "get_contents",
+    "set_contents",
+    "create_with_contents",
+
+    "remove",
+    "remove_file",
+
+    "copy",
+    "copytree",
+    "move",
+
+    "stat",
+    "stat_many",
+
+    "lstat",
+    "link",
+    "readlink",
+    "realpath",
+
+    "exists",
+    "is_dir",
+    "is_file",
+    "is_link",
+
+    "touch",
+
+    "children",
+    "glob_children",
+)
+
+#: File methods which are run as-is, returning whatever they return.
+_FILE_METHODS = (
+    "close",
+    "flush",
+    "read",
+    "readline",
+    "readlines",
+    "seek",
+    "tell",
+    "truncate",
+    "write",
+    "writelines",
+)
+
+
+def FS(fs, inline=False, executor=None):
+    """
+    Wrap a filesystem in an asyncio interface.
+
+    If ``inline`` is true, operations are run as soon as they're called, which
+    is only suitable for filesystems which never block, like memory ones.
+    Otherwise they're run by the given executor (by default, a pool of at
+    most ``_MAX_WORKERS`` threads shared by every filesystem wrapped without
+    one), so that the event loop never waits on one.
+
+    Either way, operations start when they're called, and may be awaited by
+    whichever event loop is running once they are.
+    """
+    if inline:
+        run = _inline
+    else:
+        if executor is None:
+            executor = _default_executor()
+        run = partial(_in_executor, executor)
+    return _FS(fs=fs, run=run)
+
+
+def _default_executor():
+    """
+    The executor shared by filesystems wrapped without one, created on first
+    use.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+        return _EXECUTOR
+
+
+def _inline(fn, *args, **kwargs):
+    """
+    Run a function now, returning an awaitable which is already done.
+    """
+    future = Future()
+    try:
+        result = fn(*args, **kwargs)
+    except Exception as error:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return _Awaitable(future=future)
+
+
+def _in_executor(executor, fn, *args, **kwargs):
+    """
+    Run a function in the given executor.
+    """
+    return _Awaitable(future=executor.submit(fn, *args, **kwargs))
+
+
+@attr.s
+class _Awaitable(object):
+    """
+    The outcome of an operation, which may be awaited by whichever event loop
+    is running when it is.
+    """
+
+    _future = attr.ib()
+
+    def __await__(self):
+        future = asyncio.wrap_future(self._future, loop=_get_running_loop())
+        return future.__await__()
+
+    def done(self):
+        return self._future.done()
+
+
+def _delegate(to, name):
+    """
+    A method running the same method of the object at the given attribute.
+    """
+
+    def delegated(self, *args, **kwargs):
+        method = getattr(getattr(self, to), name)
+        return self._run(method, *args, **kwargs)
+
+    delegated.__name__ = str(name)
+    return delegated
+
+
+def _opener(name):
+    """
+    A method opening a file, which is then wrapped in an asynchronous one.
+    """
+
+    def opener(self, *args, **kwargs):
+        open_file = getattr(self._fs, name)
+        return self._run(
+            lambda: _File(file=open_file(*args, **kwargs), run=self._run),
+        )
+
+    opener.__name__ = str(name)
+    return opener
+
+
+def _iterator(name):
+    """
+    A method asynchronously iterating over what one of the wrapped
+    filesystem's methods produces.
+    """
+
+    def iterator(self, *args, **kwargs):
+        return _Iterator(
+            start=partial(getattr(self._fs, name), *args, **kwargs),
+            run=self._run,
+        )
+
+    iterator.__name__ = str(name)
+    return iterator
+
+
+@attr.s
+class _FS(object):
+    """
+    A filesystem whose (possibly blocking) operations return awaitables.
+    """
+
+    _fs = attr.ib()
+    _run = attr.ib(repr=False)
+
+    open = _opener("open")
+    create = _opener("create")
+
+    walk = _iterator("walk")
+    iter_chunks = _iterator("iter_chunks")
+    iter_lines = _iterator("iter_lines")
+
+    def removing(self, path):
+        return _Removing(fs=self, path=path)
+
+
+for _name in _OPERATIONS:
+    setattr(_FS, _name, _delegate("_fs", _name))
+
+
+@attr.s
+class _Iterator(object):
+    """
+    An asynchronous iterator whose (possibly blocking) steps are each run.
+    """
+
+    _start = attr.ib()
+    _run = attr.ib(repr=False)
+    _iterator = attr.ib(default=None, repr=False)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self._run(self._next)
+
+    def _next(self):
+        if self._iterator is None:
+            self._iterator = iter(self._start())
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration()
+
+
+@attr.s
+class _Removing(object):
+    """
+    An asynchronous context manager removing a path when it exits.
+    """
+
+    _fs = attr.ib()
+    _path = attr.ib()
+
+    def __aenter__(self):
+        return _inline(lambda: self._path)
+
+    def __aexit__(self, *exc_info):
+        return self._fs.remove(path=self._path)
+
+
+@attr.s
+class _File(object):
+    """
+    A file whose (possibly blocking) methods return awaitables.
+
+    Iterating over it asynchronously produces its lines.
+    """
+
+    _file = attr.ib()
+    _run = attr.ib(repr=False)
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def __aenter__(self):
+        return _inline(lambda: self)
+
+    def __aexit__(self, *exc_info):
+        return self.close()
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self._run(self._next_line)
+
+    def _next_line(self):
+        line = self._file.readline()
+        if not line:
+            raise StopAsyncIteration()
+        return line
+
+
+for _name in _FILE_METHODS:
+    setattr(_File, _name, _delegate("_file", _name))
@@ -0,0 +1,283 @@
+"""
+A filesystem which caches metadata looked up from another filesystem.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+import copy
+import time
+
+from pyrsistent import pset
+import attr
+
+from filesystems import common, exceptions
+
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+def FS(fs, ttl=None, maxsize=4096, clock=_clock):
+    """
+    Wrap a filesystem, caching the results of metadata lookups.
+
+    The results of ``stat``, ``lstat``, ``readlink`` and ``list_directory``
+    (including any filesystem errors they raise) are remembered for ``ttl``
+    seconds (or indefinitely if it is ``None``), keeping at most ``maxsize``
+    of them.
+
+    Any mutation made through the returned filesystem (including writing to
+    or closing a file opened for writing) discards everything cached once it
+    is made, since with symbolic links in play a change to one path may
+    change the metadata seen through any other. Changes made directly to the
+    wrapped filesystem are only noticed once cached entries expire.
+    """
+    state = _State(
+        fs=fs,
+        cache=_Cache(ttl=ttl, maxsize=maxsize, clock=clock),
+    )
+    return state.FS(name="CachingFS")
+
+
+def _fs(fn):
+    """
+    Eat the fs argument.
+    """
+    return lambda fs, *args, **kwargs: fn(*args, **kwargs)
+
+
+def _mutating(fn):
+    """
+    Run an operation which may change the tree, discarding the cache once it
+    has (or once it has failed, having perhaps changed part of it).
+    """
+
+    @wraps(fn)
+    def mutating(self, *args, **kwargs):
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            self._cache.clear()
+    return mutating
+
+
+@attr.s
+class _Cache(object):
+    """
+    A thread safe, least recently used cache whose entries can expire.
+
+    Each clear starts a new generation, and values computed during an
+    earlier one are not kept, since they may predate whatever the clear was
+    for.
+    """
+
+    _ttl = attr.ib()
+    _maxsize = attr.ib()
+    _clock = attr.ib()
+    _entries = attr.ib(factory=OrderedDict, repr=False)
+    _lock = attr.ib(factory=Lock, repr=False)
+    _generation = attr.ib(default=0, repr=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def get(self, key, compute):
+        """
+        Retrieve a cached value, or compute it (and cache it) if missing.
+        """
+
+        now = self._clock()
+        with self._lock:
+            generation = self._generation
+            entry = self._entries.pop(key, None)
+            if entry is not None and (entry[0] is None or now < entry[0]):
+                self._entries[key] = entry
+            else:
+                entry = None
+
+        if entry is None:
+            try:
+                entry = None, True, compute()
+            except exceptions._FileSystemError as error:
+                entry = None, False, error
+            self._add(key=key, entry=entry, now=now, generation=generation)
+
+        _, succeeded, value = entry
+        if not succeeded:
+            # Raise a copy so tracebacks don't accumulate on the cached one.
+            raise copy.copy(value)
+        return value
+
+    def _add(self, key, entry, now, generation):
+        if self._maxsize <= 0:
+            return
+        if self._ttl is not None:
+            entry = (now + self._ttl,) + entry[1:]
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = entry
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+@attr.s(hash=True)
+class _State(object):
+
+    _fs = attr.ib()
+    _cache = attr.ib(hash=False)
+
+    def FS(self, name):
+        return common.create(
+            name=name,
+
+            create_file=_fs(self.create_file),
+            open_file=_fs(self.open_file),
+            remove_file=_fs(self.remove_file),
+
+            create_directory=_fs(self.create_directory),
+            list_directory=_fs(self.list_directory),
+            remove_empty_directory=_fs(self.remove_empty_directory),
+            temporary_directory=_fs(self.temporary_directory),
+
+            stat=_fs(self.stat),
+
+            lstat=_fs(self.lstat),
+            link=_fs(self.link),
+            readlink=_fs(self.readlink),
+
+            remove=_fs(self.remove),
+            copy=_fs(self.copy),
+            copytree=_fs(self.copytree),
+            move=_fs(self.move),
+        )()
+
+    def _cached(self, name, path, compute):
+        return self._cache.get(key=(name, path), compute=compute)
+
+    @_mutating
+    def create_directory(self, path, with_parents):
+        self._fs.create_directory(path=path, with_parents=with_parents)
+
+    def list_directory(self, path):
+        return self._cached(
+            "list_directory",
+            path,
+            lambda: pset(self._fs.list_directory(path=path)),
+        )
+
+    @_mutating
+    def remove_empty_directory(self, path):
+        self._fs.remove_empty_directory(path=path)
+
+    @_mutating
+    def temporary_directory(self):
+        return self._fs.temporary_directory()
+
+    @_mutating
+    def create_file(self, path):
+        return _File(file=self._fs.create(path=path), cache=self._cache)
+
+    def open_file(self, path, mode):
+        if common._parse_mode(mode=mode).read:
+            return self._fs.open(path=path, mode=mode)
+        return self._open_file_for_writing(path=path, mode=mode)
+
+    @_mutating
+    def _open_file_for_writing(self, path, mode):
+        file = self._fs.open(path=path, mode=mode)
+        return _File(file=file, cache=self._cache)
+
+    @_mutating
+    def remove_file(self, path):
+        self._fs.remove_file(path=path)
+
+    @_mutating
+    def remove(self, path, parallelism=None):
+        self._fs.remove(path=path, parallelism=parallelism)
+
+    @_mutating
+    def copy(self, source, destination):
+        self._fs.copy(source=source, destination=destination)
+
+    @_mutating
+    def copytree(self, source, destination, parallelism=None):
+        self._fs.copytree(
+            source=source,
+            destination=destination,
+            parallelism=parallelism,
+        )
+
+    @_mutating
+    def move(self, source, destination):
+        self._fs.move(source=source, destination=destination)
+
+    @_mutating
+    def link(self, source, to):
+        self._fs.link(source=source, to=to)
+
+    def readlink(self, path):
+        return self._cached(
+            "readlink",
+            path,
+            lambda: self._fs.readlink(path=path),
+        )
+
+    def lstat(self, path):
+        return self._cached("lstat", path, lambda: self._fs.lstat(path=path))
+
+    def stat(self, path):
+        return self._cached("stat", path, lambda: self._fs.stat(path=path))
+
+
+def _changing(name):
+    """
+    A file method which discards the cache once it has been called.
+    """
+
+    def changing(self, *args, **kwargs):
+        try:
+            return getattr(self._file, name)(*args, **kwargs)
+        finally:
+            self._cache.clear()
+
+    changing.__name__ = str(name)
+    return changing
+
+
+@attr.s(eq=False)
+class _File(object):
+    """
+    A file open for writing, whose writes (which change its size and times)
+    discard the cache, as does closing it, which flushes any still buffered.
+    """
+
+    _file = attr.ib()
+    _cache = attr.ib(repr=False)
+
+    write = _changing("write")
+    writelines = _changing("writelines")
+    truncate = _changing("truncate")
+    flush = _changing("flush")
+    close = _changing("close")
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __iter__(self):
+        return iter(self._file)
+
+    def __enter__(self):
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            return self._file.__exit__(*exc_info)
+        finally:
+            self._cache.clear()
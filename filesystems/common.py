@@ -1,29 +1,53 @@
 from contextlib import contextmanager
 from fnmatch import fnmatch
+from shutil import copyfileobj
+from threading import Event, Lock
 import stat
 
-from pyrsistent import pset
+from pyrsistent import pmap, pset
 import attr
 
 from filesystems import _PY3, Path, exceptions
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # pragma: no cover
+    ThreadPoolExecutor = None
 
-def _realpath(fs, path, seen=pset()):
+
+#: The most files each task removes when removing a tree in parallel.
+_REMOVE_BATCH_SIZE = 256
+
+#: How much of a file ``fs.iter_chunks`` reads at once by default.
+_CHUNK_SIZE = 2 ** 16
+
+
+def _realpath(fs, path, seen=pset(), cache=None):
     """
     .. warning::
 
         The ``os.path`` module's realpath does not error or warn about
         loops, but we do, following the behavior of GNU ``realpath(1)``!
+
+    If a ``cache`` is given, it maps segments of already resolved prefixes to
+    their real paths, and is both consulted and updated. Only prefixes whose
+    real path exists are added to it, since creating what's missing may
+    change how what's beneath it resolves (e.g. into a `NotADirectory`).
     """
 
-    real = Path.root()
-    for segment in path.segments:
-        current = real / segment
+    segments = path.segments
+    real, resolved = _longest_cached_prefix(cache=cache, segments=segments)
+    for depth in range(resolved + 1, len(segments) + 1):
+        current = real / segments[depth - 1]
         seen = seen.add(current)
         while True:
             try:
                 current = fs.readlink(current)
-            except (exceptions.FileNotFound, exceptions.NotASymlink):
+            except exceptions.NotASymlink:
+                exists = True
+                break
+            except exceptions.FileNotFound:
+                exists = False
                 break
             else:
                 current = current.relative_to(real)
@@ -31,19 +55,488 @@ def _realpath(fs, path, seen=pset()):
                     raise exceptions.SymbolicLoop(path)
                 current = fs.realpath(current, seen=seen)
         real = current
+        if cache is not None and exists:
+            cache[segments[:depth]] = real
     return real
 
 
-def _recursive_remove(fs, path):
+def _longest_cached_prefix(cache, segments):
+    """
+    The real path of the longest prefix of the given segments which has been
+    cached, along with its length (or the root if none have been).
+    """
+    if cache:
+        for depth in range(len(segments), 0, -1):
+            cached = cache.get(segments[:depth])
+            if cached is not None:
+                return cached, depth
+    return Path.root(), 0
+
+
+def _kinds_of_children(fs, path):
+    """
+    Split the children of a directory into those to descend into and the rest.
+
+    Links to directories are not descended into, since removing one only
+    removes the link.
+    """
+
+    directories, others = [], []
+    for child in fs.children(path=path):
+        if not fs.is_link(path=child) and fs.is_dir(path=child):
+            directories.append(child)
+        else:
+            others.append(child)
+    return directories, others
+
+
+def _recursive_remove(
+    fs, path, parallelism=None, partition=_kinds_of_children,
+):
     """
     A recursive, non-atomic directory removal.
+
+    The tree is traversed without recursing, so it may be arbitrarily deep.
+    With a ``parallelism`` above 1, that many threads remove the contents of
+    independent directories concurrently, and each directory is removed once
+    everything in it has been.
+
+    ``partition`` splits the children of a directory as `_kinds_of_children`
+    does, and may be replaced by filesystems which can do so more cheaply.
     """
-    if not fs.is_link(path=path) and fs.is_dir(path=path):
-        for child in fs.children(path=path):
-            _recursive_remove(fs=fs, path=child)
-        fs.remove_empty_directory(path=path)
-    else:
+
+    if fs.is_link(path=path) or not fs.is_dir(path=path):
         fs.remove_file(path=path)
+    elif not parallelism or parallelism <= 1 or ThreadPoolExecutor is None:
+        _remove_serially(fs=fs, path=path, partition=partition)
+    else:
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            removal = _ParallelRemoval(
+                fs=fs,
+                partition=partition,
+                root=path,
+                executor=executor,
+            )
+            removal.start()
+        removal.check()
+
+
+def _remove_serially(fs, path, partition):
+    """
+    Remove a directory tree depth first, using a stack rather than recursion.
+    """
+
+    stack = [(path, False)]
+    while stack:
+        path, emptied = stack.pop()
+        if emptied:
+            fs.remove_empty_directory(path=path)
+            continue
+
+        directories, others = partition(fs=fs, path=path)
+        for other in others:
+            fs.remove_file(path=other)
+        stack.append((path, True))
+        stack.extend((directory, False) for directory in directories)
+
+
+@attr.s
+class _ParallelRemoval(object):
+    """
+    The removal of a directory tree by a pool of threads.
+
+    Each directory is listed by one task, which schedules its files' removal
+    (in batches, each of which is another task) and the listing of its
+    subdirectories. Directories count their outstanding tasks, and whichever
+    finishes last removes the directory, continuing up the tree.
+
+    The first failure stops any further tasks from being run.
+    """
+
+    _fs = attr.ib()
+    _partition = attr.ib()
+    _root = attr.ib()
+    _executor = attr.ib(repr=False)
+
+    _pending = attr.ib(factory=dict, repr=False)
+    _lock = attr.ib(factory=Lock, repr=False)
+    _done = attr.ib(factory=Event, repr=False)
+    _error = attr.ib(default=None, repr=False)
+
+    def start(self):
+        self._submit(self._empty, self._root)
+        self._done.wait()
+
+    def check(self):
+        if self._error is not None:
+            raise self._error
+
+    def _submit(self, fn, *args):
+        self._executor.submit(self._run, fn, *args)
+
+    def _run(self, fn, *args):
+        if self._done.is_set():
+            return
+        try:
+            fn(*args)
+        except Exception as error:
+            with self._lock:
+                if self._error is None:
+                    self._error = error
+            self._done.set()
+
+    def _empty(self, directory):
+        directories, others = self._partition(fs=self._fs, path=directory)
+        batches = [
+            others[start:start + _REMOVE_BATCH_SIZE]
+            for start in range(0, len(others), _REMOVE_BATCH_SIZE)
+        ]
+        with self._lock:
+            self._pending[directory] = len(directories) + len(batches) + 1
+
+        for batch in batches:
+            self._submit(self._remove_files, directory, batch)
+        for child in directories:
+            self._submit(self._empty, child)
+        self._finished(directory)
+
+    def _remove_files(self, directory, paths):
+        for path in paths:
+            self._fs.remove_file(path=path)
+        self._finished(directory)
+
+    def _finished(self, directory):
+        """
+        Note that a task for the given directory has finished.
+
+        Once its last one has, remove it, and then any of its ancestors which
+        were only waiting on it.
+        """
+
+        while True:
+            with self._lock:
+                self._pending[directory] -= 1
+                if self._pending[directory]:
+                    return
+                del self._pending[directory]
+
+            self._fs.remove_empty_directory(path=directory)
+            if directory == self._root:
+                self._done.set()
+                return
+            directory = directory.parent()
+
+
+def _copy(fs, source, destination):
+    """
+    Copy the contents of a file, replacing any file already at the
+    destination.
+    """
+    with fs.open(path=source, mode="rb") as reading:
+        _check_not_same(fs=fs, source=source, destination=destination)
+        with fs.open(path=destination, mode="wb") as writing:
+            copyfileobj(reading, writing)
+
+
+def _check_not_same(fs, source, destination):
+    """
+    Refuse to copy a file onto itself, which would first truncate it.
+    """
+    if fs.realpath(path=source) == fs.realpath(path=destination):
+        raise exceptions.SameFile(destination)
+
+
+def _check_not_within(fs, source, destination):
+    """
+    Refuse to copy or move a directory somewhere within itself.
+    """
+    source = fs.realpath(path=source).segments
+    if fs.realpath(path=destination).segments[:len(source)] == source:
+        raise exceptions.DestinationWithinSource(destination)
+
+
+def _copytree(
+    fs, source, destination, parallelism=None, partition=_kinds_of_children,
+):
+    """
+    Copy a directory tree to a destination which must not yet exist.
+
+    Links are copied as links, rather than as what they point to. The tree is
+    traversed without recursing, creating directories as it goes, after
+    which, with a ``parallelism`` above 1, that many threads copy its files.
+    """
+
+    if not fs.is_dir(path=source):
+        # Raise whatever listing it does (e.g. that it's missing), before
+        # checking where the destination is relative to it.
+        fs.list_directory(path=source)
+    _check_not_within(fs=fs, source=source, destination=destination)
+
+    files = []
+    stack = [(source, destination)]
+    while stack:
+        source, destination = stack.pop()
+        directories, others = partition(fs=fs, path=source)
+        fs.create_directory(path=destination)
+        for child in others:
+            to = destination / child.basename()
+            if fs.is_link(path=child):
+                fs.link(source=fs.readlink(path=child), to=to)
+            else:
+                files.append((child, to))
+        stack.extend(
+            (directory, destination / directory.basename())
+            for directory in directories
+        )
+
+    if not parallelism or parallelism <= 1 or ThreadPoolExecutor is None:
+        for source, destination in files:
+            fs.copy(source=source, destination=destination)
+    else:
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            for _ in executor.map(lambda each: fs.copy(*each), files):
+                pass
+
+
+def _move(fs, source, destination):
+    """
+    Move a file, link or directory tree by copying and then removing it.
+
+    Nothing may already exist at the destination.
+    """
+
+    if stat.S_ISDIR(fs.lstat(path=source).st_mode):
+        _check_not_within(fs=fs, source=source, destination=destination)
+    if fs.is_link(path=destination) or fs.exists(path=destination):
+        raise exceptions.FileExists(destination)
+
+    if fs.is_link(path=source):
+        fs.link(source=fs.readlink(path=source), to=destination)
+        fs.remove_file(path=source)
+    elif fs.is_dir(path=source):
+        fs.copytree(source=source, destination=destination)
+        fs.remove(path=source)
+    else:
+        fs.copy(source=source, destination=destination)
+        fs.remove_file(path=source)
+
+
+def _walk(fs, path, topdown=True, follow_links=False):
+    """
+    Recursively walk the directory tree rooted at the given path.
+
+    Yields ``(path, dirnames, filenames)`` triples in the same manner as
+    `os.walk`. When walking top-down, ``dirnames`` may be modified in
+    place to prune the traversal.
+    """
+
+    dirnames, filenames = [], []
+    for name in fs.list_directory(path=path):
+        if _walks_into(fs=fs, path=path / name):
+            dirnames.append(name)
+        else:
+            filenames.append(name)
+
+    if topdown:
+        yield path, dirnames, filenames
+
+    for name in dirnames:
+        child = path / name
+        if follow_links or not fs.is_link(path=child):
+            for each in fs.walk(
+                path=child,
+                topdown=topdown,
+                follow_links=follow_links,
+            ):
+                yield each
+
+    if not topdown:
+        yield path, dirnames, filenames
+
+
+def _walks_into(fs, path):
+    """
+    Whether a child found while walking is a directory.
+
+    Links which can't be resolved (through a file, or in a loop) are simply
+    not directories, just as `os.walk` treats them.
+    """
+    try:
+        return fs.is_dir(path=path)
+    except (exceptions.NotADirectory, exceptions.SymbolicLoop):
+        return False
+
+
+def _stat_or_error(stat_path, path):
+    """
+    Stat the given path, returning rather than raising any failure.
+    """
+
+    try:
+        return stat_path(path=path)
+    except exceptions._FileSystemError as error:
+        return error
+
+
+def _stat_many(fs, paths, follow_links=True):
+    """
+    Stat each of the given paths.
+
+    Returns a mapping from each path to its stat result, or to the
+    exception raised when statting it.
+    """
+
+    stat_path = fs.stat if follow_links else fs.lstat
+    return pmap(
+        dict((path, _stat_or_error(stat_path, path=path)) for path in paths),
+    )
+
+
+def _get_contents(fs, path, mode):
+    with fs.open(path=path, mode="r" + mode) as file:
+        return file.read()
+
+
+def _chunk_size(size):
+    """
+    Check the size of chunks to read a file in, which must be positive.
+    """
+    if size <= 0:
+        raise ValueError("Chunk size must be positive, not {!r}".format(size))
+    return size
+
+
+def _read_into(readinto, size):
+    """
+    Repeatedly read into one buffer of the given size, yielding a view of
+    what was read each time.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    while True:
+        read = readinto(buffer)
+        if not read:
+            return
+        yield view[:read]
+
+
+def _iter_chunks(fs, path, size):
+    """
+    Read a file ``size`` bytes at a time, reusing a single buffer.
+
+    Each chunk is a `memoryview`, which is only valid until the next one is
+    produced, so copy any which should be kept (e.g. with ``bytes(chunk)``).
+    """
+    with fs.open(path=path, mode="rb") as file:
+        for chunk in _read_into(file.readinto, size=size):
+            yield chunk
+
+
+def _iter_lines(fs, path, mode):
+    """
+    Read a file a line at a time.
+    """
+    with fs.open(path=path, mode="r" + mode) as file:
+        for line in file:
+            yield line
+
+
+#: How a file may be mapped by ``fs.mmap``: read only, written through to
+#: the file, or as a private copy.
+_MMAP_ACCESSES = ("r", "w", "c")
+
+
+def _check_access(access):
+    if access not in _MMAP_ACCESSES:
+        raise exceptions.InvalidMode(
+            "Access must be one of {} but found {}".format(
+                repr(_MMAP_ACCESSES),
+                repr(access),
+            )
+        )
+
+
+@contextmanager
+def _mmap(fs, path, access):
+    """
+    Provide a buffer over a file's contents, as a `memoryview`.
+
+    Buffers which can be written to are copies, which for ``"w"`` access are
+    written back to the file once done with.
+    """
+    _check_access(access)
+    contents = fs.get_contents(path=path, mode="b")
+    if access == "r":
+        yield memoryview(contents)
+        return
+
+    buffer = bytearray(contents)
+    yield memoryview(buffer)
+    if access == "w":
+        fs.set_contents(path=path, contents=bytes(buffer), mode="b")
+
+
+def _exists(fs, path):
+    """
+    Check that the given path exists on the filesystem.
+
+    Note that unlike `os.path.exists`, we *do* propagate file system errors
+    other than a non-existent path or non-existent directory component.
+
+    E.g., should EPERM or ELOOP be raised, an exception will bubble up.
+    """
+    try:
+        fs.stat(path)
+    except (exceptions.FileNotFound, exceptions.NotADirectory):
+        return False
+    return True
+
+
+def _is_dir(fs, path):
+    """
+    Check that the given path is a directory.
+
+    Note that unlike `os.path.isdir`, we *do* propagate file system errors
+    other than a non-existent path or non-existent directory component.
+
+    E.g., should EPERM or ELOOP be raised, an exception will bubble up.
+    """
+
+    try:
+        return stat.S_ISDIR(fs.stat(path).st_mode)
+    except exceptions.FileNotFound:
+        return False
+
+
+def _is_file(fs, path):
+    """
+    Check that the given path is a file.
+
+    Note that unlike `os.path.isfile`, we *do* propagate file system errors
+    other than a non-existent path or non-existent directory component.
+
+    E.g., should EPERM or ELOOP be raised, an exception will bubble up.
+    """
+    try:
+        return stat.S_ISREG(fs.stat(path).st_mode)
+    except exceptions.FileNotFound:
+        return False
+
+
+def _is_link(fs, path):
+    """
+    Check that the given path is a symbolic link.
+
+    Note that unlike `os.path.islink`, we *do* propagate file system errors
+    other than a non-existent path or non-existent directory component.
+
+    E.g., should EPERM or ELOOP be raised, an exception will bubble up.
+    """
+
+    try:
+        return stat.S_ISLNK(fs.lstat(path).st_mode)
+    except exceptions.FileNotFound:
+        return False
 
 
 def create(
@@ -66,9 +559,42 @@ def create(
 
     realpath=_realpath,
     remove=_recursive_remove,
+    walk=_walk,
+    stat_many=_stat_many,
+    get_contents=_get_contents,
+    iter_chunks=_iter_chunks,
+    iter_lines=_iter_lines,
+    mmap=_mmap,
+
+    copy=_copy,
+    copytree=_copytree,
+    move=_move,
+
+    exists=_exists,
+    is_dir=_is_dir,
+    is_file=_is_file,
+    is_link=_is_link,
+
+    snapshot=None,
+    fork=None,
+
+    cache_realpaths=False,
 ):
     """
     Create a new kind of filesystem.
+
+    If ``cache_realpaths`` is true, each instance remembers the real paths of
+    resolved prefixes which exist, forgetting them whenever a link, file or
+    directory is removed or moved, or a link is created through it. Only use
+    it if nothing else can modify the underlying filesystem. Forgetting them
+    replaces the cache, so that lookups which were already under way when it
+    was forgotten don't repopulate it.
+
+    Filesystems which can cheaply copy themselves may also provide
+    ``snapshot`` and ``fork``, which are otherwise left out.
+
+    ``remove`` and ``copytree`` are also passed the ``parallelism`` they were
+    asked for (if any), which they are free to ignore.
     """
 
     def _create_directory(fs, path, with_parents=False):
@@ -87,37 +613,111 @@ def create(
         remove_empty_directory=remove_empty_directory,
         temporary_directory=temporary_directory,
 
-        get_contents=lambda fs, path, mode="": _get_contents(
+        get_contents=lambda fs, path, mode="": get_contents(
             fs=fs, path=path, mode=mode,
         ),
         set_contents=lambda fs, path, contents, mode="": _set_contents(
             fs=fs, path=path, contents=contents, mode=mode,
         ),
         create_with_contents=_create_with_contents,
+        iter_chunks=lambda fs, path, size=_CHUNK_SIZE: iter_chunks(
+            fs=fs, path=path, size=_chunk_size(size),
+        ),
+        iter_lines=lambda fs, path, mode="": iter_lines(
+            fs=fs, path=path, mode=mode,
+        ),
+        mmap=lambda fs, path, access="r": mmap(
+            fs=fs, path=path, access=access,
+        ),
 
-        remove=remove,
+        remove=lambda fs, path, parallelism=None: _with_parallelism(
+            remove, parallelism=parallelism, fs=fs, path=path,
+        ),
         removing=_removing,
 
+        copy=copy,
+        copytree=lambda fs, source, destination, parallelism=None: (
+            _with_parallelism(
+                copytree,
+                parallelism=parallelism,
+                fs=fs,
+                source=source,
+                destination=destination,
+            )
+        ),
+        move=move,
+
         stat=stat,
+        stat_many=lambda fs, paths, follow_links=True: stat_many(
+            fs=fs, paths=paths, follow_links=follow_links,
+        ),
 
         lstat=lstat,
         link=link,
         readlink=readlink,
         realpath=realpath,
 
-        exists=_exists,
-        is_dir=_is_dir,
-        is_file=_is_file,
-        is_link=_is_link,
+        exists=exists,
+        is_dir=is_dir,
+        is_file=is_file,
+        is_link=is_link,
 
         touch=_touch,
 
         children=_children,
         glob_children=_glob_children,
+        walk=lambda fs, path, topdown=True, follow_links=False: walk(
+            fs=fs, path=path, topdown=topdown, follow_links=follow_links,
+        ),
     )
+
+    if snapshot is not None:
+        methods.update(snapshot=snapshot)
+    if fork is not None:
+        methods.update(fork=fork)
+
+    if cache_realpaths:
+        methods.update(
+            _realpaths=attr.ib(factory=dict, init=False, repr=False, eq=False),
+
+            realpath=lambda fs, path, seen=pset(): realpath(
+                fs=fs, path=path, seen=seen, cache=fs._realpaths,
+            ),
+            link=_forgetting_realpaths(link),
+            copytree=_forgetting_realpaths(methods["copytree"]),
+            move=_forgetting_realpaths(move),
+            remove_file=_forgetting_realpaths(remove_file),
+            remove_empty_directory=_forgetting_realpaths(
+                remove_empty_directory,
+            ),
+        )
+
     return attr.s(hash=True)(type(name, (object,), methods))
 
 
+def _with_parallelism(fn, parallelism, **kwargs):
+    """
+    Call the given operation, passing along a ``parallelism`` only if one was
+    asked for, so that implementations which don't take one still work.
+    """
+    if parallelism is not None:
+        kwargs.update(parallelism=parallelism)
+    return fn(**kwargs)
+
+
+def _forgetting_realpaths(fn):
+    """
+    Forget any cached real paths once the given operation has been run.
+    """
+
+    def forgetting(fs, *args, **kwargs):
+        try:
+            return fn(fs, *args, **kwargs)
+        finally:
+            fs._realpaths = {}
+    return forgetting
+
+
 @contextmanager
 def _removing(fs, path):
     try:
@@ -126,11 +726,6 @@ def _removing(fs, path):
         fs.remove(path=path)
 
 
-def _get_contents(fs, path, mode):
-    with fs.open(path=path, mode="r" + mode) as file:
-        return file.read()
-
-
 def _set_contents(fs, path, contents, mode):
     with fs.open(path=path, mode="w" + mode) as file:
         file.write(contents)
@@ -162,69 +757,6 @@ def _open_and_read(fs, path):
         return file.read()
 
 
-def _exists(fs, path):
-    """
-    Check that the given path exists on the filesystem.
-
-    Note that unlike `os.path.exists`, we *do* propagate file system errors
-    other than a non-existent path or non-existent directory component.
-
-    E.g., should EPERM or ELOOP be raised, an exception will bubble up.
-    """
-    try:
-        fs.stat(path)
-    except (exceptions.FileNotFound, exceptions.NotADirectory):
-        return False
-    return True
-
-
-def _is_dir(fs, path):
-    """
-    Check that the given path is a directory.
-
-    Note that unlike `os.path.isdir`, we *do* propagate file system errors
-    other than a non-existent path or non-existent directory component.
-
-    E.g., should EPERM or ELOOP be raised, an exception will bubble up.
-    """
-
-    try:
-        return stat.S_ISDIR(fs.stat(path).st_mode)
-    except exceptions.FileNotFound:
-        return False
-
-
-def _is_file(fs, path):
-    """
-    Check that the given path is a file.
-
-    Note that unlike `os.path.isfile`, we *do* propagate file system errors
-    other than a non-existent path or non-existent directory component.
-
-    E.g., should EPERM or ELOOP be raised, an exception will bubble up.
-    """
-    try:
-        return stat.S_ISREG(fs.stat(path).st_mode)
-    except exceptions.FileNotFound:
-        return False
-
-
-def _is_link(fs, path):
-    """
-    Check that the given path is a symbolic link.
-
-    Note that unlike `os.path.islink`, we *do* propagate file system errors
-    other than a non-existent path or non-existent directory component.
-
-    E.g., should EPERM or ELOOP be raised, an exception will bubble up.
-    """
-
-    try:
-        return stat.S_ISLNK(fs.lstat(path).st_mode)
-    except exceptions.FileNotFound:
-        return False
-
-
 @attr.s(frozen=True)
 class _FileMode(object):
     activity = attr.ib(default="r")
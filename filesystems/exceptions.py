@@ -68,6 +68,24 @@ class SymbolicLoop(_FileSystemError):
     message = os.strerror(errno)
 
 
+class DestinationWithinSource(_FileSystemError):
+    """
+    A directory can't be copied or moved into itself.
+    """
+
+    errno = errno.EINVAL
+    message = "Cannot copy or move a directory into itself"
+
+
+class SameFile(_FileSystemError):
+    """
+    A file can't be copied onto itself.
+    """
+
+    errno = errno.EINVAL
+    message = "Cannot copy a file onto itself"
+
+
 # On macOS, calling unlink on a directory raises EPERM.  I do not understand
 # why, and man 2 unlink doesn't exactly discuss it, but it seems to be the
 # case.
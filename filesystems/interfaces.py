@@ -40,6 +40,11 @@ class Path(Interface):
         The top-down set of this path's parents.
         """
 
+    def ancestors():
+        """
+        The bottom-up set of this path's parents.
+        """
+
     def descendant(*segments):
         """
         Traverse to a descendant of this path.
@@ -1,31 +1,583 @@
-from io import BytesIO, TextIOWrapper
+from contextlib import contextmanager
+from functools import wraps
+from io import SEEK_CUR, SEEK_END, SEEK_SET
+from io import BufferedIOBase, TextIOWrapper
+from threading import Lock, local
 from uuid import uuid4
+from weakref import WeakValueDictionary
+import itertools
+import locale
 import os
 import stat
+import tarfile
+import time
 
-from pyrsistent import pmap, pset
+from pyrsistent import pmap, pset, pvector
 import attr
 
-from filesystems import Path, common, exceptions
+from filesystems import Path, common, exceptions, native
+from filesystems._path import RelativePath
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
-class _BytesIOIsTerrible(BytesIO):
-    def __repr__(self):
-        return "<BytesIOIsTerrible contents={!r}>".format(self.bytes)
 
-    def close(self):
-        self._hereismyvalue = self.getvalue()
-        super(_BytesIOIsTerrible, self).close()
+_TEXT = type(u"")
+_inodes = itertools.count(1)
+_generations = itertools.count(1)
+_threads = itertools.count()
+_clock = getattr(time, "time_ns", lambda: int(time.time() * 10 ** 9))
+
+
+def _now():
+    """
+    The current time, in nanoseconds, as told by whatever ``_clock`` is now.
+    """
+    return _clock()
+
+
+#: How many locks mutations of a thread safe filesystem are spread across.
+_STRIPES = 16
+
+
+class _NoLock(object):
+    """
+    A lock for filesystems used from a single thread.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def acquire(self):
+        return True
+
+    def release(self):
+        pass
+
+    def locked(self):
+        return False
+
+
+_NO_LOCK = _NoLock()
+
+
+def _lock_like(lock):
+    """
+    A new lock for a directory, of the same kind as the given one.
+    """
+    return _NO_LOCK if lock is _NO_LOCK else Lock()
+
+
+class _Conflict(Exception):
+    """
+    A directory changed between looking it up and modifying it.
+    """
+
+
+def _stat_result(mode, inode, nlink, size, accessed, modified, changed):
+    """
+    Create a stat result from nanosecond timestamps.
+    """
+    return os.stat_result(
+        (
+            mode, inode, 0, nlink, 0, 0, size,
+            accessed // 10 ** 9, modified // 10 ** 9, changed // 10 ** 9,
+            accessed / 10 ** 9, modified / 10 ** 9, changed / 10 ** 9,
+            accessed, modified, changed,
+        ),
+    )
+
+
+@attr.s(eq=False)
+class _Chunks(object):
+    """
+    Immutable file contents, kept as a persistent list of bytestrings.
+
+    Appending shares every existing chunk with the original, so it costs only
+    the appended bytes, and copies of a file share all of their chunks.
+    """
+
+    _chunks = attr.ib(default=pvector(), repr=False)
+    size = attr.ib(default=0)
+
+    def append(self, data):
+        return _Chunks(
+            chunks=self._chunks.append(data),
+            size=self.size + len(data),
+        )
 
     @property
     def bytes(self):
+        if not self._chunks:
+            return b""
+        elif len(self._chunks) > 1:
+            # Join once, and keep the joined result rather than the pieces.
+            self._chunks = pvector([b"".join(self._chunks)])
+        return self._chunks[0]
+
+
+class _Writer(BufferedIOBase):
+    """
+    A writable file which appends chunks to its contents when it can.
+
+    Writes anywhere other than the end (after a seek or truncate) fall back to
+    editing a single mutable buffer.
+    """
+
+    def __init__(self, contents, append, on_write, on_close):
+        super(_Writer, self).__init__()
+        self._contents = contents
+        self._append = append
+        self._on_write = on_write
+        self._on_close = on_close
+        self._buffer = None
+        self._position = contents.size
+
+    def __repr__(self):
+        return "<Writer contents={!r}>".format(self.contents.bytes)
+
+    @property
+    def contents(self):
+        """
+        The current contents written to this file.
+        """
+        if self._buffer is not None:
+            self._contents = _Chunks().append(bytes(self._buffer))
+            self._buffer = None
+        return self._contents
+
+    def _check_open(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    @property
+    def size(self):
+        if self._buffer is None:
+            return self._contents.size
+        return len(self._buffer)
+
+    def close(self):
+        if not self.closed:
+            super(_Writer, self).close()
+            self._on_close(self)
+
+    def writable(self):
+        self._check_open()
+        return True
+
+    def seekable(self):
+        self._check_open()
+        return True
+
+    def write(self, data):
+        self._check_open()
+        if not isinstance(data, bytes):
+            # Anything else must be bytes-like, as for any binary file.
+            data = memoryview(data).tobytes()
+        if self._append:
+            self._position = self.size
+
+        if self._buffer is None and self._position == self._contents.size:
+            self._contents = self._contents.append(data)
+        else:
+            if self._buffer is None:
+                self._buffer = bytearray(self._contents.bytes)
+            padding = self._position - len(self._buffer)
+            if padding > 0:
+                self._buffer.extend(b"\0" * padding)
+            self._buffer[self._position:self._position + len(data)] = data
+        self._position += len(data)
+        self._on_write()
+        return len(data)
+
+    def truncate(self, size=None):
+        self._check_open()
+        if size is None:
+            size = self._position
+        if self._buffer is None:
+            self._buffer = bytearray(self._contents.bytes)
+        if size > len(self._buffer):
+            self._buffer.extend(b"\0" * (size - len(self._buffer)))
+        else:
+            del self._buffer[size:]
+        self._on_write()
+        return size
+
+    def seek(self, offset, whence=SEEK_SET):
+        self._check_open()
+        if whence == SEEK_SET:
+            position = offset
+        elif whence == SEEK_CUR:
+            position = self._position + offset
+        elif whence == SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError("Invalid whence ({!r})".format(whence))
+
+        if position < 0:
+            raise ValueError("Negative seek position {!r}".format(position))
+        self._position = position
+        return position
+
+    def tell(self):
+        self._check_open()
+        return self._position
+
+
+class _BytesReader(BufferedIOBase):
+    """
+    A read-only file over an immutable bytestring.
+
+    Readers share the bytestring they are given rather than copying it, and
+    reading all of it at once returns that same bytestring.
+    """
+
+    def __init__(self, contents):
+        super(_BytesReader, self).__init__()
+        self._contents = contents
+        self._view = memoryview(contents)
+        self._position = 0
+
+    def __repr__(self):
+        return "<BytesReader contents={!r}>".format(self._contents)
+
+    def _check_open(self):
         if self.closed:
-            return self._hereismyvalue
-        return self.getvalue()
+            raise ValueError("I/O operation on closed file.")
+
+    def readable(self):
+        self._check_open()
+        return True
+
+    def seekable(self):
+        self._check_open()
+        return True
+
+    def getbuffer(self):
+        """
+        A read-only view of the entire contents, without copying them.
+        """
+        self._check_open()
+        return self._view
+
+    def read(self, size=-1):
+        self._check_open()
+        start, length = self._position, len(self._contents)
+        if size is None or size < 0:
+            end = length
+        else:
+            end = min(start + size, length)
+        self._position = max(start, end)
+
+        if start == 0 and end == length:
+            return self._contents
+        return self._view[start:end].tobytes()
+
+    read1 = read
+
+    def readinto(self, buffer):
+        self._check_open()
+        chunk = self._view[self._position:self._position + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    readinto1 = readinto
+
+    def readline(self, size=-1):
+        self._check_open()
+        newline = self._contents.find(b"\n", self._position)
+        end = len(self._contents) if newline == -1 else newline + 1
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+        return self.read(end - self._position)
+
+    def seek(self, offset, whence=SEEK_SET):
+        self._check_open()
+        if whence == SEEK_SET:
+            position = offset
+        elif whence == SEEK_CUR:
+            position = self._position + offset
+        elif whence == SEEK_END:
+            position = len(self._contents) + offset
+        else:
+            raise ValueError("Invalid whence ({!r})".format(whence))
+
+        if position < 0:
+            raise ValueError("Negative seek position {!r}".format(position))
+        self._position = position
+        return position
 
+    def tell(self):
+        self._check_open()
+        return self._position
 
-def FS():
-    return _State().FS(name="MemoryFS")
+
+def FS(index=False, thread_safe=False):
+    """
+    Create a new, empty memory filesystem.
+
+    If ``index`` is true, the node found at each path (not passing through
+    any links) is remembered, so that looking it up again takes constant time
+    rather than time proportional to its depth.
+
+    If ``thread_safe`` is true, each directory gets its own lock, held only
+    while its children are being changed, so that the filesystem may be
+    modified from many threads at once. Nothing is ever locked while reading,
+    since directories' children are immutable maps which are only ever
+    replaced. Beyond that, each thread's mutations hold one of a few locks
+    (which only threads sharing it wait on) so that taking a snapshot, which
+    holds them all, can wait for them. Open files themselves are no more
+    thread safe than any other file object, and files should not be written
+    to while a snapshot is being taken.
+    """
+    state = _State(index={} if index else None, thread_safe=thread_safe)
+    return state.FS(name="MemoryFS")
+
+
+def from_mapping(mapping):
+    """
+    Create a memory filesystem containing the tree described by a mapping.
+
+    Directories are mappings from names to their children, files are their
+    contents (as bytes, or as text which is encoded just as writing it in
+    text mode would), and links are the `Path` they point to.
+
+    The nodes are built directly rather than created one path at a time.
+    """
+    state = _State()
+    _populate(directory=state._root, mapping=mapping)
+    return state.FS(name="MemoryFS")
+
+
+def from_tar(file):
+    """
+    Create a memory filesystem containing the contents of a tarball.
+
+    Hard links become copies of the files they link to, and any special
+    files (devices, FIFOs) are skipped. Members whose names contain ``..``
+    are rejected, as are members beneath another which isn't a directory.
+    """
+
+    tree = {}
+    with tarfile.open(fileobj=file, mode="r:*") as tar:
+        for member in tar:
+            segments = [
+                segment for segment in member.name.split("/")
+                if segment and segment != "."
+            ]
+            if not segments:
+                continue
+            if ".." in segments:
+                raise exceptions.InvalidPath(member.name)
+            parent = _tar_directory(tree=tree, segments=segments[:-1])
+
+            name = segments[-1]
+            if member.isdir():
+                parent.setdefault(name, {})
+            elif member.issym():
+                parent[name] = Path.from_string(member.linkname)
+            elif member.isfile() or member.islnk():
+                parent[name] = tar.extractfile(member).read()
+    return from_mapping(tree)
+
+
+def from_native(path):
+    """
+    Create a memory filesystem containing a copy of a native directory.
+
+    Absolute links pointing within the directory are rebased to point at
+    the corresponding path in the new filesystem.
+    """
+    return from_mapping(_tree(fs=native.FS(), path=path))
+
+
+def dump_to_native(fs, path):
+    """
+    Write out the tree of a memory filesystem into a native directory.
+
+    The directory is created if it does not exist. Absolute links are
+    rebased to point within it.
+    """
+
+    destination = native.FS()
+    if not destination.exists(path=path):
+        destination.create_directory(path=path, with_parents=True)
+
+    for directory, dirnames, filenames in fs.walk(path=Path.root()):
+        target = path.descendant(*directory.segments)
+        children = [directory / name for name in dirnames + filenames]
+        for child, child_stat in fs.stat_many(
+            paths=children,
+            follow_links=False,
+        ).items():
+            if isinstance(child_stat, Exception):
+                # Removed since its directory was listed, so there's nothing
+                # left to write out for it.
+                continue
+
+            to = target / child.basename()
+            if stat.S_ISLNK(child_stat.st_mode):
+                source = fs.readlink(path=child)
+                if isinstance(source, Path):
+                    source = path.descendant(*source.segments)
+                destination.link(source=source, to=to)
+            elif stat.S_ISDIR(child_stat.st_mode):
+                destination.create_directory(path=to)
+            else:
+                contents = fs.get_contents(path=child, mode="b")
+                with destination.open(path=to, mode="wb") as file:
+                    file.write(contents)
+
+
+def _tar_directory(tree, segments):
+    """
+    Find (creating if needed) the directory with the given segments in a tree.
+    """
+
+    directory = tree
+    for depth, segment in enumerate(segments, 1):
+        directory = directory.setdefault(segment, {})
+        if not isinstance(directory, dict):
+            raise exceptions.NotADirectory(Path(*segments[:depth]))
+    return directory
+
+
+def _tree(fs, path):
+    """
+    A mapping (suitable for `from_mapping`) of the tree at the given path.
+
+    Children are classified by the file types their directory's listing
+    reports, and any removed while the tree is being read are left out.
+    """
+
+    root, tree = path.segments, {}
+    pending = [(path, None)]
+    while pending:
+        directory, parent = pending.pop()
+        try:
+            kinds = _kinds_of_children(fs=fs, path=directory)
+        except exceptions.FileNotFound:
+            if parent is None:
+                raise
+            continue
+
+        if parent is None:
+            entries = tree
+        else:
+            entries = parent[directory.basename()] = {}
+
+        for name, kind in kinds:
+            child = directory / name
+            if kind == stat.S_IFDIR:
+                pending.append((child, entries))
+                continue
+            try:
+                entries[name] = _leaf(fs=fs, path=child, kind=kind, root=root)
+            except exceptions.FileNotFound:
+                continue
+    return tree
+
+
+def _leaf(fs, path, kind, root):
+    """
+    The value (suitable for `from_mapping`) of a native link or regular file.
+    """
+    if kind == stat.S_IFLNK:
+        return _rebased(fs.readlink(path=path), root)
+    return fs.get_contents(path=path, mode="b")
+
+
+def _kinds_of_children(fs, path):
+    """
+    The names of a native directory's links, directories and regular files,
+    along with which (as an ``S_IFMT`` file type) each one is.
+    """
+
+    kinds = []
+    if not hasattr(os, "scandir"):
+        for name in fs.list_directory(path=path):
+            try:
+                kind = stat.S_IFMT(fs.lstat(path=path / name).st_mode)
+            except exceptions.FileNotFound:
+                continue
+            if kind in (stat.S_IFLNK, stat.S_IFDIR, stat.S_IFREG):
+                kinds.append((name, kind))
+        return kinds
+
+    for entry in native._scandir(path=path):
+        if entry.is_symlink():
+            kinds.append((entry.name, stat.S_IFLNK))
+        elif entry.is_dir(follow_symlinks=False):
+            kinds.append((entry.name, stat.S_IFDIR))
+        elif entry.is_file(follow_symlinks=False):
+            kinds.append((entry.name, stat.S_IFREG))
+    return kinds
+
+
+def _rebased(source, root):
+    """
+    Rebase a link's source onto the root of a new tree if it lies within it.
+    """
+    if isinstance(source, Path) and source.segments[:len(root)] == root:
+        return Path(*source.segments[len(root):])
+    return source
+
+
+def _populate(directory, mapping):
+    """
+    Fill in the children of a new directory from a mapping describing them.
+    """
+
+    pending = [(directory, mapping)]
+    while pending:
+        directory, mapping = pending.pop()
+        children = {}
+        for name, value in mapping.items():
+            child = children[name] = _node(
+                name=name,
+                parent=directory,
+                value=value,
+            )
+            if isinstance(child, _Directory):
+                directory._subdirectories += 1
+                pending.append((child, value))
+        directory._children = pmap(children)
+
+
+def _node(name, parent, value):
+    """
+    Create a (childless) node from its value in a mapping passed to
+    `from_mapping`.
+    """
+
+    owner = parent._owner
+    if isinstance(value, (Path, RelativePath)):
+        return _Link(name=name, parent=parent, owner=owner, source=value)
+    elif isinstance(value, Mapping):
+        return _Directory(
+            name=name,
+            parent=parent,
+            owner=owner,
+            lock=_lock_like(parent._lock),
+        )
+    elif isinstance(value, _TEXT):
+        value = value.encode(locale.getpreferredencoding(False))
+    elif not isinstance(value, bytes):
+        raise TypeError(
+            "{!r} is not a directory, file or link: {!r}".format(name, value),
+        )
+    return _File(
+        name=name,
+        parent=parent,
+        owner=owner,
+        contents=_Chunks().append(value),
+    )
 
 
 def _fs(fn):
@@ -35,6 +587,51 @@ def _fs(fn):
     return lambda fs, *args, **kwargs: fn(*args, **kwargs)
 
 
+def _is_directory(node, path, state):
+    """
+    Whether the given node is a directory, following it if it is a link.
+    """
+    if isinstance(node, _Link):
+        try:
+            node = state._target(link=node, path=path)
+        except (
+            exceptions.FileNotFound,
+            exceptions.NotADirectory,
+            exceptions.SymbolicLoop,
+        ):
+            return False
+    return isinstance(node, _Directory)
+
+
+def _is_attached(node):
+    """
+    Whether the given node is still a child of its parent.
+    """
+    return node._parent._children.get(node._name) is node
+
+
+@attr.s(frozen=True)
+class _Snapshot(object):
+    """
+    An immutable picture of a memory filesystem.
+
+    Forking it is O(1): each fork shares every node with the snapshot, only
+    copying those along the paths it goes on to modify.
+    """
+
+    _root = attr.ib(repr=False)
+    _index = attr.ib(default=False, repr=False)
+    _thread_safe = attr.ib(default=False, repr=False)
+
+    def fork(self):
+        state = _State(
+            root=self._root,
+            index={} if self._index else None,
+            thread_safe=self._thread_safe,
+        )
+        return state.FS(name="MemoryFS")
+
+
 @attr.s(hash=True)
 class _File(object):
     """
@@ -43,10 +640,29 @@ class _File(object):
 
     _name = attr.ib()
     _parent = attr.ib(repr=False)
-    _contents = attr.ib(factory=_BytesIOIsTerrible)
+    _owner = attr.ib(default=None, repr=False, eq=False)
+    _contents = attr.ib(factory=_Chunks, repr=False)
+    _writer = attr.ib(default=None, repr=False, eq=False)
+    _inode = attr.ib(factory=lambda: next(_inodes), repr=False, eq=False)
+    _accessed = attr.ib(factory=_now, repr=False, eq=False)
+    _modified = attr.ib(factory=_now, repr=False, eq=False)
+    _changed = attr.ib(factory=_now, repr=False, eq=False)
 
     def __getitem__(self, name):
-        return _FileChild(parent=self._parent)
+        return _FILE_CHILD
+
+    get = __getitem__
+
+    def copy(self, parent, owner):
+        """
+        Copy this file into another tree, taking along any open writer.
+        """
+        copy = attr.evolve(self, parent=parent, owner=owner)
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            self._contents = writer.contents
+            writer._on_write, writer._on_close = copy._written, copy._closed
+        return copy
 
     def create_directory(self, path, with_parents):
         raise exceptions.FileExists(path)
@@ -54,38 +670,76 @@ class _File(object):
     def list_directory(self, path):
         raise exceptions.NotADirectory(path)
 
+    def walk(self, path, topdown, follow_links, state):
+        raise exceptions.NotADirectory(path)
+
     def remove_empty_directory(self, path):
         raise exceptions.NotADirectory(path)
 
     def create_file(self, path):
         raise exceptions.FileExists(path)
 
+    def _current(self):
+        """
+        The contents of this file, including those of any open writer.
+        """
+        if self._writer is None:
+            return self._contents
+        return self._writer.contents
+
+    def _written(self):
+        self._modified = self._changed = _now()
+
+    def _closed(self, writer):
+        if self._writer is writer:
+            self._contents, self._writer = writer.contents, None
+
+    def contents(self, path):
+        return self._current().bytes
+
     def open_file(self, path, mode):
         if mode.read:
-            file = _BytesIOIsTerrible(self._contents.bytes)
-        elif mode.write:
-            self._contents = _BytesIOIsTerrible()
-            file = self._contents
+            file = _BytesReader(self._current().bytes)
         else:
-            original, self._contents = self._contents, _BytesIOIsTerrible()
-            self._contents.write(original.bytes)
-            file = self._contents
+            if mode.write:
+                contents = _Chunks()
+                self._written()
+            else:
+                contents = self._current()
+            file = self._writer = _Writer(
+                contents=contents,
+                append=mode.append,
+                on_write=self._written,
+                on_close=self._closed,
+            )
 
         if mode.text:
             return TextIOWrapper(file)
         return file
 
     def remove_file(self, path):
-        del self._parent[self._name]
+        self._parent.remove(name=self._name, node=self)
 
-    def link(self, source, to, fs, state):
+    def link(self, source, to):
         raise exceptions.FileExists(to)
 
+    def adopt(self, node, path):
+        raise exceptions.FileExists(path)
+
     def readlink(self, path):
         raise exceptions.NotASymlink(path)
 
     def stat(self, path):
-        return os.stat_result((stat.S_IFREG,) + (0,) * 9)
+        writer = self._writer
+        return _stat_result(
+            mode=stat.S_IFREG,
+            inode=self._inode,
+            nlink=1,
+            size=self._contents.size if writer is None else writer.size,
+            accessed=self._accessed,
+            modified=self._modified,
+            changed=self._changed,
+        )
 
     lstat = stat
 
@@ -96,32 +750,41 @@ class _FileChild(object):
     The attempted "child" of a file, which well, shouldn't have children.
     """
 
-    _parent = attr.ib()
-
     def __getitem__(self, name):
         return self
 
+    get = __getitem__
+
     def create_directory(self, path, with_parents):
         raise exceptions.NotADirectory(path.parent())
 
     def list_directory(self, path):
         raise exceptions.NotADirectory(path)
 
+    def walk(self, path, topdown, follow_links, state):
+        raise exceptions.NotADirectory(path)
+
     def remove_empty_directory(self, path):
         raise exceptions.NotADirectory(path)
 
     def create_file(self, path):
         raise exceptions.NotADirectory(path)
 
+    def contents(self, path):
+        raise exceptions.NotADirectory(path)
+
     def open_file(self, path, mode):
         raise exceptions.NotADirectory(path)
 
     def remove_file(self, path):
         raise exceptions.NotADirectory(path)
 
-    def link(self, source, to, fs, state):
+    def link(self, source, to):
         raise exceptions.NotADirectory(to.parent())
 
+    def adopt(self, node, path):
+        raise exceptions.NotADirectory(path.parent())
+
     def readlink(self, path):
         raise exceptions.NotADirectory(path)
 
@@ -139,25 +802,84 @@ class _Directory(object):
 
     _name = attr.ib()
     _parent = attr.ib(repr=False)
+    _owner = attr.ib(default=None, repr=False, eq=False)
     _children = attr.ib(default=pmap())
+    _subdirectories = attr.ib(default=0, repr=False, eq=False)
+    _lock = attr.ib(default=_NO_LOCK, repr=False, eq=False)
+    _removed = attr.ib(default=False, repr=False, eq=False)
+    _inode = attr.ib(factory=lambda: next(_inodes), repr=False, eq=False)
+    _accessed = attr.ib(factory=_now, repr=False, eq=False)
+    _modified = attr.ib(factory=_now, repr=False, eq=False)
+    _changed = attr.ib(factory=_now, repr=False, eq=False)
 
     @classmethod
-    def root(cls):
-        root = cls(name="", parent=None)
+    def root(cls, owner=None, lock=_NO_LOCK):
+        root = cls(name="", parent=None, owner=owner, lock=lock)
         root._parent = root
         return root
 
     def __getitem__(self, name):
-        return self._children.get(
-            name,
-            _DirectoryChild(name=name, parent=self),
-        )
+        child = self._children.get(name)
+        if child is None:
+            return _DirectoryChild(name=name, parent=self)
+        return child
 
-    def __setitem__(self, name, node):
-        self._children = self._children.set(name, node)
+    def get(self, name):
+        """
+        Retrieve a child, without creating anything if it doesn't exist.
+        """
+        return self._children.get(name, _MISSING)
 
-    def __delitem__(self, name):
-        self._children = self._children.remove(name)
+    def add(self, name, node):
+        """
+        Add a new child, unless something else got there first.
+        """
+        with self._lock:
+            if self._removed or name in self._children:
+                raise _Conflict()
+            self._children = self._children.set(name, node)
+            self._subdirectories += isinstance(node, _Directory)
+            self._modified = self._changed = _now()
+
+    def remove(self, name, node):
+        """
+        Remove a child, unless it has already been removed or replaced.
+        """
+        with self._lock:
+            if self._children.get(name) is not node:
+                raise _Conflict()
+            self._children = self._children.remove(name)
+            self._subdirectories -= isinstance(node, _Directory)
+            self._modified = self._changed = _now()
+
+    def copy(self, parent, owner):
+        """
+        Copy this directory into another tree, sharing all of its children.
+        """
+        copy = attr.evolve(
+            self,
+            parent=parent,
+            owner=owner,
+            lock=_lock_like(self._lock),
+        )
+        if parent is None:
+            copy._parent = copy
+        return copy
+
+    def owned(self, name, owner):
+        """
+        Retrieve a child, first copying it if it is shared with another tree.
+        """
+        child = self._children.get(name)
+        if child is not None and child._owner is not owner:
+            with self._lock:
+                child = self._children.get(name)
+                if child is not None and child._owner is not owner:
+                    child = child.copy(parent=self, owner=owner)
+                    self._children = self._children.set(name, child)
+        if child is None:
+            return _DirectoryChild(name=name, parent=self)
+        return child
 
     def create_directory(self, path, with_parents):
         raise exceptions.FileExists(path)
@@ -165,28 +887,74 @@ class _Directory(object):
     def list_directory(self, path):
         return pset(self._children)
 
+    def walk(self, path, topdown, follow_links, state):
+        dirnames, filenames = [], []
+        for name, child in self._children.items():
+            if _is_directory(node=child, path=path / name, state=state):
+                dirnames.append(name)
+            else:
+                filenames.append(name)
+
+        if topdown:
+            yield path, dirnames, filenames
+
+        for name in dirnames:
+            child = self.get(name)
+            if isinstance(child, _Link):
+                if not follow_links:
+                    continue
+                child = state._target(link=child, path=path / name)
+            for each in child.walk(
+                path=path / name,
+                topdown=topdown,
+                follow_links=follow_links,
+                state=state,
+            ):
+                yield each
+
+        if not topdown:
+            yield path, dirnames, filenames
+
     def remove_empty_directory(self, path):
-        if self._children:
-            raise exceptions.DirectoryNotEmpty(path)
-        del self._parent[self._name]
+        if self._parent is self:
+            raise exceptions.PermissionError(path)
+        with self._lock:
+            if self._children:
+                raise exceptions.DirectoryNotEmpty(path)
+            self._parent.remove(name=self._name, node=self)
+            self._removed = True
 
     def create_file(self, path):
         raise exceptions.FileExists(path)
 
+    def contents(self, path):
+        raise exceptions.IsADirectory(path)
+
     def open_file(self, path, mode):
         raise exceptions.IsADirectory(path)
 
     def remove_file(self, path):
         raise exceptions._UnlinkNonFileError(path)
 
-    def link(self, source, to, fs, state):
+    def link(self, source, to):
         raise exceptions.FileExists(to)
 
+    def adopt(self, node, path):
+        raise exceptions.FileExists(path)
+
     def readlink(self, path):
         raise exceptions.NotASymlink(path)
 
     def stat(self, path):
-        return os.stat_result((stat.S_IFDIR,) + (0,) * 9)
+        return _stat_result(
+            mode=stat.S_IFDIR,
+            inode=self._inode,
+            nlink=2 + self._subdirectories,
+            size=0,
+            accessed=self._accessed,
+            modified=self._modified,
+            changed=self._changed,
+        )
 
     lstat = stat
 
@@ -209,44 +977,63 @@ class _DirectoryChild(object):
         directory = _Directory(
             name=self._name,
             parent=self._parent,
+            owner=self._parent._owner,
+            lock=_lock_like(self._parent._lock),
         )
-        self._parent[self._name] = directory
+        self._parent.add(name=self._name, node=directory)
         return directory
 
     def list_directory(self, path):
         raise exceptions.FileNotFound(path)
 
+    def walk(self, path, topdown, follow_links, state):
+        raise exceptions.FileNotFound(path)
+
     def remove_empty_directory(self, path):
         raise exceptions.FileNotFound(path)
 
     def create_file(self, path):
-        file = self._parent[self._name] = _File(
-            name=self._name,
-            parent=self._parent,
+        return self.open_file(
+            path=path,
+            mode=common._FileMode(activity="w"),
         )
-        return file.open_file(path=path, mode=common._FileMode(activity="w"))
+
+    def contents(self, path):
+        raise exceptions.FileNotFound(path)
 
     def open_file(self, path, mode):
         if mode.read:
             raise exceptions.FileNotFound(path)
         else:
-            file = self._parent[self._name] = _File(
+            file = _File(
                 name=self._name,
                 parent=self._parent,
+                owner=self._parent._owner,
             )
+            self._parent.add(name=self._name, node=file)
             return file.open_file(path=path, mode=mode)
 
     def remove_file(self, path):
         raise exceptions.FileNotFound(path)
 
-    def link(self, source, to, fs, state):
-        self._parent[self._name] = _Link(
+    def link(self, source, to):
+        self._parent.add(
             name=self._name,
-            parent=self._parent,
-            source=source,
-            entry_at=lambda path=source: state[fs.realpath(path=path)],
+            node=_Link(
+                name=self._name,
+                parent=self._parent,
+                owner=self._parent._owner,
+                source=source,
+            ),
         )
 
+    def adopt(self, node, path):
+        """
+        Put an existing node (no longer in any directory) here.
+        """
+        node._name, node._parent = self._name, self._parent
+        self._parent.add(name=self._name, node=node)
+
     def readlink(self, path):
         raise exceptions.FileNotFound(path)
 
@@ -258,44 +1045,54 @@ class _DirectoryChild(object):
 
 @attr.s(hash=True)
 class _Link(object):
+    """
+    A symbolic link.
+
+    Operations which follow links are resolved by the state rather than by
+    the link itself, since the same link may be shared by many trees.
+    """
 
     _name = attr.ib()
     _parent = attr.ib(repr=False)
     _source = attr.ib()
-    _entry_at = attr.ib(repr=False)
+    _owner = attr.ib(default=None, repr=False, eq=False)
+    _inode = attr.ib(factory=lambda: next(_inodes), repr=False, eq=False)
+    _created = attr.ib(factory=_now, repr=False, eq=False)
 
-    def __getitem__(self, name):
-        return self._entry_at()[name]
+    def copy(self, parent, owner):
+        return attr.evolve(self, parent=parent, owner=owner)
 
     def create_directory(self, path, with_parents):
         raise exceptions.FileExists(path)
 
-    def list_directory(self, path):
-        return self._entry_at(path=path).list_directory(path=path)
-
     def remove_empty_directory(self, path):
         raise exceptions.NotADirectory(path)
 
     def create_file(self, path):
         raise exceptions.FileExists(path)
 
-    def open_file(self, path, mode):
-        return self._entry_at(path=path).open_file(path=path, mode=mode)
-
     def remove_file(self, path):
-        del self._parent[self._name]
+        self._parent.remove(name=self._name, node=self)
 
-    def link(self, source, to, fs, state):
+    def link(self, source, to):
         raise exceptions.FileExists(to)
 
+    def adopt(self, node, path):
+        raise exceptions.FileExists(path)
+
     def readlink(self, path):
         return self._source
 
-    def stat(self, path):
-        return self._entry_at(path=path).stat(path=path)
-
     def lstat(self, path):
-        return os.stat_result((stat.S_IFLNK,) + (0,) * 9)
+        return _stat_result(
+            mode=stat.S_IFLNK,
+            inode=self._inode,
+            nlink=1,
+            size=len(str(self._source)),
+            accessed=self._created,
+            modified=self._created,
+            changed=self._created,
+        )
 
 
 @attr.s(hash=True)
@@ -328,21 +1125,63 @@ class _NoSuchEntry(object):
     def list_directory(self, path):
         raise exceptions.FileNotFound(path)
 
+    def walk(self, path, topdown, follow_links, state):
+        raise exceptions.FileNotFound(path)
+
     def remove_empty_directory(self, path):
         raise exceptions.FileNotFound(path)
 
     def create_file(self, path):
         raise exceptions.FileNotFound(path)
 
+    def contents(self, path):
+        raise exceptions.FileNotFound(path)
+
     def open_file(self, path, mode):
         raise exceptions.FileNotFound(path)
 
     def remove_file(self, path):
         raise exceptions.FileNotFound(path)
 
-    def link(self, source, to, fs, state):
+    def link(self, source, to):
         raise exceptions.FileNotFound(to.parent())
 
+    def adopt(self, node, path):
+        raise exceptions.FileNotFound(path.parent())
+
+    def readlink(self, path):
+        raise exceptions.FileNotFound(path)
+
+    def stat(self, path):
+        raise exceptions.FileNotFound(path)
+
+    lstat = stat
+
+
+@attr.s(hash=True)
+class _Missing(object):
+    """
+    A non-existent node, as seen by operations which only look at it.
+
+    Unlike `_DirectoryChild` and `_NoSuchEntry` it cannot create itself, so
+    one instance serves for every lookup which misses.
+    """
+
+    def get(self, name):
+        return self
+
+    def list_directory(self, path):
+        raise exceptions.FileNotFound(path)
+
+    def walk(self, path, topdown, follow_links, state):
+        raise exceptions.FileNotFound(path)
+
+    def contents(self, path):
+        raise exceptions.FileNotFound(path)
+
+    def open_file(self, path, mode):
+        raise exceptions.FileNotFound(path)
+
     def readlink(self, path):
         raise exceptions.FileNotFound(path)
 
@@ -352,22 +1191,246 @@ class _NoSuchEntry(object):
     lstat = stat
 
 
+_FILE_CHILD = _FileChild()
+_MISSING = _Missing()
+_EXISTING = _File, _Directory, _Link
+
+
+def _mutating(fn):
+    """
+    Run an operation which may change the tree.
+
+    It is retried from scratch whenever it finds a directory was changed by
+    another thread, and the tree is noted to have changed once it finishes.
+    """
+
+    @wraps(fn)
+    def mutating(self, *args, **kwargs):
+        with self._mutation():
+            while True:
+                try:
+                    return fn(self, *args, **kwargs)
+                except _Conflict:
+                    pass
+    return mutating
+
+
 @attr.s(hash=True)
 class _State(object):
+    """
+    A tree of nodes, some of which may be shared with other trees.
 
-    _root = attr.ib(factory=_Directory.root)
+    Nodes belong to the tree whose ``owner`` they carry, and only those are
+    modified in place. Any others are first copied (along with their
+    ancestors) by `_State._claimed`, which is how snapshots and forks share
+    everything they have not since changed.
+    """
+
+    _root = attr.ib(default=None)
+    _owner = attr.ib(factory=object, eq=False, repr=False)
+    _thread_safe = attr.ib(default=False, eq=False, repr=False)
+
+    # Changed whenever the tree may have changed, so that resolved link
+    # targets are known to be stale. Each value is used only once, so that
+    # no two concurrent changes can leave it as it was.
+    _generation = attr.ib(
+        factory=lambda: next(_generations), eq=False, repr=False,
+    )
+    _targets = attr.ib(factory=lambda: (None, {}), eq=False, repr=False)
+
+    # Each mutation holds the stripe its thread was given while it runs, and
+    # snapshots hold every stripe, so that mutations only wait on snapshots
+    # (or on threads given the same stripe) rather than on each other.
+    _stripes = attr.ib(default=None, eq=False, repr=False)
+    _local = attr.ib(factory=local, eq=False, repr=False)
+
+    # Guards replacing a shared root.
+    _lock = attr.ib(factory=Lock, eq=False, repr=False)
+
+    # Files we've opened for writing, by id, in case they are still open when
+    # a snapshot is taken.
+    _writing = attr.ib(factory=WeakValueDictionary, eq=False, repr=False)
+
+    # Nodes by the segments of their real path, if we're keeping an index.
+    # Entries are checked to still be attached to their parent when used,
+    # so removals needn't touch it, but copies of nodes must replace them,
+    # and moving a node (which stays attached) discards it.
+    _index = attr.ib(default=None, eq=False, repr=False)
+
+    _fs = attr.ib(default=None, eq=False, repr=False)
+
+    def __attrs_post_init__(self):
+        if self._root is None:
+            self._root = _Directory.root(
+                owner=self._owner,
+                lock=Lock() if self._thread_safe else _NO_LOCK,
+            )
+        if self._stripes is None:
+            if self._thread_safe:
+                self._stripes = tuple(Lock() for _ in range(_STRIPES))
+            else:
+                self._stripes = (_NO_LOCK,)
+
+    def _stripe(self):
+        """
+        The stripe held by the current thread's mutations.
+        """
+        stripe = getattr(self._local, "stripe", None)
+        if stripe is None:
+            stripes = self._stripes
+            stripe = stripes[next(_threads) % len(stripes)]
+            self._local.stripe = stripe
+        return stripe
+
+    @contextmanager
+    def _mutation(self):
+        with self._stripe():
+            try:
+                yield
+            finally:
+                # Before releasing the stripe, so that `_remember` can't miss
+                # a mutation which overlapped its lookup.
+                self._generation = next(_generations)
+
+    @contextmanager
+    def _exclusively(self):
+        """
+        Wait for any mutations in progress to finish, holding off others.
+        """
+        for stripe in self._stripes:
+            stripe.acquire()
+        try:
+            yield
+        finally:
+            self._generation = next(_generations)
+            for stripe in reversed(self._stripes):
+                stripe.release()
 
     def __getitem__(self, path):
         """
-        Retrieve the Node at the given path.
+        Retrieve the Node at the given path in order to look at it.
+
+        Misses allocate nothing, since all of them share the same node.
+        """
+        segments, index = path.segments, self._index
+        if index is not None:
+            node = index.get(segments)
+            if node is not None and _is_attached(node):
+                return node
+            generation = self._generation
+
+        node = self._root
+        for depth, segment in enumerate(segments):
+            if isinstance(node, _Link):
+                # What follows is not at its real path, so don't index it.
+                index = None
+                node = self._target(link=node, path=Path(*segments[:depth]))
+            node = node.get(segment)
+
+        if index is not None and segments and isinstance(node, _EXISTING):
+            self._remember(
+                index=index,
+                segments=segments,
+                node=node,
+                generation=generation,
+            )
+        return node
+
+    def _remember(self, index, segments, node, generation):
+        """
+        Index a node, unless the tree may have changed while looking it up.
+
+        The stripes are checked first, since any mutation which finished
+        since then has already changed the generation. The index the lookup
+        started with is the one added to, so that it's discarded along with
+        it if a move discarded it since.
+        """
+        if any(stripe.locked() for stripe in self._stripes):
+            return
+        if self._generation == generation:
+            index[segments] = node
+
+    def _target(self, link, path):
+        """
+        The node the given link (found at the given path) points at.
+
+        Targets are only resolved again once the tree changes.
+        """
+        generation, targets = self._targets
+        if generation != self._generation:
+            targets = {}
+            self._targets = self._generation, targets
+
+        node = targets.get(path.segments)
+        if node is None:
+            source = link.readlink(path=path).relative_to(path.parent())
+            real = self._fs.realpath(path=source)
+            node = targets[path.segments] = self[real]
+        return node
+
+    def _follow(self, path):
+        """
+        Retrieve the Node at the given path, following it if it is a link.
+        """
+        node = self[path]
+        if isinstance(node, _Link):
+            node = self._target(link=node, path=path)
+        return node
+
+    def _claimed(self, path, follow=False):
+        """
+        Retrieve the Node at the given path in order to modify it.
+
+        Any existing nodes along the way which are shared with another tree
+        are first replaced by copies belonging to this one.
         """
+        owner = self._owner
+        if self._root._owner is not owner:
+            with self._lock:
+                if self._root._owner is not owner:
+                    self._root = self._root.copy(parent=None, owner=owner)
+
         node = self._root
-        for segment in path.segments:
-            node = node[segment]
+        segments = path.segments
+        real, offset = (), 0
+        for depth, segment in enumerate(segments):
+            if isinstance(node, _Link):
+                resolved = self._fs.realpath(path=Path(*segments[:depth]))
+                node = self._claimed(path=resolved)
+                real, offset = resolved.segments, depth
+            if isinstance(node, _Directory):
+                node = node.owned(name=segment, owner=owner)
+                if self._index:
+                    self._reindex(real + segments[offset:depth + 1], node)
+            else:
+                node = node[segment]
+
+        if follow and isinstance(node, _Link):
+            node = self._claimed(path=self._fs.realpath(path=path))
         return node
 
+    def _reindex(self, segments, node):
+        """
+        Point an existing index entry at the node now found at its path.
+        """
+        if segments in self._index:
+            self._index[segments] = node
+
+    def _path_of(self, node):
+        """
+        The path of the given node, or None if it is no longer in this tree.
+        """
+        segments = []
+        while node is not self._root:
+            parent = node._parent
+            if parent is node or parent._children.get(node._name) is not node:
+                return None
+            segments.append(node._name)
+            node = parent
+        return Path(*reversed(segments))
+
     def FS(self, name):
-        return common.create(
+        self._fs = common.create(
             name=name,
 
             create_file=_fs(self.create_file),
@@ -382,18 +1445,96 @@ class _State(object):
             stat=_fs(self.stat),
 
             lstat=_fs(self.lstat),
-            link=lambda fs, *args, **kwargs: self.link(*args, fs=fs, **kwargs),
+            link=_fs(self.link),
             readlink=_fs(self.readlink),
+
+            remove=_fs(self.remove),
+            walk=_fs(self.walk),
+            stat_many=_fs(self.stat_many),
+            get_contents=_fs(self.get_contents),
+            iter_chunks=_fs(self.iter_chunks),
+
+            copy=_fs(self.copy),
+            copytree=_fs(self.copytree),
+            move=_fs(self.move),
+
+            exists=_fs(self.exists),
+            is_dir=_fs(self.is_dir),
+            is_file=_fs(self.is_file),
+            is_link=_fs(self.is_link),
+
+            snapshot=_fs(self.snapshot),
+            fork=_fs(self.fork),
+
+            cache_realpaths=True,
         )()
+        return self._fs
+
+    def snapshot(self):
+        """
+        Take an immutable snapshot of this tree.
+
+        Afterwards, this tree copies any node before modifying it, so it is
+        O(1) apart from files which are still open for writing, whose
+        writers are moved to copies of them (and of their ancestors).
+        """
+        with self._exclusively():
+            snapshot = _Snapshot(
+                root=self._root,
+                index=self._index is not None,
+                thread_safe=self._thread_safe,
+            )
+            self._disown()
+        return snapshot
+
+    def _disown(self):
+        """
+        Treat every existing node as shared, copying it before modifying it.
 
+        Files still open for writing are copied straight away, so that their
+        writers only go on to change the copies.
+        """
+        self._owner = object()
+        for file in list(self._writing.values()):
+            if file._writer is not None:
+                path = self._path_of(file)
+                if path is not None:
+                    self._claimed(path=path)
+        self._writing.clear()
+
+    def fork(self):
+        return self.snapshot().fork()
+
+    @_mutating
     def create_directory(self, path, with_parents):
-        self[path].create_directory(path=path, with_parents=with_parents)
+        self._claimed(path).create_directory(
+            path=path,
+            with_parents=with_parents,
+        )
 
     def list_directory(self, path):
-        return self[path].list_directory(path=path)
+        return self._follow(path).list_directory(path=path)
 
+    @_mutating
     def remove_empty_directory(self, path):
-        return self[path].remove_empty_directory(path=path)
+        return self._claimed(path).remove_empty_directory(path=path)
+
+    def remove(self, path, parallelism=None):
+        """
+        Remove a tree, always serially, since nothing here waits on I/O.
+        """
+        common._recursive_remove(fs=self._fs, path=path)
+
+    def walk(self, path, topdown, follow_links):
+        # A generator itself, so that (as natively) nothing is looked up,
+        # and so nothing is raised, until it is first iterated over.
+        for each in self._follow(path).walk(
+            path=path,
+            topdown=topdown,
+            follow_links=follow_links,
+            state=self,
+        ):
+            yield each
 
     def temporary_directory(self):
         # TODO: Maybe this isn't good enough.
@@ -401,18 +1542,113 @@ class _State(object):
         self.create_directory(path=directory, with_parents=False)
         return directory
 
+    @_mutating
     def create_file(self, path):
-        return self[path].create_file(path=path)
+        file = self._claimed(path).create_file(path=path)
+        self._opened_for_writing(path=path)
+        return file
+
+    def get_contents(self, path, mode):
+        if common._parse_mode(mode="r" + mode).binary:
+            return self._follow(path).contents(path=path)
+        with self.open_file(path=path, mode="r" + mode) as file:
+            return file.read()
+
+    def iter_chunks(self, path, size):
+        """
+        Slice a file's contents, without copying them.
+
+        Unlike elsewhere, these chunks remain valid after the next is
+        produced.
+        """
+        contents = memoryview(self._follow(path).contents(path=path))
+        for start in range(0, len(contents), size):
+            yield contents[start:start + size]
 
     def open_file(self, path, mode):
         mode = common._parse_mode(mode=mode)
-        return self[path].open_file(path=path, mode=mode)
+        if mode.read:
+            return self._follow(path).open_file(path=path, mode=mode)
+        return self._open_file_for_writing(path=path, mode=mode)
+
+    @_mutating
+    def _open_file_for_writing(self, path, mode):
+        file = self._claimed(path, follow=True).open_file(path=path, mode=mode)
+        self._opened_for_writing(path=path)
+        return file
+
+    def _opened_for_writing(self, path):
+        node = self._claimed(path, follow=True)
+        self._writing[id(node)] = node
 
+    @_mutating
     def remove_file(self, path):
-        self[path].remove_file(path=path)
+        self._claimed(path).remove_file(path=path)
+
+    @_mutating
+    def copy(self, source, destination):
+        """
+        Copy a file, sharing its (immutable) contents with the copy.
+        """
+        contents = self._follow(source).contents(path=source)
+        common._check_not_same(
+            fs=self._fs, source=source, destination=destination,
+        )
+        node = self._claimed(destination, follow=True)
+        mode = common._parse_mode(mode="wb")
+        with node.open_file(path=destination, mode=mode) as file:
+            file.write(contents)
+
+    def copytree(self, source, destination, parallelism=None):
+        """
+        Copy a directory tree in O(1), sharing it with the copy as snapshots
+        do (so until they're modified, copies keep the inode numbers of what
+        they were copied from).
+        """
+        with self._exclusively():
+            node = self._follow(source)
+            if not isinstance(node, _Directory):
+                node.list_directory(path=source)
+            common._check_not_within(
+                fs=self._fs, source=source, destination=destination,
+            )
+            self._claimed(destination).adopt(
+                node=node.copy(parent=None, owner=self._owner),
+                path=destination,
+            )
+            self._disown()
 
-    def link(self, source, to, fs):
-        self[to].link(fs=fs, source=source, to=to, state=self)
+    @_mutating
+    def move(self, source, destination):
+        """
+        Move a node in O(1), by re-parenting it.
+        """
+        node = self._claimed(source)
+        if isinstance(node, _Directory):
+            common._check_not_within(
+                fs=self._fs, source=source, destination=destination,
+            )
+        elif not isinstance(node, _EXISTING):
+            # Raise whatever statting it would, e.g. for a non-directory
+            # parent, just as natively.
+            node.lstat(path=source)
+        slot = self._claimed(destination)
+
+        name, parent = node._name, node._parent
+        parent.remove(name=name, node=node)
+        try:
+            slot.adopt(node=node, path=destination)
+        except Exception:
+            node._name, node._parent = name, parent
+            parent.add(name=name, node=node)
+            raise
+
+        if self._index is not None:
+            self._index = {}
+
+    @_mutating
+    def link(self, source, to):
+        self._claimed(to).link(source=source, to=to)
 
     def readlink(self, path):
         return self[path].readlink(path=path)
@@ -421,4 +1657,85 @@ class _State(object):
         return self[path].lstat(path=path)
 
     def stat(self, path):
-        return self[path].stat(path=path)
+        return self._follow(path).stat(path=path)
+
+    def exists(self, path):
+        try:
+            node = self._follow(path)
+        except (exceptions.FileNotFound, exceptions.NotADirectory):
+            # A link resolving through a file is as missing as its target.
+            return False
+        return isinstance(node, _EXISTING)
+
+    def is_dir(self, path):
+        return isinstance(self._found(self._follow(path), path), _Directory)
+
+    def is_file(self, path):
+        return isinstance(self._found(self._follow(path), path), _File)
+
+    def is_link(self, path):
+        return isinstance(self._found(self[path], path), _Link)
+
+    def _found(self, node, path):
+        """
+        Raise the error statting the given node would for a non-directory
+        parent, which the predicates don't treat as merely missing.
+        """
+        if node is _FILE_CHILD:
+            raise exceptions.NotADirectory(path)
+        return node
+
+    def stat_many(self, paths, follow_links):
+        """
+        Stat many paths in one pass over the tree.
+
+        Paths are visited in sorted order so that the nodes along any prefix
+        shared with the previously visited path are looked up only once.
+        """
+
+        results = {}
+        nodes, previous = [self._root], ()
+        for path in sorted(set(paths), key=lambda path: path.segments):
+            segments = path.segments
+            try:
+                self._descend(nodes=nodes, previous=previous, to=segments)
+            except (
+                exceptions.FileNotFound,
+                exceptions.NotADirectory,
+                exceptions.SymbolicLoop,
+            ) as error:
+                # A link along the way can't be resolved. That's this path's
+                # result, and the next starts again from the root.
+                results[path] = error
+                nodes, previous = [self._root], ()
+                continue
+            previous = segments
+
+            node = nodes[-1]
+            if not follow_links:
+                stat_path = node.lstat
+            elif isinstance(node, _Link):
+                stat_path = self.stat
+            else:
+                stat_path = node.stat
+            results[path] = common._stat_or_error(stat_path, path=path)
+        return pmap(results)
+
+    def _descend(self, nodes, previous, to):
+        """
+        Extend the nodes along the previous path to be those along another.
+
+        Only those past the prefix the two paths share are looked up.
+        """
+        common_depth = 0
+        for left, right in zip(previous, to):
+            if left != right:
+                break
+            common_depth += 1
+
+        del nodes[common_depth + 1:]
+        for depth in range(common_depth, len(to)):
+            node = nodes[-1]
+            if isinstance(node, _Link):
+                node = self._target(link=node, path=Path(*to[:depth]))
+            nodes.append(node.get(to[depth]))
@@ -1,26 +1,137 @@
+from contextlib import contextmanager
+from functools import partial
+from threading import Lock
+import errno
 import io
+import mmap
 import os
+import stat
 import tempfile
 
+from pyrsistent import pmap
+
 from filesystems import Path, common, exceptions
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # pragma: no cover
+    ThreadPoolExecutor = None
+
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_CREATE_FLAGS = os.O_EXCL | os.O_CREAT | os.O_RDWR | _O_BINARY
+_COPY_FLAGS = os.O_CREAT | os.O_TRUNC | os.O_WRONLY | _O_BINARY
+
+#: The most threads used to stat paths concurrently in ``fs.stat_many``.
+_STAT_MANY_WORKERS = 16
+_STAT_MANY_POOL = None
+_STAT_MANY_POOL_LOCK = Lock()
+
+
+def _errors(errors, of_parent=()):
+    """
+    A table from errnos to the filesystem errors an operation raises for them.
+
+    Those in ``of_parent`` report the parent of the path operated on, rather
+    than the path itself.
+    """
+    table = dict((error.errno, (error, False)) for error in errors)
+    table.update((error.errno, (error, True)) for error in of_parent)
+    return table
+
+
+_CREATE_FILE_ERRORS = _errors(
+    (exceptions.FileNotFound, exceptions.FileExists, exceptions.NotADirectory),
+    of_parent=(exceptions.SymbolicLoop,),
+)
+_OPEN_FILE_ERRORS = _errors(
+    (
+        exceptions.FileNotFound,
+        exceptions.IsADirectory,
+        exceptions.NotADirectory,
+        exceptions.SymbolicLoop,
+    ),
+)
+_REMOVE_FILE_ERRORS = _errors(
+    (
+        exceptions.FileNotFound,
+        exceptions.IsADirectory,
+        exceptions.NotADirectory,
+        exceptions.PermissionError,
+    ),
+    of_parent=(exceptions.SymbolicLoop,),
+)
+_CREATE_DIRECTORY_ERRORS = _errors(
+    (exceptions.FileExists,),
+    of_parent=(
+        exceptions.FileNotFound,
+        exceptions.NotADirectory,
+        exceptions.SymbolicLoop,
+    ),
+)
+_LIST_DIRECTORY_ERRORS = _errors(
+    (
+        exceptions.FileNotFound,
+        exceptions.NotADirectory,
+        exceptions.SymbolicLoop,
+    ),
+)
+_REMOVE_EMPTY_DIRECTORY_ERRORS = _errors(
+    (
+        exceptions.DirectoryNotEmpty,
+        exceptions.FileNotFound,
+        exceptions.NotADirectory,
+    ),
+    of_parent=(exceptions.SymbolicLoop,),
+)
+_LINK_ERRORS = _CREATE_DIRECTORY_ERRORS
+_READLINK_ERRORS = _errors(
+    (
+        exceptions.FileNotFound,
+        exceptions.NotADirectory,
+        exceptions.NotASymlink,
+        exceptions.SymbolicLoop,
+    ),
+)
+_STAT_ERRORS = _LIST_DIRECTORY_ERRORS
+_MOVE_ERRORS = _errors(
+    (exceptions.DestinationWithinSource,),
+    of_parent=(
+        exceptions.FileNotFound,
+        exceptions.NotADirectory,
+        exceptions.SymbolicLoop,
+    ),
+)
 
-_CREATE_FLAGS = os.O_EXCL | os.O_CREAT | os.O_RDWR | getattr(os, "O_BINARY", 0)
+
+def _translate(error, path, errors):
+    """
+    The filesystem error for the given OS error, or None if there isn't one.
+    """
+    translation = errors.get(error.errno)
+    if translation is None:
+        return None
+    exception, of_parent = translation
+    return exception(path.parent() if of_parent else path)
+
+
+def _reraise(error, path, errors):
+    """
+    Raise the filesystem error for the OS error being handled.
+
+    Errors the operation doesn't translate are re-raised unchanged.
+    """
+    translated = _translate(error=error, path=path, errors=errors)
+    if translated is None:
+        raise
+    raise translated
 
 
 def _create_file(fs, path):
     try:
         fd = os.open(str(path), _CREATE_FLAGS)
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path)
-        elif error.errno == exceptions.FileExists.errno:
-            raise exceptions.FileExists(path)
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path)
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path.parent())
-        raise
+        _reraise(error=error, path=path, errors=_CREATE_FILE_ERRORS)
 
     return os.fdopen(fd, "w+")
 
@@ -31,32 +142,78 @@ def _open_file(fs, path, mode):
     try:
         return io.open(str(path), mode.io_open_string())
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path)
-        elif error.errno == exceptions.IsADirectory.errno:
+        _reraise(error=error, path=path, errors=_OPEN_FILE_ERRORS)
+
+
+def _iter_chunks(fs, path, size):
+    """
+    Read a file ``size`` bytes at a time, straight into a reused buffer.
+
+    The file is unbuffered, so each chunk is read from the OS without being
+    copied again.
+    """
+    try:
+        file = io.open(str(path), "rb", buffering=0)
+    except (IOError, OSError) as error:
+        _reraise(error=error, path=path, errors=_OPEN_FILE_ERRORS)
+
+    with file:
+        for chunk in common._read_into(file.readinto, size=size):
+            yield chunk
+
+
+#: The flags to open a file with, and how to then map it, for each access.
+_MMAP_ACCESS = {
+    "r": (os.O_RDONLY, mmap.ACCESS_READ),
+    "w": (os.O_RDWR, mmap.ACCESS_WRITE),
+    "c": (os.O_RDONLY, mmap.ACCESS_COPY),
+}
+
+
+@contextmanager
+def _mmap(fs, path, access):
+    """
+    Memory-map a file, providing a `memoryview` of the mapping.
+
+    Empty files (which can't be mapped) are given an empty one instead.
+    """
+    common._check_access(access)
+    flags, access = _MMAP_ACCESS[access]
+    try:
+        fd = os.open(str(path), flags | _O_BINARY)
+    except (IOError, OSError) as error:
+        _reraise(error=error, path=path, errors=_OPEN_FILE_ERRORS)
+
+    try:
+        info = os.fstat(fd)
+        if stat.S_ISDIR(info.st_mode):
             raise exceptions.IsADirectory(path)
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path)
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path)
-        raise
+        mapped = mmap.mmap(fd, 0, access=access) if info.st_size else None
+    finally:
+        os.close(fd)
+
+    if mapped is None:
+        yield memoryview(b"" if access == mmap.ACCESS_READ else bytearray())
+        return
+
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # Slices of the view are still alive, and the file is unmapped
+            # once they're gone instead.
+            pass
 
 
 def _remove_file(fs, path):
     try:
         os.remove(str(path))
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path)
-        elif error.errno == exceptions.IsADirectory.errno:
-            raise exceptions.IsADirectory(path)
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path)
-        elif error.errno == exceptions.PermissionError.errno:
-            raise exceptions.PermissionError(path)
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path.parent())
-        raise
+        _reraise(error=error, path=path, errors=_REMOVE_FILE_ERRORS)
 
 
 def _create_directory(fs, path, with_parents):
@@ -66,73 +223,39 @@ def _create_directory(fs, path, with_parents):
         else:
             os.mkdir(str(path))
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileExists.errno:
-            raise exceptions.FileExists(path)
-        elif error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path.parent())
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path.parent())
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path.parent())
-        raise
+        _reraise(error=error, path=path, errors=_CREATE_DIRECTORY_ERRORS)
 
 
 def _list_directory(fs, path):
     try:
         return os.listdir(str(path))
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path)
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path)
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path)
-        raise
+        _reraise(error=error, path=path, errors=_LIST_DIRECTORY_ERRORS)
 
 
 def _remove_empty_directory(fs, path):
     try:
         os.rmdir(str(path))
     except (IOError, OSError) as error:
-        if error.errno == exceptions.DirectoryNotEmpty.errno:
-            raise exceptions.DirectoryNotEmpty(path)
-        elif error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path)
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path)
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path.parent())
-        raise
+        _reraise(
+            error=error,
+            path=path,
+            errors=_REMOVE_EMPTY_DIRECTORY_ERRORS,
+        )
 
 
 def _link(fs, source, to):
     try:
         os.symlink(str(source), str(to))
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileExists.errno:
-            raise exceptions.FileExists(to)
-        elif error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(to.parent())
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(to.parent())
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(to.parent())
-        raise
+        _reraise(error=error, path=to, errors=_LINK_ERRORS)
 
 
 def _readlink(fs, path):
     try:
         value = os.readlink(str(path))
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path)
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path)
-        elif error.errno == exceptions.NotASymlink.errno:
-            raise exceptions.NotASymlink(path)
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path)
-        raise
+        _reraise(error=error, path=path, errors=_READLINK_ERRORS)
     else:
         return Path.from_string(value)
 
@@ -141,26 +264,311 @@ def _stat(fs, path):
     try:
         return os.stat(str(path))
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path)
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path)
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path)
-        raise
+        _reraise(error=error, path=path, errors=_STAT_ERRORS)
 
 
 def _lstat(fs, path):
     try:
         return os.lstat(str(path))
     except (IOError, OSError) as error:
-        if error.errno == exceptions.FileNotFound.errno:
-            raise exceptions.FileNotFound(path)
-        elif error.errno == exceptions.NotADirectory.errno:
-            raise exceptions.NotADirectory(path)
-        elif error.errno == exceptions.SymbolicLoop.errno:
-            raise exceptions.SymbolicLoop(path)
-        raise
+        _reraise(error=error, path=path, errors=_STAT_ERRORS)
+
+
+#: Errnos meaning that a path doesn't exist, for ``fs.exists``, and for
+#: the other predicates, which don't hide a non-directory parent.
+_ABSENT = frozenset([errno.ENOENT, errno.ENOTDIR])
+_NOT_FOUND = frozenset([errno.ENOENT])
+
+
+def _mode(stat_path, path, missing):
+    """
+    The mode of the given path, or None if it is missing.
+
+    Missing paths are reported without creating any filesystem error, but
+    any other failures are translated as usual.
+    """
+    try:
+        return stat_path(str(path)).st_mode
+    except (IOError, OSError) as error:
+        if error.errno in missing:
+            return None
+        _reraise(error=error, path=path, errors=_STAT_ERRORS)
+
+
+def _exists(fs, path):
+    return _mode(os.stat, path=path, missing=_ABSENT) is not None
+
+
+def _is_dir(fs, path):
+    mode = _mode(os.stat, path=path, missing=_NOT_FOUND)
+    return mode is not None and stat.S_ISDIR(mode)
+
+
+def _is_file(fs, path):
+    mode = _mode(os.stat, path=path, missing=_NOT_FOUND)
+    return mode is not None and stat.S_ISREG(mode)
+
+
+def _is_link(fs, path):
+    mode = _mode(os.lstat, path=path, missing=_NOT_FOUND)
+    return mode is not None and stat.S_ISLNK(mode)
+
+
+def _stat_or_translated(stat_path, path):
+    """
+    Stat the given path, returning rather than raising any failure.
+
+    Failures with a corresponding filesystem error are translated into it,
+    and any others are returned as the OS error itself.
+    """
+    try:
+        return stat_path(str(path))
+    except (IOError, OSError) as error:
+        translated = _translate(error=error, path=path, errors=_STAT_ERRORS)
+        return error if translated is None else translated
+
+
+def _stat_many_pool():
+    """
+    The thread pool shared by every ``fs.stat_many``, created on first use.
+    """
+    global _STAT_MANY_POOL
+    with _STAT_MANY_POOL_LOCK:
+        if _STAT_MANY_POOL is None:
+            _STAT_MANY_POOL = ThreadPoolExecutor(
+                max_workers=_STAT_MANY_WORKERS,
+            )
+        return _STAT_MANY_POOL
+
+
+def _stat_many(fs, paths, follow_links):
+    """
+    Stat many paths at once by spreading the syscalls over a thread pool.
+
+    Each stat releases the GIL, so on high-latency filesystems (e.g. NFS)
+    this overlaps the waits rather than paying for each one in turn. Every
+    failure is returned for the path it happened to (translated into a
+    filesystem error where there is one) rather than being raised, so that
+    one unreadable path doesn't lose the results for the rest.
+    """
+
+    paths = list(paths)
+    stat = partial(_stat_or_translated, os.stat if follow_links else os.lstat)
+    if len(paths) <= 1:
+        return pmap(dict((path, stat(path)) for path in paths))
+    return pmap(dict(zip(paths, _stat_many_pool().map(stat, paths))))
+
+
+def _scandir(path):
+    try:
+        return list(os.scandir(str(path)))
+    except (IOError, OSError) as error:
+        _reraise(error=error, path=path, errors=_LIST_DIRECTORY_ERRORS)
+
+
+def _partition(entries):
+    """
+    Partition directory entries into directories and everything else.
+
+    The file types reported by `os.scandir` are used, which avoids an extra
+    ``stat`` per entry on platforms whose directory listings include them.
+    """
+
+    dirnames, filenames, links = [], [], set()
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            dirnames.append(entry.name)
+            if entry.is_symlink():
+                links.add(entry.name)
+        else:
+            filenames.append(entry.name)
+    return dirnames, filenames, links
+
+
+def _walk(fs, path, topdown, follow_links):
+    dirnames, filenames, links = _partition(_scandir(path=path))
+
+    if topdown:
+        yield path, dirnames, filenames
+
+    for name in dirnames:
+        if follow_links or name not in links:
+            for each in _walk(
+                fs=fs,
+                path=path / name,
+                topdown=topdown,
+                follow_links=follow_links,
+            ):
+                yield each
+
+    if not topdown:
+        yield path, dirnames, filenames
+
+
+#: How much to ask the kernel to copy between files at once.
+_KERNEL_COPY_SIZE = 2 ** 30
+
+#: How much to copy at once when the kernel can't copy between files.
+_COPY_BUFFER_SIZE = 2 ** 20
+
+#: Errnos meaning the kernel can't copy between the given files.
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    getattr(errno, name)
+    for name in ("EBADF", "EINVAL", "ENOSYS", "ENOTSUP", "EOPNOTSUPP", "EXDEV")
+    if hasattr(errno, name)
+)
+
+
+def _kernel_copies():
+    """
+    The ways available to copy between files without the data leaving the
+    kernel, best first.
+
+    Each takes a source and destination file descriptor and the offset to
+    copy from (and to), and returns how much it copied.
+    """
+
+    copies = []
+    if hasattr(os, "copy_file_range"):
+        copies.append(
+            lambda source, destination, offset: os.copy_file_range(
+                source, destination, _KERNEL_COPY_SIZE, offset, offset,
+            ),
+        )
+    if hasattr(os, "sendfile"):
+        copies.append(
+            lambda source, destination, offset: os.sendfile(
+                destination, source, offset, _KERNEL_COPY_SIZE,
+            ),
+        )
+    return copies
+
+
+_KERNEL_COPIES = _kernel_copies()
+
+
+def _copy_data(source, destination):
+    """
+    Copy everything from one file descriptor to another, within the kernel
+    where possible.
+    """
+
+    offset = 0
+    for copy in _KERNEL_COPIES:
+        os.lseek(destination, offset, os.SEEK_SET)
+        try:
+            while True:
+                copied = copy(source, destination, offset)
+                if not copied:
+                    return
+                offset += copied
+        except OSError as error:
+            if error.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+
+    os.lseek(source, offset, os.SEEK_SET)
+    os.lseek(destination, offset, os.SEEK_SET)
+    while True:
+        data = os.read(source, _COPY_BUFFER_SIZE)
+        if not data:
+            return
+        while data:
+            data = data[os.write(destination, data):]
+
+
+def _copy(fs, source, destination):
+    try:
+        reading = os.open(str(source), os.O_RDONLY | _O_BINARY)
+    except (IOError, OSError) as error:
+        _reraise(error=error, path=source, errors=_OPEN_FILE_ERRORS)
+
+    try:
+        info = os.fstat(reading)
+        if stat.S_ISDIR(info.st_mode):
+            raise exceptions.IsADirectory(source)
+        _check_not_same(info=info, destination=destination)
+        try:
+            writing = os.open(str(destination), _COPY_FLAGS, 0o666)
+        except (IOError, OSError) as error:
+            _reraise(error=error, path=destination, errors=_OPEN_FILE_ERRORS)
+        try:
+            _copy_data(source=reading, destination=writing)
+        finally:
+            os.close(writing)
+    finally:
+        os.close(reading)
+
+
+def _check_not_same(info, destination):
+    """
+    Refuse to copy a file (whose stat result is given) onto itself, whether
+    through a link or a hard link, since opening it to write truncates it.
+    """
+    try:
+        existing = os.stat(str(destination))
+    except (IOError, OSError):
+        return  # Any problem is reported once it's opened.
+    if (existing.st_dev, existing.st_ino) == (info.st_dev, info.st_ino):
+        raise exceptions.SameFile(destination)
+
+
+def _move(fs, source, destination):
+    """
+    Rename the source if it's on the same device as the destination, or
+    otherwise copy and then remove it.
+    """
+
+    if stat.S_ISDIR(fs.lstat(path=source).st_mode):
+        common._check_not_within(fs=fs, source=source, destination=destination)
+    if _mode(os.lstat, path=destination, missing=_ABSENT) is not None:
+        raise exceptions.FileExists(destination)
+
+    try:
+        os.rename(str(source), str(destination))
+    except (IOError, OSError) as error:
+        if error.errno != errno.EXDEV:
+            _reraise(error=error, path=destination, errors=_MOVE_ERRORS)
+        common._move(fs=fs, source=source, destination=destination)
+
+
+def _kinds_of_children(fs, path):
+    """
+    Split a directory's children as `common._kinds_of_children` does, but
+    using the file types reported by `os.scandir` rather than statting each.
+    """
+
+    directories, others = [], []
+    for entry in _scandir(path=path):
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        (directories if is_dir else others).append(path / entry.name)
+    return directories, others
+
+
+def _copytree(fs, source, destination, parallelism=None):
+    common._copytree(
+        fs=fs,
+        source=source,
+        destination=destination,
+        parallelism=parallelism,
+        partition=_kinds_of_children,
+    )
+
+
+def _remove(fs, path, parallelism=None):
+    common._recursive_remove(
+        fs=fs,
+        path=path,
+        parallelism=parallelism,
+        partition=_kinds_of_children,
+    )
 
 
 FS = common.create(
@@ -180,4 +588,19 @@ FS = common.create(
     lstat=_lstat,
     link=_link,
     readlink=_readlink,
+
+    remove=_remove if hasattr(os, "scandir") else common._recursive_remove,
+    iter_chunks=_iter_chunks,
+    mmap=_mmap,
+
+    copy=_copy,
+    copytree=_copytree if hasattr(os, "scandir") else common._copytree,
+    move=_move,
+    walk=_walk if hasattr(os, "scandir") else common._walk,
+    stat_many=common._stat_many if ThreadPoolExecutor is None else _stat_many,
+
+    exists=_exists,
+    is_dir=_is_dir,
+    is_file=_is_file,
+    is_link=_is_link,
 )
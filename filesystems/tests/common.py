@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import errno
 import os
+import stat
+import sys
 
 from pyrsistent import s
 from testscenarios import multiply_scenarios, with_scenarios
@@ -41,6 +43,9 @@ class _NonExistingFileMixin(object):
         ), (
             "readlink",
             dict(act_on=lambda fs, path: fs.readlink(path=path)),
+        ), (
+            "walk",
+            dict(act_on=lambda fs, path: list(fs.walk(path=path))),
         ),
     ]
 
@@ -219,101 +224,688 @@ class TestFS(_NonExistingFileMixin):
             "foo\nbar\nbaz",
         )
 
-    def test_get_contents_text(self):
+    def test_write_bytes_like(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with fs.open(tempdir / "file", mode="wb") as file:
+            file.write(bytearray(b"some "))
+            file.write(memoryview(b"things"))
+        self.assertEqual(
+            fs.get_contents(path=tempdir / "file", mode="b"),
+            b"some things",
+        )
+
+    def test_write_non_bytes_in_binary_mode(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with fs.open(tempdir / "file", mode="wb") as file:
+            with self.assertRaises(TypeError):
+                file.write(5)
+            with self.assertRaises(TypeError):
+                file.write(u"text")
+        self.assertEqual(fs.get_contents(path=tempdir / "file", mode="b"), b"")
+
+    def test_truncate_past_the_end(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with fs.open(tempdir / "file", mode="wb") as file:
+            file.write(b"some")
+            file.truncate(7)
+            self.assertEqual(file.tell(), 4)
+        self.assertEqual(
+            fs.get_contents(path=tempdir / "file", mode="b"),
+            b"some\0\0\0",
+        )
+
+    def test_get_contents_text(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with fs.open(tempdir / "unittesting", "wb") as f:
+            f.write(u"שלום".encode("utf-8"))
+
+        self.assertEqual(
+            fs.get_contents(tempdir / "unittesting", mode="t"),
+            u"שלום",
+        )
+
+    def test_get_set_contents_text(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "unittesting", u"שלום", mode="t")
+        self.assertEqual(
+            fs.get_contents(path=tempdir / "unittesting", mode="t"),
+            u"שלום",
+        )
+
+    def test_set_contents_existing_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "unittesting", "foo\nbar\nbaz")
+        fs.set_contents(tempdir / "unittesting", "spam\nquux\n")
+
+        self.assertEqual(
+            fs.get_contents(path=tempdir / "unittesting"),
+            "spam\nquux\n",
+        )
+
+    def test_create_with_contents(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.create_with_contents(tempdir / "unittesting", "foo\nbar\nbaz")
+
+        self.assertEqual(
+            fs.get_contents(path=tempdir / "unittesting"),
+            "foo\nbar\nbaz",
+        )
+
+    def test_create_with_contents_existing_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "unittesting", "foo\nbar\nbaz")
+        with self.assertRaises(exceptions.FileExists):
+            fs.create_with_contents(tempdir / "unittesting", "spam\nquux\n")
+
+        self.assertEqual(
+            fs.get_contents(path=tempdir / "unittesting"),
+            "foo\nbar\nbaz",
+        )
+
+    def test_remove(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        directory = tempdir / "directory"
+        fs.create_directory(directory)
+
+        a = directory / "a"
+        b = directory / "b"
+        c = directory.descendant("b", "c")
+        d = directory / "d"
+
+        fs.touch(path=a)
+        fs.create_directory(path=b)
+        fs.touch(path=c)
+        fs.touch(path=d)
+
+        fs.remove(directory)
+
+        self.assertEqual(fs.children(path=tempdir), s())
+
+    def test_remove_in_parallel(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        outside = tempdir / "outside"
+        fs.create_directory(outside)
+        fs.touch(outside / "kept")
+
+        directory = tempdir / "directory"
+        fs.create_directory(directory)
+        for name in "abc":
+            child = directory / name
+            fs.create_directory(child)
+            fs.create_directory(child / "empty")
+            for i in range(300):
+                fs.touch(child / str(i))
+        fs.link(source=outside, to=directory / "a" / "link")
+
+        fs.remove(directory, parallelism=4)
+
+        self.assertEqual(
+            (fs.children(path=tempdir), fs.children(path=outside)),
+            (s(outside), s(outside / "kept")),
+        )
+
+    def test_remove_in_parallel_nonexisting(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with self.assertRaises(exceptions.FileNotFound):
+            fs.remove(tempdir / "missing", parallelism=4)
+
+    def test_remove_deeper_than_the_recursion_limit(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        self.addCleanup(sys.setrecursionlimit, sys.getrecursionlimit())
+        sys.setrecursionlimit(200)
+
+        directory = tempdir / "directory"
+        path = directory
+        for _ in range(250):
+            fs.create_directory(path)
+            path = path / "d"
+        fs.touch(path)
+
+        fs.remove(directory)
+
+        self.assertEqual(fs.children(path=tempdir), s())
+
+    def test_removing(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with fs.removing(path=tempdir / "directory") as path:
+            self.assertFalse(fs.is_dir(path=path))
+            fs.create_directory(path=path)
+            self.assertTrue(fs.is_dir(path=path))
+        self.assertFalse(fs.is_dir(path=path))
+
+    def test_iter_chunks(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "file", b"0123456789", mode="b")
+        self.assertEqual(
+            [bytes(chunk) for chunk in fs.iter_chunks(tempdir / "file", 4)],
+            [b"0123", b"4567", b"89"],
+        )
+
+    def test_iter_chunks_empty(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.touch(tempdir / "file")
+        self.assertEqual(list(fs.iter_chunks(tempdir / "file")), [])
+
+    def test_iter_chunks_nonexisting(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with self.assertRaises(exceptions.FileNotFound):
+            list(fs.iter_chunks(tempdir / "missing"))
+
+    def test_iter_chunks_directory(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with self.assertRaises(exceptions.IsADirectory):
+            list(fs.iter_chunks(tempdir))
+
+    def test_iter_chunks_non_positive_size(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "file", b"contents", mode="b")
+        for size in 0, -1:
+            with self.assertRaises(ValueError):
+                fs.iter_chunks(tempdir / "file", size=size)
+
+    def test_iter_lines(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "file", u"one\ntwo\nthree", mode="t")
+        self.assertEqual(
+            (
+                list(fs.iter_lines(tempdir / "file", mode="t")),
+                list(fs.iter_lines(tempdir / "file", mode="b")),
+            ),
+            (
+                [u"one\n", u"two\n", u"three"],
+                [b"one\n", b"two\n", b"three"],
+            ),
+        )
+
+    def test_mmap(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "file", b"0123456789", mode="b")
+        with fs.mmap(tempdir / "file") as mapped:
+            self.assertIsInstance(mapped, memoryview)
+            self.assertEqual((len(mapped), bytes(mapped[2:5])), (10, b"234"))
+            with self.assertRaises(TypeError):
+                mapped[0:1] = b"x"
+
+    def test_mmap_write(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "file", b"0123456789", mode="b")
+        with fs.mmap(tempdir / "file", access="w") as mapped:
+            mapped[0:3] = b"abc"
+        self.assertEqual(
+            fs.get_contents(tempdir / "file", mode="b"),
+            b"abc3456789",
+        )
+
+    def test_mmap_copy(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "file", b"0123456789", mode="b")
+        with fs.mmap(tempdir / "file", access="c") as mapped:
+            mapped[0:3] = b"abc"
+            self.assertEqual(bytes(mapped[0:4]), b"abc3")
+        self.assertEqual(
+            fs.get_contents(tempdir / "file", mode="b"),
+            b"0123456789",
+        )
+
+    def test_mmap_empty(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.touch(tempdir / "file")
+        with fs.mmap(tempdir / "file") as mapped:
+            self.assertIsInstance(mapped, memoryview)
+            self.assertEqual(len(mapped), 0)
+
+    def test_mmap_nonexisting(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with self.assertRaises(exceptions.FileNotFound):
+            with fs.mmap(tempdir / "missing"):
+                pass
+
+    def test_mmap_directory(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with self.assertRaises(exceptions.IsADirectory):
+            with fs.mmap(tempdir):
+                pass
+
+    def test_mmap_invalid_access(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.touch(tempdir / "file")
+        with self.assertRaises(exceptions.InvalidMode):
+            with fs.mmap(tempdir / "file", access="x"):
+                pass
+
+    def test_copy(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source, destination = tempdir / "source", tempdir / "destination"
+        fs.set_contents(source, "some things")
+        fs.copy(source=source, destination=destination)
+        fs.set_contents(source, "other things")
+
+        self.assertEqual(
+            (fs.get_contents(source), fs.get_contents(destination)),
+            ("other things", "some things"),
+        )
+
+    def test_copy_replaces_existing_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source, destination = tempdir / "source", tempdir / "destination"
+        fs.set_contents(source, "new")
+        fs.set_contents(destination, "old and longer")
+        fs.copy(source=source, destination=destination)
+
+        self.assertEqual(fs.get_contents(destination), "new")
+
+    def test_copy_through_link(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source, link = tempdir / "source", tempdir / "link"
+        fs.set_contents(source, "some things")
+        fs.link(source=source, to=link)
+        fs.copy(source=link, destination=tempdir / "destination")
+
+        self.assertEqual(
+            (
+                fs.is_link(tempdir / "destination"),
+                fs.get_contents(tempdir / "destination"),
+            ),
+            (False, "some things"),
+        )
+
+    def test_copy_onto_itself(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source = tempdir / "source"
+        fs.set_contents(source, "some things")
+
+        with self.assertRaises(exceptions.SameFile):
+            fs.copy(source=source, destination=source)
+        self.assertEqual(fs.get_contents(source), "some things")
+
+    def test_copy_link_onto_its_target(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source, link = tempdir / "source", tempdir / "link"
+        fs.set_contents(source, "some things")
+        fs.link(source=source, to=link)
+
+        with self.assertRaises(exceptions.SameFile):
+            fs.copy(source=link, destination=source)
+        with self.assertRaises(exceptions.SameFile):
+            fs.copy(source=source, destination=link)
+        self.assertEqual(fs.get_contents(source), "some things")
+
+    def test_copy_directory(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with self.assertRaises(exceptions.IsADirectory):
+            fs.copy(source=tempdir, destination=tempdir / "destination")
+
+    def test_copy_nonexisting(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        with self.assertRaises(exceptions.FileNotFound):
+            fs.copy(source=tempdir / "missing", destination=tempdir / "copy")
+
+    def test_copytree(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source = tempdir / "source"
+        fs.create_directory(source)
+        fs.create_directory(source / "dir")
+        fs.set_contents(source / "dir" / "file", "some things")
+        fs.link(source=RelativePath("dir", "file"), to=source / "link")
+
+        destination = tempdir / "destination"
+        fs.copytree(source=source, destination=destination)
+        fs.set_contents(source / "dir" / "file", "other things")
+        fs.touch(destination / "dir" / "new")
+
+        self.assertEqual(
+            (
+                fs.children(destination),
+                fs.children(destination / "dir"),
+                fs.readlink(destination / "link"),
+                fs.get_contents(destination / "link"),
+                fs.children(source / "dir"),
+            ),
+            (
+                s(destination / "dir", destination / "link"),
+                s(destination / "dir" / "file", destination / "dir" / "new"),
+                RelativePath("dir", "file"),
+                "some things",
+                s(source / "dir" / "file"),
+            ),
+        )
+
+    def test_copytree_in_parallel(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source = tempdir / "source"
+        for name in "abc":
+            fs.create_directory(source / name, with_parents=True)
+            for i in range(10):
+                fs.set_contents(source / name / str(i), name + str(i))
+
+        destination = tempdir / "destination"
+        fs.copytree(source=source, destination=destination, parallelism=4)
+
+        self.assertEqual(
+            [
+                fs.get_contents(destination / name / str(i))
+                for name in "abc"
+                for i in range(10)
+            ],
+            [name + str(i) for name in "abc" for i in range(10)],
+        )
+
+    def test_copytree_existing_destination(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source, destination = tempdir / "source", tempdir / "destination"
+        fs.create_directory(source)
+        fs.create_directory(destination)
+
+        with self.assertRaises(exceptions.FileExists):
+            fs.copytree(source=source, destination=destination)
+
+    def test_copytree_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.touch(tempdir / "file")
+
+        with self.assertRaises(exceptions.NotADirectory):
+            fs.copytree(
+                source=tempdir / "file",
+                destination=tempdir / "destination",
+            )
+        self.assertFalse(fs.exists(tempdir / "destination"))
+
+    def test_copytree_into_itself(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source = tempdir / "source"
+        fs.create_directory(source)
+
+        with self.assertRaises(exceptions.DestinationWithinSource):
+            fs.copytree(source=source, destination=source / "copy")
+        self.assertEqual(fs.children(source), s())
+
+    def test_copytree_into_existing_child(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source = tempdir / "source"
+        fs.create_directory(source / "child", with_parents=True)
+
+        with self.assertRaises(exceptions.DestinationWithinSource):
+            fs.copytree(source=source, destination=source / "child")
+
+    def test_copytree_nonexisting_into_itself(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source = tempdir / "missing"
+        with self.assertRaises(exceptions.FileNotFound):
+            fs.copytree(source=source, destination=source / "copy")
+
+    def test_move_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source, destination = tempdir / "source", tempdir / "destination"
+        fs.set_contents(source, "some things")
+        fs.move(source=source, destination=destination)
+
+        self.assertEqual(
+            (fs.exists(source), fs.get_contents(destination)),
+            (False, "some things"),
+        )
+
+    def test_move_directory(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source = tempdir / "source"
+        fs.create_directory(source / "dir", with_parents=True)
+        fs.set_contents(source / "dir" / "file", "some things")
+        self.assertTrue(fs.is_dir(source / "dir"))
+
+        destination = tempdir / "destination"
+        fs.create_directory(destination)
+        fs.move(source=source, destination=destination / "moved")
+
+        moved = destination / "moved"
+        fs.touch(moved / "dir" / "new")
+        fs.remove_file(moved / "dir" / "file")
+
+        self.assertEqual(
+            (
+                fs.exists(source),
+                fs.exists(source / "dir"),
+                fs.children(moved / "dir"),
+            ),
+            (False, False, s(moved / "dir" / "new")),
+        )
+
+    def test_move_link(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        target, link = tempdir / "target", tempdir / "link"
+        fs.create_directory(target)
+        fs.link(source=target, to=link)
+        fs.move(source=link, destination=tempdir / "moved")
+
+        self.assertEqual(
+            (
+                fs.is_link(link),
+                fs.readlink(tempdir / "moved"),
+                fs.is_dir(target),
+            ),
+            (False, target, True),
+        )
+
+    def test_move_existing_destination(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
         self.addCleanup(fs.remove, tempdir)
 
-        with fs.open(tempdir / "unittesting", "wb") as f:
-            f.write(u"שלום".encode("utf-8"))
+        source, destination = tempdir / "source", tempdir / "destination"
+        fs.set_contents(source, "source")
+        fs.set_contents(destination, "destination")
 
+        with self.assertRaises(exceptions.FileExists):
+            fs.move(source=source, destination=destination)
         self.assertEqual(
-            fs.get_contents(tempdir / "unittesting", mode="t"),
-            u"שלום",
+            (fs.get_contents(source), fs.get_contents(destination)),
+            ("source", "destination"),
         )
 
-    def test_get_set_contents_text(self):
+    def test_move_nonexisting(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
         self.addCleanup(fs.remove, tempdir)
 
-        fs.set_contents(tempdir / "unittesting", u"שלום", mode="t")
-        self.assertEqual(
-            fs.get_contents(path=tempdir / "unittesting", mode="t"),
-            u"שלום",
-        )
+        with self.assertRaises(exceptions.FileNotFound):
+            fs.move(source=tempdir / "missing", destination=tempdir / "moved")
 
-    def test_set_contents_existing_file(self):
+    def test_move_nonexisting_onto_existing(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
         self.addCleanup(fs.remove, tempdir)
 
-        fs.set_contents(tempdir / "unittesting", "foo\nbar\nbaz")
-        fs.set_contents(tempdir / "unittesting", "spam\nquux\n")
+        fs.touch(tempdir / "file")
 
-        self.assertEqual(
-            fs.get_contents(path=tempdir / "unittesting"),
-            "spam\nquux\n",
-        )
+        with self.assertRaises(exceptions.FileNotFound):
+            fs.move(source=tempdir / "missing", destination=tempdir / "file")
 
-    def test_create_with_contents(self):
+    def test_move_from_within_a_file(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
         self.addCleanup(fs.remove, tempdir)
 
-        fs.create_with_contents(tempdir / "unittesting", "foo\nbar\nbaz")
+        file = tempdir / "file"
+        fs.touch(file)
 
-        self.assertEqual(
-            fs.get_contents(path=tempdir / "unittesting"),
-            "foo\nbar\nbaz",
-        )
+        with self.assertRaises(exceptions.NotADirectory):
+            fs.move(source=file / "child", destination=tempdir / "moved")
 
-    def test_create_with_contents_existing_file(self):
+    def test_move_into_a_file(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
         self.addCleanup(fs.remove, tempdir)
 
-        fs.set_contents(tempdir / "unittesting", "foo\nbar\nbaz")
-        with self.assertRaises(exceptions.FileExists):
-            fs.create_with_contents(tempdir / "unittesting", "spam\nquux\n")
+        source, file = tempdir / "source", tempdir / "file"
+        fs.touch(source)
+        fs.touch(file)
 
-        self.assertEqual(
-            fs.get_contents(path=tempdir / "unittesting"),
-            "foo\nbar\nbaz",
-        )
+        with self.assertRaises(exceptions.NotADirectory):
+            fs.move(source=source, destination=file / "moved")
+        self.assertTrue(fs.exists(source))
 
-    def test_remove(self):
+    def test_move_into_nonexisting_directory(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
         self.addCleanup(fs.remove, tempdir)
 
-        directory = tempdir / "directory"
-        fs.create_directory(directory)
+        source = tempdir / "source"
+        fs.touch(source)
 
-        a = directory / "a"
-        b = directory / "b"
-        c = directory.descendant("b", "c")
-        d = directory / "d"
+        with self.assertRaises(exceptions.FileNotFound):
+            fs.move(source=source, destination=tempdir / "missing" / "moved")
+        self.assertTrue(fs.exists(source))
 
-        fs.touch(path=a)
-        fs.create_directory(path=b)
-        fs.touch(path=c)
-        fs.touch(path=d)
+    def test_move_into_itself(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
 
-        fs.remove(directory)
+        source = tempdir / "source"
+        fs.create_directory(source)
 
-        self.assertEqual(fs.children(path=tempdir), s())
+        with self.assertRaises(exceptions.DestinationWithinSource):
+            fs.move(source=source, destination=source / "moved")
+        self.assertTrue(fs.is_dir(source))
 
-    def test_removing(self):
+    def test_move_into_existing_child(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
         self.addCleanup(fs.remove, tempdir)
 
-        with fs.removing(path=tempdir / "directory") as path:
-            self.assertFalse(fs.is_dir(path=path))
-            fs.create_directory(path=path)
-            self.assertTrue(fs.is_dir(path=path))
-        self.assertFalse(fs.is_dir(path=path))
+        source = tempdir / "source"
+        fs.create_directory(source / "child", with_parents=True)
+
+        with self.assertRaises(exceptions.DestinationWithinSource):
+            fs.move(source=source, destination=source / "child")
+        self.assertEqual(fs.children(source), s(source / "child"))
 
     def test_link(self):
         fs = self.FS()
@@ -685,6 +1277,79 @@ class TestFS(_NonExistingFileMixin):
             directories[0].descendant("1", "2", "3", "4", "5"),
         )
 
+    def test_realpath_after_relinking(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+        tempdir = fs.realpath(tempdir)
+
+        first, second = tempdir / "first", tempdir / "second"
+        current = tempdir / "current"
+        fs.create_directory(path=first)
+        fs.create_directory(path=second)
+
+        fs.link(source=first, to=current)
+        self.assertEqual(fs.realpath(current / "file"), first / "file")
+
+        fs.remove_file(path=current)
+        fs.link(source=second, to=current)
+        self.assertEqual(fs.realpath(current / "file"), second / "file")
+
+    def test_realpath_after_replacing_directory_with_link(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+        tempdir = fs.realpath(tempdir)
+
+        source, directory = tempdir / "source", tempdir / "directory"
+        fs.create_directory(path=source)
+        fs.create_directory(path=directory)
+        self.assertEqual(
+            fs.realpath(directory / "file"),
+            directory / "file",
+        )
+
+        fs.remove_empty_directory(path=directory)
+        fs.link(source=source, to=directory)
+        self.assertEqual(fs.realpath(directory / "file"), source / "file")
+
+    def test_realpath_shared_prefix(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+        tempdir = fs.realpath(tempdir)
+
+        source, link = tempdir / "source", tempdir / "link"
+        fs.create_directory(path=source)
+        fs.link(source=source, to=link)
+
+        self.assertEqual(
+            [
+                fs.realpath(link / "a"),
+                fs.realpath(link / "b"),
+                fs.realpath(link),
+            ],
+            [source / "a", source / "b", source],
+        )
+
+    def test_realpath_after_creating_a_file_at_a_missing_prefix(self):
+        fs = self.FS()
+        tempdir = fs.realpath(fs.temporary_directory())
+        self.addCleanup(fs.remove, tempdir)
+
+        missing, link = tempdir / "missing", tempdir / "link"
+        fs.link(source=missing / "child", to=link)
+        self.assertEqual(
+            (fs.realpath(missing / "child"), fs.realpath(link)),
+            (missing / "child", missing / "child"),
+        )
+
+        fs.touch(path=missing)
+        with self.assertRaises(exceptions.NotADirectory):
+            fs.realpath(missing / "child")
+        with self.assertRaises(exceptions.NotADirectory):
+            fs.realpath(link)
+
     def test_remove_does_not_follow_directory_links(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
@@ -1253,6 +1918,252 @@ class TestFS(_NonExistingFileMixin):
             s(b, abc, fedcba),
         )
 
+    def test_walk(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.touch(path=tempdir / "a")
+        fs.create_directory(path=tempdir / "b")
+        fs.touch(path=tempdir.descendant("b", "c"))
+        fs.create_directory(path=tempdir.descendant("b", "d"))
+        fs.link(source=tempdir / "b", to=tempdir / "e")
+
+        self.assertEqual(
+            [
+                (path, sorted(dirnames), sorted(filenames))
+                for path, dirnames, filenames in fs.walk(path=tempdir)
+            ], [
+                (tempdir, ["b", "e"], ["a"]),
+                (tempdir / "b", ["d"], ["c"]),
+                (tempdir.descendant("b", "d"), [], []),
+            ],
+        )
+
+    def test_walk_bottom_up(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.create_directory(
+            path=tempdir.descendant("a", "b"),
+            with_parents=True,
+        )
+
+        self.assertEqual(
+            [path for path, _, _ in fs.walk(path=tempdir, topdown=False)],
+            [tempdir.descendant("a", "b"), tempdir / "a", tempdir],
+        )
+
+    def test_walk_follow_links(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.create_directory(path=tempdir / "source")
+        fs.touch(path=tempdir.descendant("source", "file"))
+        fs.link(source=tempdir / "source", to=tempdir / "link")
+
+        self.assertEqual(
+            sorted(
+                (path, filenames)
+                for path, _, filenames in fs.walk(
+                    path=tempdir, follow_links=True,
+                )
+            ), [
+                (tempdir, []),
+                (tempdir / "link", ["file"]),
+                (tempdir / "source", ["file"]),
+            ],
+        )
+
+    def test_walk_prune(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.create_directory(
+            path=tempdir.descendant("a", "b"),
+            with_parents=True,
+        )
+        fs.create_directory(path=tempdir / "c")
+
+        seen = []
+        for path, dirnames, _ in fs.walk(path=tempdir):
+            seen.append(path)
+            if "a" in dirnames:
+                dirnames.remove("a")
+
+        self.assertEqual(seen, [tempdir, tempdir / "c"])
+
+    def test_walk_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        not_a_dir = tempdir / "not_a_dir"
+        fs.touch(not_a_dir)
+
+        with self.assertRaises(exceptions.NotADirectory) as e:
+            list(fs.walk(not_a_dir))
+
+        self.assertEqual(
+            str(e.exception),
+            os.strerror(errno.ENOTDIR) + ": " + str(not_a_dir),
+        )
+
+    def test_walk_link_through_a_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.touch(path=tempdir / "file")
+        fs.link(source=tempdir.descendant("file", "child"), to=tempdir / "a")
+
+        self.assertEqual(
+            [
+                (path, sorted(dirnames), sorted(filenames))
+                for path, dirnames, filenames in fs.walk(path=tempdir)
+            ],
+            [(tempdir, [], ["a", "file"])],
+        )
+
+    def test_walk_is_lazy(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        walk = fs.walk(path=tempdir / "missing")
+        with self.assertRaises(exceptions.FileNotFound):
+            next(walk)
+
+    def test_stat_size(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        file = tempdir / "file"
+        fs.set_contents(path=file, contents=b"12345", mode="b")
+        with fs.open(path=file, mode="ab") as f:
+            f.write(b"678")
+
+        self.assertEqual(fs.stat(path=file).st_size, 8)
+
+    def test_stat_inodes(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        one, two = tempdir / "one", tempdir / "two"
+        fs.touch(path=one)
+        fs.create_directory(path=two)
+
+        self.assertNotEqual(
+            fs.stat(path=one).st_ino,
+            fs.stat(path=two).st_ino,
+        )
+        self.assertEqual(fs.stat(path=one).st_ino, fs.stat(path=one).st_ino)
+
+    def test_stat_modified(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        file = tempdir / "file"
+        fs.touch(path=file)
+        before = fs.stat(path=file).st_mtime_ns
+
+        fs.set_contents(path=file, contents=b"12345", mode="b")
+        self.assertGreaterEqual(fs.stat(path=file).st_mtime_ns, before)
+
+    def test_lstat_link_size(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source, link = tempdir / "source", tempdir / "link"
+        fs.link(source=source, to=link)
+
+        self.assertEqual(fs.lstat(path=link).st_size, len(str(source)))
+
+    def test_stat_many(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        directory = tempdir / "directory"
+        file = directory / "file"
+        link = tempdir / "link"
+        nonexistent = directory / "nonexistent"
+        child_of_file = file / "child"
+
+        fs.create_directory(path=directory)
+        fs.touch(path=file)
+        fs.link(source=file, to=link)
+
+        results = fs.stat_many(
+            paths=[file, directory, link, nonexistent, child_of_file],
+        )
+        self.assertEqual(
+            dict(
+                file=stat.S_ISREG(results[file].st_mode),
+                directory=stat.S_ISDIR(results[directory].st_mode),
+                link=stat.S_ISREG(results[link].st_mode),
+                nonexistent=results[nonexistent],
+                child_of_file=results[child_of_file],
+            ),
+            dict(
+                file=True,
+                directory=True,
+                link=True,
+                nonexistent=exceptions.FileNotFound(nonexistent),
+                child_of_file=exceptions.NotADirectory(child_of_file),
+            ),
+        )
+
+    def test_stat_many_no_follow_links(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        file, link = tempdir / "file", tempdir / "link"
+        fs.touch(path=file)
+        fs.link(source=file, to=link)
+
+        results = fs.stat_many(paths=[file, link], follow_links=False)
+        self.assertEqual(
+            (
+                stat.S_ISREG(results[file].st_mode),
+                stat.S_ISLNK(results[link].st_mode),
+            ),
+            (True, True),
+        )
+
+    def test_stat_many_through_unresolvable_links(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        file = tempdir / "file"
+        loop, through = tempdir / "loop", tempdir / "through"
+        fs.touch(path=file)
+        fs.link(source=loop, to=loop)
+        fs.link(source=file / "child", to=through)
+
+        results = fs.stat_many(paths=[file, loop / "child", through / "child"])
+        self.assertEqual(
+            (
+                stat.S_ISREG(results[file].st_mode),
+                type(results[loop / "child"]),
+                type(results[through / "child"]),
+            ),
+            (True, exceptions.SymbolicLoop, exceptions.NotADirectory),
+        )
+
+    def test_stat_many_nothing(self):
+        fs = self.FS()
+        self.assertEqual(dict(fs.stat_many(paths=[])), {})
+
     # With how crazy computers are, I'm not actually 100% sure that
     # these tests for the behavior of the root directory will always be
     # the case. But, onward we go.
@@ -1260,6 +2171,23 @@ class TestFS(_NonExistingFileMixin):
         fs = self.FS()
         self.assertTrue(fs.exists(Path.root()))
 
+    def test_exists_link_through_a_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        file, link = tempdir / "file", tempdir / "link"
+        fs.touch(path=file)
+        fs.link(source=file / "child", to=link)
+        self.assertEqual(
+            (
+                fs.exists(path=link),
+                fs.exists(path=link / "grandchild"),
+                fs.is_link(path=link),
+            ),
+            (False, False, True),
+        )
+
     def test_realpath_root(self):
         fs = self.FS()
         self.assertEqual(fs.realpath(Path.root()), Path.root())
@@ -1882,6 +2810,34 @@ class SymbolicLoopMixin(_SymbolicLoopMixin):
 
         self.assertIn(str(e.exception), acceptable)
 
+    def test_predicates_missing(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        path = tempdir / "missing" / "child"
+        self.assertEqual(
+            dict(
+                exists=fs.exists(path=path),
+                is_dir=fs.is_dir(path=path),
+                is_file=fs.is_file(path=path),
+                is_link=fs.is_link(path=path),
+            ),
+            dict(exists=False, is_dir=False, is_file=False, is_link=False),
+        )
+
+    def test_predicates_through_a_file(self):
+        fs = self.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        child = tempdir / "file" / "child"
+        fs.touch(child.parent())
+        self.assertFalse(fs.exists(path=child))
+        for predicate in fs.is_dir, fs.is_file, fs.is_link:
+            with self.assertRaises(exceptions.NotADirectory):
+                predicate(path=child)
+
     def test_is_link_loop(self):
         fs = self.FS()
         tempdir = fs.temporary_directory()
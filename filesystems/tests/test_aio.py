@@ -0,0 +1,185 @@
+from unittest import TestCase, skipIf
+import threading
+
+from filesystems import exceptions, memory, native
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    import asyncio
+    from filesystems import aio
+except (ImportError, SyntaxError):
+    aio = None
+
+
+@skipIf(aio is None, "asyncio is unavailable")
+class _AsyncMixin(object):
+    def setUp(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.addCleanup(loop.close)
+        self.run_until_complete = loop.run_until_complete
+
+        self.sync = self.FS()
+        tempdir = self.sync.temporary_directory()
+        self.addCleanup(self.sync.remove, tempdir)
+        self.fs = self.wrap(self.sync)
+        self.tempdir = self.sync.realpath(tempdir)
+
+    def test_get_set_contents(self):
+        path = self.tempdir / "file"
+        self.run_until_complete(self.fs.set_contents(path, u"some things"))
+        self.assertEqual(
+            self.run_until_complete(self.fs.get_contents(path)),
+            u"some things",
+        )
+        self.assertEqual(self.sync.get_contents(path), u"some things")
+
+    def test_called_without_a_current_loop(self):
+        asyncio.set_event_loop(None)
+        exists = self.fs.exists(self.tempdir)
+        self.assertTrue(self.run_until_complete(exists))
+
+    def test_errors_are_raised_when_awaited(self):
+        future = self.fs.stat(self.tempdir / "missing")
+        with self.assertRaises(exceptions.FileNotFound):
+            self.run_until_complete(future)
+
+    def test_list_directory(self):
+        self.sync.touch(self.tempdir / "a")
+        self.sync.create_directory(self.tempdir / "b")
+        self.assertEqual(
+            set(self.run_until_complete(self.fs.list_directory(self.tempdir))),
+            {"a", "b"},
+        )
+
+    def test_predicates(self):
+        self.sync.touch(self.tempdir / "file")
+        self.assertEqual(
+            [
+                self.run_until_complete(self.fs.exists(self.tempdir / "file")),
+                self.run_until_complete(self.fs.is_dir(self.tempdir / "file")),
+            ],
+            [True, False],
+        )
+
+    def test_open_write_and_read(self):
+        path = self.tempdir / "file"
+        file = self.run_until_complete(self.fs.open(path, mode="wb"))
+        self.run_until_complete(file.__aenter__())
+        self.run_until_complete(file.write(b"some\nthings\n"))
+        self.run_until_complete(file.__aexit__(None, None, None))
+        self.assertTrue(file.closed)
+
+        file = self.run_until_complete(self.fs.open(path, mode="rb"))
+        self.addCleanup(lambda: self.run_until_complete(file.close()))
+        self.assertEqual(
+            self.run_until_complete(file.read(4)),
+            b"some",
+        )
+        self.run_until_complete(file.seek(0))
+        lines = file.__aiter__()
+        self.assertEqual(
+            [
+                self.run_until_complete(lines.__anext__()),
+                self.run_until_complete(lines.__anext__()),
+            ],
+            [b"some\n", b"things\n"],
+        )
+        with self.assertRaises(StopAsyncIteration):
+            self.run_until_complete(lines.__anext__())
+
+    def test_create(self):
+        path = self.tempdir / "file"
+        file = self.run_until_complete(self.fs.create(path))
+        self.run_until_complete(file.write(u"contents"))
+        self.run_until_complete(file.close())
+        self.assertEqual(self.sync.get_contents(path), u"contents")
+
+    def test_walk(self):
+        self.sync.create_directory(self.tempdir / "dir")
+        self.sync.touch(self.tempdir / "dir" / "file")
+
+        walk = self.fs.walk(self.tempdir).__aiter__()
+        walked = []
+        while True:
+            try:
+                walked.append(self.run_until_complete(walk.__anext__()))
+            except StopAsyncIteration:
+                break
+
+        self.assertEqual(
+            walked,
+            [
+                (self.tempdir, ["dir"], []),
+                (self.tempdir / "dir", [], ["file"]),
+            ],
+        )
+
+    def test_iter_lines(self):
+        self.sync.set_contents(self.tempdir / "file", u"one\ntwo\n")
+
+        lines = self.fs.iter_lines(self.tempdir / "file").__aiter__()
+        self.assertEqual(
+            [
+                self.run_until_complete(lines.__anext__()),
+                self.run_until_complete(lines.__anext__()),
+            ],
+            [u"one\n", u"two\n"],
+        )
+        with self.assertRaises(StopAsyncIteration):
+            self.run_until_complete(lines.__anext__())
+
+    def test_walk_missing_is_raised_when_awaited(self):
+        walk = self.fs.walk(self.tempdir / "missing").__aiter__()
+        with self.assertRaises(exceptions.FileNotFound):
+            self.run_until_complete(walk.__anext__())
+
+    def test_removing(self):
+        path = self.tempdir / "dir"
+        removing = self.fs.removing(path)
+        self.assertEqual(self.run_until_complete(removing.__aenter__()), path)
+        self.sync.create_directory(path)
+        self.sync.touch(path / "file")
+        self.run_until_complete(removing.__aexit__(None, None, None))
+        self.assertFalse(self.sync.exists(path))
+
+
+class TestAsyncNative(_AsyncMixin, TestCase):
+    FS = native.FS
+
+    def wrap(self, fs):
+        executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        return aio.FS(fs=fs, executor=executor)
+
+
+@skipIf(aio is None, "asyncio is unavailable")
+class TestAsyncDefaultExecutor(TestCase):
+    def test_shared(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        threads = threading.active_count()
+        for _ in range(3 * aio._MAX_WORKERS):
+            wrapped = aio.FS(fs=fs)
+            self.assertTrue(loop.run_until_complete(wrapped.exists(tempdir)))
+        self.assertLessEqual(
+            threading.active_count(),
+            threads + aio._MAX_WORKERS,
+        )
+
+
+class TestAsyncMemory(_AsyncMixin, TestCase):
+    FS = memory.FS
+
+    def wrap(self, fs):
+        return aio.FS(fs=fs, inline=True)
+
+    def test_completed_inline(self):
+        future = self.fs.stat(self.tempdir)
+        self.assertTrue(future.done())
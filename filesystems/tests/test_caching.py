@@ -0,0 +1,208 @@
+from unittest import TestCase
+
+from filesystems import Path, caching, exceptions, memory, native
+from filesystems.tests.common import (
+    TestFS,
+    InvalidModeMixin,
+    NonExistentChildMixin,
+    OpenFileMixin,
+    OpenAppendNonExistingFileMixin,
+    OpenWriteNonExistingFileMixin,
+    SymbolicLoopMixin,
+    WriteLinesMixin,
+)
+
+
+def CachingMemoryFS():
+    return caching.FS(fs=memory.FS())
+
+
+def CachingNativeFS():
+    return caching.FS(fs=native.FS())
+
+
+class TestCachingMemory(TestFS, TestCase):
+    FS = staticmethod(CachingMemoryFS)
+
+
+class TestCachingNative(TestFS, TestCase):
+    FS = staticmethod(CachingNativeFS)
+
+
+class TestCachingInvalidMode(InvalidModeMixin, TestCase):
+    FS = staticmethod(CachingMemoryFS)
+
+
+class TestCachingOpenFile(OpenFileMixin, TestCase):
+    FS = staticmethod(CachingMemoryFS)
+
+
+class TestCachingOpenWriteNonExistingFile(
+    OpenWriteNonExistingFileMixin,
+    TestCase,
+):
+    FS = staticmethod(CachingMemoryFS)
+
+
+class TestCachingOpenAppendNonExistingFile(
+    OpenAppendNonExistingFileMixin,
+    TestCase,
+):
+    FS = staticmethod(CachingMemoryFS)
+
+
+class TestCachingWriteLines(WriteLinesMixin, TestCase):
+    FS = staticmethod(CachingMemoryFS)
+
+
+class TestNonExistentChild(NonExistentChildMixin, TestCase):
+    FS = staticmethod(CachingMemoryFS)
+
+
+class TestSymbolicLoops(SymbolicLoopMixin, TestCase):
+    FS = staticmethod(CachingMemoryFS)
+
+
+class _Clock(object):
+    now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCaching(TestCase):
+    def setUp(self):
+        self.wrapped = memory.FS()
+        self.clock = _Clock()
+
+    def test_caches_stat(self):
+        fs = caching.FS(fs=self.wrapped)
+        fs.touch(Path("file"))
+        self.assertTrue(fs.exists(Path("file")))
+
+        self.wrapped.remove_file(Path("file"))
+        self.assertTrue(fs.exists(Path("file")))
+
+    def test_caches_errors(self):
+        fs = caching.FS(fs=self.wrapped)
+        self.assertFalse(fs.exists(Path("file")))
+
+        self.wrapped.touch(Path("file"))
+        self.assertFalse(fs.exists(Path("file")))
+
+        with self.assertRaises(exceptions.FileNotFound):
+            fs.stat(Path("file"))
+
+    def test_caches_list_directory(self):
+        fs = caching.FS(fs=self.wrapped)
+        fs.create_directory(Path("dir"))
+        self.assertEqual(set(fs.list_directory(Path("dir"))), set())
+
+        self.wrapped.touch(Path("dir", "file"))
+        self.assertEqual(set(fs.list_directory(Path("dir"))), set())
+
+    def test_mutations_invalidate(self):
+        fs = caching.FS(fs=self.wrapped)
+        fs.create_directory(Path("dir"))
+        self.assertEqual(set(fs.list_directory(Path("dir"))), set())
+        self.assertFalse(fs.exists(Path("dir", "file")))
+
+        fs.touch(Path("dir", "file"))
+        self.assertEqual(
+            (
+                set(fs.list_directory(Path("dir"))),
+                fs.exists(Path("dir", "file")),
+            ),
+            ({"file"}, True),
+        )
+
+    def test_mutations_through_links_invalidate(self):
+        fs = caching.FS(fs=self.wrapped)
+        fs.create_directory(Path("source"))
+        fs.link(source=Path("source"), to=Path("link"))
+        self.assertFalse(fs.exists(Path("link", "file")))
+
+        fs.touch(Path("source", "file"))
+        self.assertTrue(fs.exists(Path("link", "file")))
+
+    def test_reading_does_not_invalidate(self):
+        fs = caching.FS(fs=self.wrapped)
+        fs.touch(Path("file"))
+        self.assertTrue(fs.exists(Path("file")))
+
+        self.wrapped.remove_file(Path("file"))
+        self.wrapped.create_directory(Path("file"))
+        with self.assertRaises(exceptions.IsADirectory):
+            fs.get_contents(Path("file"))
+        self.assertFalse(fs.is_dir(Path("file")))
+
+    def test_ttl(self):
+        fs = caching.FS(fs=self.wrapped, ttl=10, clock=self.clock)
+        self.assertFalse(fs.exists(Path("file")))
+
+        self.wrapped.touch(Path("file"))
+        self.clock.now = 9
+        self.assertFalse(fs.exists(Path("file")))
+
+        self.clock.now = 10
+        self.assertTrue(fs.exists(Path("file")))
+
+    def test_maxsize(self):
+        fs = caching.FS(fs=self.wrapped, maxsize=1)
+        self.assertFalse(fs.exists(Path("a")))
+        self.assertFalse(fs.exists(Path("b")))
+
+        self.wrapped.touch(Path("a"))
+        self.wrapped.touch(Path("b"))
+        self.assertEqual(
+            (fs.exists(Path("b")), fs.exists(Path("a"))),
+            (False, True),
+        )
+
+    def test_disabled(self):
+        fs = caching.FS(fs=self.wrapped, maxsize=0)
+        self.assertFalse(fs.exists(Path("file")))
+
+        self.wrapped.touch(Path("file"))
+        self.assertTrue(fs.exists(Path("file")))
+
+    def test_writing_invalidates(self):
+        native_fs = native.FS()
+        tempdir = native_fs.temporary_directory()
+        self.addCleanup(native_fs.remove, tempdir)
+
+        fs = caching.FS(fs=native_fs)
+        with fs.open(tempdir / "file", mode="wb") as file:
+            file.write(b"12345")
+            file.flush()
+            self.assertEqual(fs.stat(tempdir / "file").st_size, 5)
+            file.write(b"678")
+            file.flush()
+            self.assertEqual(fs.stat(tempdir / "file").st_size, 8)
+
+    def test_closing_invalidates(self):
+        native_fs = native.FS()
+        tempdir = native_fs.temporary_directory()
+        self.addCleanup(native_fs.remove, tempdir)
+
+        fs = caching.FS(fs=native_fs)
+        with fs.open(tempdir / "file", mode="wb") as file:
+            file.write(b"12345")
+            # Still buffered, so not yet written to the file itself.
+            self.assertEqual(fs.stat(tempdir / "file").st_size, 0)
+        self.assertEqual(fs.stat(tempdir / "file").st_size, 5)
+
+    def test_invalidating_drops_values_being_computed(self):
+        cache = caching._Cache(ttl=None, maxsize=10, clock=self.clock)
+
+        def invalidated_while_computing():
+            cache.clear()
+            return "stale"
+
+        self.assertEqual(
+            (
+                cache.get(key="key", compute=invalidated_while_computing),
+                cache.get(key="key", compute=lambda: "fresh"),
+            ),
+            ("stale", "fresh"),
+        )
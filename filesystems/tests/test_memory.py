@@ -1,8 +1,15 @@
+from io import BytesIO
+from threading import Event, Thread
 from unittest import TestCase
+import itertools
+import os
+import tarfile
+import tempfile
 
 from pyrsistent import s
 
-from filesystems import Path, memory
+from filesystems import Path, exceptions, memory, native
+from filesystems._path import RelativePath
 from filesystems.tests.common import (
     TestFS,
     InvalidModeMixin,
@@ -66,3 +73,862 @@ class TestNonExistentChild(NonExistentChildMixin, TestCase):
 
 class TestSymbolicLoops(SymbolicLoopMixin, TestCase):
     FS = staticmethod(memory.FS)
+
+
+class TestMemoryRealpathCache(TestCase):
+    def test_resolved_prefixes_are_remembered(self):
+        fs = memory.FS()
+        fs.create_directory(Path("source"))
+        fs.touch(Path("source", "file"))
+        fs.link(source=Path("source"), to=Path("link"))
+        fs.realpath(Path("link", "file"))
+        self.assertEqual(
+            fs._realpaths,
+            {
+                ("link",): Path("source"),
+                ("source",): Path("source"),
+                ("link", "file"): Path("source", "file"),
+            },
+        )
+
+    def test_missing_prefixes_are_not_remembered(self):
+        fs = memory.FS()
+        fs.create_directory(Path("directory"))
+        fs.realpath(Path("directory", "missing", "child"))
+        self.assertEqual(fs._realpaths, {("directory",): Path("directory")})
+
+    def test_removing_forgets(self):
+        fs = memory.FS()
+        fs.touch(Path("file"))
+        fs.realpath(Path("file"))
+        fs.remove_file(Path("file"))
+        self.assertEqual(fs._realpaths, {})
+
+
+class TestMemoryLinkResolution(TestCase):
+    def test_links_are_not_resolved_again_until_the_tree_changes(self):
+        fs = memory.FS()
+        fs.create_directory(Path("source"))
+        fs.touch(Path("source", "file"))
+        fs.link(source=Path("source"), to=Path("link"))
+
+        calls = []
+        realpath = fs.realpath
+        fs.realpath = lambda *args, **kwargs: (
+            calls.append(args or kwargs) or realpath(*args, **kwargs)
+        )
+
+        fs.stat(Path("link", "file"))
+        fs.stat(Path("link", "file"))
+        fs.get_contents(Path("link", "file"))
+        self.assertEqual(len(calls), 1)
+
+        fs.touch(Path("source", "other"))
+        fs.stat(Path("link", "other"))
+        self.assertEqual(len(calls), 2)
+
+    def test_relinking(self):
+        fs = memory.FS()
+        fs.create_directory(Path("first"))
+        fs.create_directory(Path("second"))
+        fs.touch(Path("second", "file"))
+        fs.link(source=Path("first"), to=Path("link"))
+        self.assertFalse(fs.exists(Path("link", "file")))
+
+        fs.remove_file(Path("link"))
+        fs.link(source=Path("second"), to=Path("link"))
+        self.assertTrue(fs.exists(Path("link", "file")))
+
+    def test_dangling_link_target_created(self):
+        fs = memory.FS()
+        fs.link(source=Path("source"), to=Path("link"))
+        self.assertFalse(fs.exists(Path("link")))
+
+        fs.touch(Path("source"))
+        self.assertTrue(fs.exists(Path("link")))
+
+
+class TestMemoryReading(TestCase):
+    def setUp(self):
+        self.fs = memory.FS()
+        self.path = Path("file")
+        self.fs.set_contents(self.path, b"one\ntwo\nthree", mode="b")
+
+    def test_get_contents_shares_contents(self):
+        self.assertIs(
+            self.fs.get_contents(self.path, mode="b"),
+            self.fs.get_contents(self.path, mode="b"),
+        )
+
+    def test_get_contents_through_link(self):
+        self.fs.link(source=self.path, to=Path("link"))
+        self.assertIs(
+            self.fs.get_contents(Path("link"), mode="b"),
+            self.fs.get_contents(self.path, mode="b"),
+        )
+
+    def test_get_contents_directory(self):
+        self.fs.create_directory(Path("dir"))
+        with self.assertRaises(exceptions.IsADirectory):
+            self.fs.get_contents(Path("dir"), mode="b")
+
+    def test_readers_share_contents(self):
+        with self.fs.open(self.path, mode="rb") as one:
+            with self.fs.open(self.path, mode="rb") as two:
+                self.assertIs(one.read(), two.read())
+
+    def test_iter_chunks_shares_contents(self):
+        chunks = list(self.fs.iter_chunks(self.path, size=4))
+        contents = self.fs.get_contents(self.path, mode="b")
+        self.assertEqual(
+            ([chunk.obj is contents for chunk in chunks], b"".join(chunks)),
+            ([True] * 4, contents),
+        )
+
+    def test_mmap_shares_contents(self):
+        with self.fs.mmap(self.path) as mapped:
+            self.assertIs(
+                mapped.obj,
+                self.fs.get_contents(self.path, mode="b"),
+            )
+
+    def test_getbuffer(self):
+        with self.fs.open(self.path, mode="rb") as file:
+            buffer = file.getbuffer()
+            self.assertEqual(
+                (buffer.readonly, buffer[4:7].tobytes()),
+                (True, b"two"),
+            )
+
+    def test_partial_reads(self):
+        with self.fs.open(self.path, mode="rb") as file:
+            self.assertEqual(
+                [file.read(2), file.read(3), file.read(), file.read()],
+                [b"on", b"e\nt", b"wo\nthree", b""],
+            )
+
+    def test_readinto(self):
+        buffer = bytearray(5)
+        with self.fs.open(self.path, mode="rb") as file:
+            self.assertEqual(
+                [
+                    (file.readinto(buffer), bytes(buffer)),
+                    (file.readinto(buffer), bytes(buffer)),
+                    (file.readinto(buffer), bytes(buffer)),
+                ],
+                [(5, b"one\nt"), (5, b"wo\nth"), (3, b"reeth")],
+            )
+
+    def test_readlines(self):
+        with self.fs.open(self.path, mode="rb") as file:
+            self.assertEqual(list(file), [b"one\n", b"two\n", b"three"])
+
+    def test_readline_size(self):
+        with self.fs.open(self.path, mode="rb") as file:
+            self.assertEqual(
+                [file.readline(2), file.readline(), file.readline(10)],
+                [b"on", b"e\n", b"two\n"],
+            )
+
+    def test_seek_and_tell(self):
+        with self.fs.open(self.path, mode="rb") as file:
+            file.seek(-5, os.SEEK_END)
+            self.assertEqual((file.tell(), file.read()), (8, b"three"))
+
+    def test_read_closed(self):
+        file = self.fs.open(self.path, mode="rb")
+        file.close()
+        with self.assertRaises(ValueError):
+            file.read()
+
+    def test_text(self):
+        with self.fs.open(self.path, mode="rt") as file:
+            self.assertEqual(file.readlines(), ["one\n", "two\n", "three"])
+
+
+class TestMemoryWriting(TestCase):
+    def setUp(self):
+        self.fs = memory.FS()
+        self.path = Path("file")
+
+    def test_visible_before_closing(self):
+        with self.fs.open(self.path, mode="wb") as file:
+            file.write(b"some ")
+            file.write(b"things")
+            self.assertEqual(
+                self.fs.get_contents(self.path, "b"),
+                b"some things",
+            )
+
+    def test_many_appends(self):
+        for i in range(100):
+            with self.fs.open(self.path, mode="ab") as file:
+                file.write(("%d\n" % (i,)).encode("ascii"))
+        self.assertEqual(
+            self.fs.get_contents(self.path, "b"),
+            b"".join(("%d\n" % (i,)).encode("ascii") for i in range(100)),
+        )
+
+    def test_append_ignores_seeks(self):
+        self.fs.set_contents(self.path, b"some ", mode="b")
+        with self.fs.open(self.path, mode="ab") as file:
+            file.seek(0)
+            file.write(b"things")
+        self.assertEqual(self.fs.get_contents(self.path, "b"), b"some things")
+
+    def test_overwrite(self):
+        with self.fs.open(self.path, mode="wb") as file:
+            file.write(b"some things")
+            file.seek(5)
+            file.write(b"THING")
+            file.seek(0, os.SEEK_END)
+            file.write(b"!")
+        self.assertEqual(self.fs.get_contents(self.path, "b"), b"some THINGs!")
+
+    def test_seek_past_the_end(self):
+        with self.fs.open(self.path, mode="wb") as file:
+            file.write(b"a")
+            file.seek(3)
+            file.write(b"b")
+        self.assertEqual(self.fs.get_contents(self.path, "b"), b"a\0\0b")
+
+    def test_truncate(self):
+        with self.fs.open(self.path, mode="wb") as file:
+            file.write(b"some things")
+            file.truncate(4)
+            self.assertEqual(file.tell(), 11)
+        self.assertEqual(self.fs.get_contents(self.path, "b"), b"some")
+
+    def test_write_closed(self):
+        file = self.fs.open(self.path, mode="wb")
+        file.close()
+        with self.assertRaises(ValueError):
+            file.write(b"nope")
+
+    def test_later_writer_wins(self):
+        first = self.fs.open(self.path, mode="wb")
+        second = self.fs.open(self.path, mode="wb")
+        second.write(b"second")
+        second.close()
+        first.write(b"first")
+        first.close()
+        self.assertEqual(self.fs.get_contents(self.path, "b"), b"second")
+
+
+class TestChunks(TestCase):
+    def test_append_shares_chunks(self):
+        original = memory._Chunks().append(b"some ")
+        appended = original.append(b"things")
+        self.assertEqual(
+            (original.bytes, original.size, appended.bytes, appended.size),
+            (b"some ", 5, b"some things", 11),
+        )
+
+    def test_joined_once(self):
+        chunks = memory._Chunks().append(b"a").append(b"b")
+        self.assertIs(chunks.bytes, chunks.bytes)
+
+    def test_empty(self):
+        self.assertEqual(memory._Chunks().bytes, b"")
+
+
+class TestMemoryStat(TestCase):
+    def setUp(self):
+        # A clock which ticks once each time it's read, so that every change
+        # is strictly later than the last.
+        ticks = itertools.count(1)
+        self.addCleanup(setattr, memory, "_clock", memory._clock)
+        memory._clock = lambda: next(ticks)
+
+        self.fs = memory.FS()
+
+    def test_size_while_writing(self):
+        with self.fs.open(Path("file"), mode="wb") as file:
+            file.write(b"some things")
+            self.assertEqual(self.fs.stat(Path("file")).st_size, 11)
+
+    def test_write_updates_modified_time(self):
+        self.fs.touch(Path("file"))
+        before = self.fs.stat(Path("file"))
+        with self.fs.open(Path("file"), mode="ab") as file:
+            file.write(b"more")
+            after = self.fs.stat(Path("file"))
+        self.assertEqual(
+            (
+                after.st_mtime_ns > before.st_mtime_ns,
+                after.st_ctime_ns > before.st_ctime_ns,
+                after.st_mtime == after.st_mtime_ns / 10 ** 9,
+            ),
+            (True, True, True),
+        )
+
+    def test_directory_link_count(self):
+        self.fs.create_directory(Path("dir"))
+        self.fs.create_directory(Path("dir", "one"))
+        self.fs.create_directory(Path("dir", "two"))
+        self.fs.touch(Path("dir", "file"))
+        self.fs.remove_empty_directory(Path("dir", "two"))
+        self.assertEqual(self.fs.stat(Path("dir")).st_nlink, 3)
+
+    def test_directory_modified_by_new_children(self):
+        self.fs.create_directory(Path("dir"))
+        before = self.fs.stat(Path("dir"))
+        self.fs.touch(Path("dir", "file"))
+        after = self.fs.stat(Path("dir"))
+        self.assertEqual(
+            (
+                after.st_mtime_ns > before.st_mtime_ns,
+                after.st_ctime_ns > before.st_ctime_ns,
+            ),
+            (True, True),
+        )
+
+
+class TestMemorySnapshot(TestCase):
+    def setUp(self):
+        self.fs = memory.FS()
+        self.fs.create_directory(Path("dir"))
+        self.fs.set_contents(Path("dir", "file"), u"contents")
+        self.fs.link(source=Path("dir"), to=Path("link"))
+
+    def test_fork_sees_everything(self):
+        fork = self.fs.fork()
+        self.assertEqual(
+            (
+                fork.get_contents(Path("link", "file")),
+                fork.readlink(Path("link")),
+                fork.stat(Path("dir")).st_nlink,
+            ),
+            (u"contents", Path("dir"), 2),
+        )
+
+    def test_fork_shares_contents(self):
+        fork = self.fs.fork()
+        self.assertIs(
+            fork.get_contents(Path("dir", "file"), mode="b"),
+            self.fs.get_contents(Path("dir", "file"), mode="b"),
+        )
+
+    def test_changes_to_a_fork_are_independent(self):
+        fork = self.fs.fork()
+        fork.set_contents(Path("link", "file"), u"changed")
+        fork.touch(Path("dir", "new"))
+        fork.remove_file(Path("link"))
+        self.assertEqual(
+            (
+                self.fs.get_contents(Path("link", "file")),
+                self.fs.exists(Path("dir", "new")),
+                fork.get_contents(Path("dir", "file")),
+                fork.exists(Path("link")),
+            ),
+            (u"contents", False, u"changed", False),
+        )
+
+    def test_changes_to_the_original_are_independent(self):
+        fork = self.fs.fork()
+        self.fs.remove_file(Path("dir", "file"))
+        self.fs.create_directory(Path("dir", "child"))
+        self.assertEqual(
+            (
+                fork.children(Path("dir")),
+                fork.stat(Path("dir")).st_nlink,
+            ),
+            (s(Path("dir", "file")), 2),
+        )
+
+    def test_links_resolve_within_their_own_fork(self):
+        fork = self.fs.fork()
+        fork.remove_file(Path("link"))
+        fork.create_directory(Path("other"))
+        fork.link(source=Path("other"), to=Path("link"))
+        self.assertEqual(
+            (
+                self.fs.list_directory(Path("link")),
+                fork.list_directory(Path("link")),
+            ),
+            (s("file"), s()),
+        )
+
+    def test_snapshot_forks_are_independent(self):
+        snapshot = self.fs.snapshot()
+        one, two = snapshot.fork(), snapshot.fork()
+        one.touch(Path("dir", "one"))
+        two.touch(Path("dir", "two"))
+        self.fs.touch(Path("dir", "three"))
+        self.assertEqual(
+            (
+                one.list_directory(Path("dir")),
+                two.list_directory(Path("dir")),
+                snapshot.fork().list_directory(Path("dir")),
+            ),
+            (s("file", "one"), s("file", "two"), s("file")),
+        )
+
+    def test_open_writer(self):
+        with self.fs.open(Path("dir", "file"), mode="ab") as file:
+            file.write(b" and")
+            fork = self.fs.fork()
+            file.write(b" more")
+        self.assertEqual(
+            (
+                self.fs.get_contents(Path("dir", "file")),
+                fork.get_contents(Path("dir", "file")),
+            ),
+            (u"contents and more", u"contents and"),
+        )
+
+    def test_fork_of_a_fork(self):
+        fork = self.fs.fork()
+        fork.touch(Path("dir", "new"))
+        grandchild = fork.fork()
+        grandchild.remove_file(Path("dir", "new"))
+        self.assertEqual(
+            (
+                self.fs.list_directory(Path("dir")),
+                fork.list_directory(Path("dir")),
+                grandchild.list_directory(Path("dir")),
+            ),
+            (s("file"), s("file", "new"), s("file")),
+        )
+
+    def test_native_filesystems_cannot_fork(self):
+        self.assertFalse(hasattr(native.FS(), "fork"))
+
+
+class TestMemoryCopyingAndMoving(TestCase):
+    def setUp(self):
+        self.fs = memory.FS()
+        self.fs.create_directory(Path("dir"))
+        self.fs.set_contents(Path("dir", "file"), u"contents")
+
+    def test_copy_shares_contents(self):
+        self.fs.copy(source=Path("dir", "file"), destination=Path("copy"))
+        self.assertIs(
+            self.fs.get_contents(Path("copy"), mode="b"),
+            self.fs.get_contents(Path("dir", "file"), mode="b"),
+        )
+
+    def test_copytree_with_an_open_writer(self):
+        with self.fs.open(Path("dir", "file"), mode="ab") as file:
+            file.write(b" and")
+            self.fs.copytree(source=Path("dir"), destination=Path("copy"))
+            file.write(b" more")
+        self.assertEqual(
+            (
+                self.fs.get_contents(Path("dir", "file")),
+                self.fs.get_contents(Path("copy", "file")),
+            ),
+            (u"contents and more", u"contents and"),
+        )
+
+    def test_move_keeps_nodes(self):
+        inode = self.fs.stat(Path("dir", "file")).st_ino
+        self.fs.move(source=Path("dir"), destination=Path("moved"))
+        self.assertEqual(self.fs.stat(Path("moved", "file")).st_ino, inode)
+
+    def test_move_after_a_snapshot(self):
+        snapshot = self.fs.snapshot()
+        self.fs.move(source=Path("dir"), destination=Path("moved"))
+        self.fs.touch(Path("moved", "new"))
+        fork = snapshot.fork()
+        self.assertEqual(
+            (
+                fork.list_directory(Path("dir")),
+                fork.exists(Path("moved")),
+                self.fs.list_directory(Path("moved")),
+            ),
+            (s("file"), False, s("file", "new")),
+        )
+
+
+class TestMemoryBulkLoading(TestCase):
+    tree = {
+        "dir": {
+            "file": b"contents",
+            "text": u"text",
+            "empty": {},
+            "relative": RelativePath("file"),
+        },
+        "link": Path("dir"),
+    }
+
+    def assertLoaded(self, fs):
+        self.assertEqual(
+            (
+                fs.list_directory(Path("dir")),
+                fs.get_contents(Path("link", "file"), mode="b"),
+                fs.get_contents(Path("dir", "text")),
+                fs.get_contents(Path("dir", "relative"), mode="b"),
+                fs.is_dir(Path("dir", "empty")),
+                fs.readlink(Path("link")),
+                fs.stat(Path("dir")).st_nlink,
+            ),
+            (
+                s("file", "text", "empty", "relative"),
+                b"contents",
+                u"text",
+                b"contents",
+                True,
+                Path("dir"),
+                3,
+            ),
+        )
+
+    def test_from_mapping(self):
+        self.assertLoaded(memory.from_mapping(self.tree))
+
+    def test_from_mapping_is_mutable(self):
+        fs = memory.from_mapping(self.tree)
+        fs.touch(Path("dir", "empty", "new"))
+        fs.remove_file(Path("dir", "file"))
+        self.assertEqual(
+            (
+                fs.children(Path("dir", "empty")),
+                fs.exists(Path("dir", "file")),
+            ),
+            (s(Path("dir", "empty", "new")), False),
+        )
+
+    def test_from_mapping_invalid(self):
+        with self.assertRaises(TypeError):
+            memory.from_mapping({"file": 12})
+
+    def tarball(self, *members):
+        """
+        A tarball of the given (name, contents, attributes) members.
+        """
+
+        contents = BytesIO()
+        with tarfile.open(fileobj=contents, mode="w:gz") as tar:
+            for name, data, attributes in members:
+                info = tarfile.TarInfo(name)
+                for key, value in attributes.items():
+                    setattr(info, key, value)
+                if data is not None:
+                    info.size = len(data)
+                    data = BytesIO(data)
+                tar.addfile(info, data)
+        contents.seek(0)
+        return contents
+
+    def test_from_tar(self):
+        contents = self.tarball(
+            ("./dir", None, dict(type=tarfile.DIRTYPE)),
+            ("dir/file", b"contents", {}),
+            ("dir/text", b"text", {}),
+            ("dir/empty/", None, dict(type=tarfile.DIRTYPE)),
+            (
+                "dir/relative",
+                None,
+                dict(type=tarfile.SYMTYPE, linkname="file"),
+            ),
+            ("link", None, dict(type=tarfile.SYMTYPE, linkname="/dir")),
+            ("hard", None, dict(type=tarfile.LNKTYPE, linkname="dir/file")),
+            ("fifo", None, dict(type=tarfile.FIFOTYPE)),
+        )
+
+        fs = memory.from_tar(contents)
+        self.assertLoaded(fs)
+        self.assertEqual(
+            (fs.get_contents(Path("hard"), mode="b"), fs.exists(Path("fifo"))),
+            (b"contents", False),
+        )
+
+    def test_from_tar_parent_segments(self):
+        contents = self.tarball(("dir/../../escaped", b"contents", {}))
+        with self.assertRaises(exceptions.InvalidPath):
+            memory.from_tar(contents)
+
+    def test_from_tar_member_beneath_file(self):
+        contents = self.tarball(
+            ("file", b"contents", {}),
+            ("file/child", b"contents", {}),
+        )
+        with self.assertRaises(exceptions.NotADirectory):
+            memory.from_tar(contents)
+
+    def test_native_round_trip(self):
+        root = Path.from_string(tempfile.mkdtemp())
+        self.addCleanup(native.FS().remove, root)
+
+        memory.dump_to_native(memory.from_mapping(self.tree), root / "tree")
+        native_fs = native.FS()
+        self.assertEqual(
+            (
+                native_fs.readlink(root / "tree" / "link"),
+                native_fs.get_contents(root / "tree" / "link" / "relative"),
+            ),
+            (root / "tree" / "dir", u"contents"),
+        )
+        self.assertLoaded(memory.from_native(root / "tree"))
+
+    def test_from_native_skips_removed_children(self):
+        root = Path.from_string(tempfile.mkdtemp())
+        self.addCleanup(native.FS().remove, root)
+        memory.dump_to_native(memory.from_mapping(self.tree), root)
+
+        scandir = native._scandir
+
+        def removing_file_once_listed(path):
+            entries = scandir(path=path)
+            if path == root / "dir":
+                native.FS().remove_file(root / "dir" / "file")
+            return entries
+
+        native._scandir = removing_file_once_listed
+        self.addCleanup(setattr, native, "_scandir", scandir)
+
+        fs = memory.from_native(root)
+        self.assertEqual(
+            fs.list_directory(Path("dir")),
+            s("text", "empty", "relative"),
+        )
+
+
+class TestMemoryIndexed(TestFS, TestCase):
+    FS = staticmethod(lambda: memory.FS(index=True))
+
+
+class TestMemoryIndexedSymbolicLoops(SymbolicLoopMixin, TestCase):
+    FS = staticmethod(lambda: memory.FS(index=True))
+
+
+class TestMemoryIndex(TestCase):
+    def setUp(self):
+        self.state = memory._State(index={})
+        self.fs = self.state.FS(name="MemoryFS")
+        self.fs.create_directory(Path("dir"))
+        self.fs.set_contents(Path("dir", "file"), u"contents")
+        self.fs.link(source=Path("dir"), to=Path("link"))
+
+    def test_lookups_are_remembered(self):
+        self.fs.stat(Path("dir", "file"))
+        self.fs.stat(Path("link", "file"))
+        self.assertEqual(
+            set(self.state._index),
+            {("dir",), ("dir", "file")},
+        )
+
+    def test_replaced(self):
+        self.fs.stat(Path("dir", "file"))
+        self.fs.remove_file(Path("link", "file"))
+        self.fs.create_directory(Path("dir", "file"))
+        self.assertTrue(self.fs.is_dir(Path("dir", "file")))
+
+    def test_copied_by_a_fork(self):
+        self.fs.stat(Path("dir", "file"))
+        fork = self.fs.fork()
+        self.fs.set_contents(Path("link", "file"), u"changed")
+        fork.remove_file(Path("link", "file"))
+        self.assertEqual(
+            (
+                self.fs.get_contents(Path("dir", "file")),
+                fork.exists(Path("dir", "file")),
+            ),
+            (u"changed", False),
+        )
+
+    def test_forks_are_indexed(self):
+        snapshot = self.state.snapshot()
+        self.assertEqual(
+            (snapshot._index, memory._State().snapshot()._index),
+            (True, False),
+        )
+
+
+class TestMemoryMisses(TestCase):
+    def setUp(self):
+        self.state = memory._State()
+        self.fs = self.state.FS(name="MemoryFS")
+        self.fs.create_directory(Path("dir"))
+        self.fs.touch(Path("dir", "file"))
+
+    def test_misses_share_one_node(self):
+        self.assertEqual(
+            (
+                self.state[Path("dir", "missing")],
+                self.state[Path("missing", "deeper", "still")],
+                self.state[Path("dir", "file", "child", "grandchild")],
+            ),
+            (memory._MISSING, memory._MISSING, memory._FILE_CHILD),
+        )
+
+    def test_misses_are_not_created(self):
+        self.assertFalse(self.fs.exists(Path("dir", "missing", "child")))
+        self.assertEqual(self.fs.list_directory(Path("dir")), s("file"))
+
+    def test_created_after_a_miss(self):
+        self.assertFalse(self.fs.exists(Path("dir", "new")))
+        self.fs.create_directory(Path("dir", "new"))
+        self.assertTrue(self.fs.is_dir(Path("dir", "new")))
+
+
+class TestMemoryThreadSafe(TestFS, TestCase):
+    FS = staticmethod(lambda: memory.FS(thread_safe=True))
+
+
+class TestMemoryThreadSafeSymbolicLoops(SymbolicLoopMixin, TestCase):
+    FS = staticmethod(lambda: memory.FS(thread_safe=True))
+
+
+class TestMemoryConcurrency(TestCase):
+    def setUp(self):
+        self.fs = memory.FS(thread_safe=True, index=True)
+        self.fs.create_directory(Path("dir"))
+
+    def in_threads(self, fn, count=8):
+        errors = []
+
+        def run(each):
+            try:
+                fn(each)
+            except Exception as error:
+                errors.append(error)
+
+        threads = [Thread(target=run, args=(each,)) for each in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def test_no_lost_children(self):
+        def touch(each):
+            for i in range(200):
+                self.fs.touch(Path("dir", "{}-{}".format(each, i)))
+                self.fs.create_directory(Path("dir", "d{}-{}".format(each, i)))
+
+        self.assertEqual(self.in_threads(touch), [])
+        self.assertEqual(
+            (
+                len(self.fs.list_directory(Path("dir"))),
+                self.fs.stat(Path("dir")).st_nlink,
+            ),
+            (8 * 400, 2 + 8 * 200),
+        )
+
+    def test_creating_the_same_directories(self):
+        def create(each):
+            for i in range(50):
+                self.fs.create_directory(
+                    Path("dir", str(i), "child"),
+                    with_parents=True,
+                )
+
+        errors = self.in_threads(create)
+        self.assertEqual(
+            (
+                len(self.fs.list_directory(Path("dir"))),
+                set(type(error) for error in errors),
+            ),
+            (50, {exceptions.FileExists}),
+        )
+
+    def test_removing_while_creating_within(self):
+        def churn(each):
+            for i in range(200):
+                try:
+                    if each % 2:
+                        self.fs.touch(Path("dir", "sub", str(each)))
+                        self.fs.remove_file(Path("dir", "sub", str(each)))
+                    else:
+                        self.fs.create_directory(Path("dir", "sub"))
+                        self.fs.remove_empty_directory(Path("dir", "sub"))
+                except (
+                    exceptions.FileExists,
+                    exceptions.FileNotFound,
+                    exceptions.DirectoryNotEmpty,
+                ):
+                    pass
+
+        self.assertEqual(self.in_threads(churn), [])
+        if self.fs.exists(Path("dir", "sub")):
+            self.assertEqual(self.fs.list_directory(Path("dir", "sub")), s())
+
+    def test_snapshot_while_writing(self):
+        def write(each):
+            for i in range(100):
+                self.fs.touch(Path("dir", "{}-{}".format(each, i)))
+
+        snapshots = []
+        thread = Thread(
+            target=lambda: snapshots.extend(
+                self.fs.snapshot() for _ in range(20)
+            ),
+        )
+        thread.start()
+        self.assertEqual(self.in_threads(write), [])
+        thread.join()
+
+        sizes = [
+            len(snapshot.fork().list_directory(Path("dir")))
+            for snapshot in snapshots
+        ]
+        self.assertEqual(
+            (sizes, len(self.fs.list_directory(Path("dir")))),
+            (sorted(sizes), 800),
+        )
+
+    def blocked_mutation(self):
+        """
+        Start touching a file through a link in another thread, which then
+        blocks (mid-mutation) until the returned event is set.
+        """
+        self.fs.link(source=Path("dir"), to=Path("link"))
+        entered, release = Event(), Event()
+        realpath = self.fs.realpath
+
+        def blocking(path, **kwargs):
+            if path == Path("link") and not entered.is_set():
+                entered.set()
+                release.wait(10)
+            return realpath(path=path, **kwargs)
+
+        self.fs.realpath = blocking
+        thread = Thread(target=self.fs.touch, args=(Path("link", "file"),))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(release.set)
+        entered.wait(10)
+        return thread, release
+
+    def test_unrelated_mutations_do_not_wait(self):
+        thread, release = self.blocked_mutation()
+        self.fs.create_directory(Path("other"))
+        self.fs.touch(Path("other", "file"))
+        self.assertEqual(
+            (thread.is_alive(), self.fs.exists(Path("other", "file"))),
+            (True, True),
+        )
+
+    def test_snapshots_wait_for_mutations_in_progress(self):
+        thread, release = self.blocked_mutation()
+
+        snapshots = []
+        snapshotting = Thread(
+            target=lambda: snapshots.append(self.fs.snapshot()),
+        )
+        snapshotting.start()
+        snapshotting.join(0.1)
+        waited = snapshotting.is_alive()
+
+        release.set()
+        snapshotting.join()
+        self.assertEqual(
+            (waited, snapshots[0].fork().exists(Path("dir", "file"))),
+            (True, True),
+        )
+
+    def test_forks_are_thread_safe(self):
+        fork = self.fs.fork()
+        self.assertEqual(
+            (
+                fork.snapshot()._thread_safe,
+                memory.FS().snapshot()._thread_safe,
+            ),
+            (True, False),
+        )
+
+    def test_cannot_remove_root(self):
+        with self.assertRaises(exceptions.PermissionError):
+            self.fs.remove_empty_directory(Path.root())
@@ -1,6 +1,11 @@
 from unittest import TestCase
+import errno
+import mmap
+import os
 
-from filesystems import native
+from pyrsistent import s
+
+from filesystems import Path, common, exceptions, native
 from filesystems.tests.common import (
     TestFS,
     NonExistentChildMixin,
@@ -49,3 +54,233 @@ class TestNonExistentChild(NonExistentChildMixin, TestCase):
 
 class TestSymbolicLoops(SymbolicLoopMixin, TestCase):
     FS = native.FS
+
+
+class TestErrorTranslation(TestCase):
+    def translated(self, errno, errors):
+        error = OSError(errno, os.strerror(errno))
+        return native._translate(
+            error=error,
+            path=Path("parent", "child"),
+            errors=errors,
+        )
+
+    def test_path(self):
+        self.assertEqual(
+            self.translated(errno.ENOENT, native._STAT_ERRORS),
+            exceptions.FileNotFound(Path("parent", "child")),
+        )
+
+    def test_parent(self):
+        self.assertEqual(
+            self.translated(errno.ENOENT, native._CREATE_DIRECTORY_ERRORS),
+            exceptions.FileNotFound(Path("parent")),
+        )
+
+    def test_untranslated(self):
+        self.assertIsNone(self.translated(errno.EINVAL, native._STAT_ERRORS))
+
+    def test_untranslated_errors_are_reraised(self):
+        error = OSError(errno.EIO, os.strerror(errno.EIO))
+        try:
+            try:
+                raise error
+            except OSError as caught:
+                native._reraise(
+                    error=caught,
+                    path=Path("path"),
+                    errors=native._STAT_ERRORS,
+                )
+        except OSError as reraised:
+            self.assertIs(reraised, error)
+
+    def test_stat_many_errors(self):
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+        fs.touch(tempdir / "file")
+
+        self.assertEqual(
+            fs.stat_many([tempdir / "missing", tempdir / "file" / "child"]),
+            {
+                tempdir / "missing": exceptions.FileNotFound(
+                    tempdir / "missing",
+                ),
+                tempdir / "file" / "child": exceptions.NotADirectory(
+                    tempdir / "file" / "child",
+                ),
+            },
+        )
+
+    def test_stat_many_untranslated_errors(self):
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+        fs.touch(tempdir / "file")
+
+        too_long = tempdir / ("x" * 1000)
+        stats = fs.stat_many([too_long, tempdir / "file"])
+        self.assertEqual(
+            (
+                stats[too_long].errno,
+                stats[tempdir / "file"].st_size,
+            ),
+            (errno.ENAMETOOLONG, 0),
+        )
+
+    def test_stat_many_untranslated_error_alone(self):
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        too_long = tempdir / ("x" * 1000)
+        stats = fs.stat_many([too_long])
+        self.assertEqual(stats[too_long].errno, errno.ENAMETOOLONG)
+
+
+class TestParallelRemoval(TestCase):
+    def test_failures_propagate(self):
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        directory = tempdir / "directory"
+        for name in "abcd":
+            fs.create_directory(directory / name, with_parents=True)
+            fs.touch(directory / name / "file")
+
+        def partition(fs, path):
+            if path == directory / "c":
+                raise exceptions.PermissionError(path)
+            return native._kinds_of_children(fs=fs, path=path)
+
+        with self.assertRaises(exceptions.PermissionError):
+            common._recursive_remove(
+                fs=fs,
+                path=directory,
+                parallelism=4,
+                partition=partition,
+            )
+        self.assertEqual(
+            fs.children(path=directory / "c"), s(directory / "c" / "file"),
+        )
+
+
+class TestBackendsWithoutParallelism(TestCase):
+    """
+    Backends whose ``remove`` and ``copytree`` don't take a ``parallelism``.
+    """
+
+    def setUp(self):
+        self.calls = []
+        self.fs = common.create(
+            name="SerialFS",
+
+            create_file=native._create_file,
+            open_file=native._open_file,
+            remove_file=native._remove_file,
+
+            create_directory=native._create_directory,
+            list_directory=native._list_directory,
+            remove_empty_directory=native._remove_empty_directory,
+            temporary_directory=native.FS.temporary_directory,
+
+            stat=native._stat,
+
+            lstat=native._lstat,
+            link=native._link,
+            readlink=native._readlink,
+
+            remove=lambda fs, path: self.calls.append(path),
+            copytree=lambda fs, source, destination: self.calls.append(
+                (source, destination),
+            ),
+        )()
+
+    def test_remove(self):
+        self.fs.remove(Path("dir"))
+        self.assertEqual(self.calls, [Path("dir")])
+
+    def test_copytree(self):
+        self.fs.copytree(source=Path("source"), destination=Path("copy"))
+        self.assertEqual(self.calls, [(Path("source"), Path("copy"))])
+
+
+class TestCopy(TestCase):
+    def test_without_kernel_copies(self):
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        copies, native._KERNEL_COPIES = native._KERNEL_COPIES, []
+        self.addCleanup(setattr, native, "_KERNEL_COPIES", copies)
+
+        contents = os.urandom(3 * native._COPY_BUFFER_SIZE // 2)
+        fs.set_contents(tempdir / "source", contents, mode="b")
+        fs.copy(source=tempdir / "source", destination=tempdir / "copy")
+        self.assertEqual(fs.get_contents(tempdir / "copy", mode="b"), contents)
+
+    def test_falling_back_partway(self):
+        """
+        A kernel copy failing part of the way through a file (here after its
+        first chunk) is carried on from there by the next way of copying.
+        """
+
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        def copy_first_chunk(source, destination, offset):
+            if offset:
+                raise OSError(errno.ENOSYS, os.strerror(errno.ENOSYS))
+            os.lseek(source, offset, os.SEEK_SET)
+            return os.write(destination, os.read(source, 1000))
+
+        copies = native._KERNEL_COPIES
+        native._KERNEL_COPIES = [copy_first_chunk] + copies
+        self.addCleanup(setattr, native, "_KERNEL_COPIES", copies)
+
+        size = native._KERNEL_COPY_SIZE
+        native._KERNEL_COPY_SIZE = 4096
+        self.addCleanup(setattr, native, "_KERNEL_COPY_SIZE", size)
+
+        contents = os.urandom(3 * native._COPY_BUFFER_SIZE // 2)
+        fs.set_contents(tempdir / "source", contents, mode="b")
+        fs.copy(source=tempdir / "source", destination=tempdir / "copy")
+        self.assertEqual(fs.get_contents(tempdir / "copy", mode="b"), contents)
+
+    def test_onto_a_hard_link(self):
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        source, hard_link = tempdir / "source", tempdir / "hard_link"
+        fs.set_contents(source, b"contents", mode="b")
+        os.link(str(source), str(hard_link))
+
+        with self.assertRaises(exceptions.SameFile):
+            fs.copy(source=source, destination=hard_link)
+        self.assertEqual(fs.get_contents(source, mode="b"), b"contents")
+
+
+class TestMmap(TestCase):
+    def test_mapped(self):
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "file", b"contents", mode="b")
+        with fs.mmap(tempdir / "file") as mapped:
+            mapping = mapped.obj
+            self.assertIsInstance(mapping, mmap.mmap)
+        self.assertTrue(mapping.closed)
+
+    def test_slice_outliving_the_mapping(self):
+        fs = native.FS()
+        tempdir = fs.temporary_directory()
+        self.addCleanup(fs.remove, tempdir)
+
+        fs.set_contents(tempdir / "file", b"contents", mode="b")
+        with fs.mmap(tempdir / "file") as mapped:
+            head = mapped[:4]
+        self.assertEqual(bytes(head), b"cont")
@@ -1,10 +1,13 @@
 from unittest import TestCase, skipIf
+import gc
 import os
+import pickle
+import weakref
 
 from zope.interface import verify
 
 from filesystems import _PY36, exceptions, interfaces
-from filesystems._path import Path, RelativePath
+from filesystems._path import Path, RelativePath, _ParseCache
 
 
 class TestPath(TestCase):
@@ -50,6 +53,57 @@ class TestPath(TestCase):
             ],
         )
 
+    def test_heritage_shares_parents(self):
+        heritage = list(Path("a", "b", "c", "d").heritage())
+        self.assertEqual(
+            [path.parent() for path in heritage[1:]],
+            heritage[:-1],
+        )
+        self.assertTrue(
+            all(
+                path.parent() is parent
+                for parent, path in zip(heritage, heritage[1:-1])
+            ),
+        )
+
+    def test_deep_heritage(self):
+        path = Path(*(str(i) for i in range(10000)))
+        heritage = list(path.heritage())
+        self.assertEqual(
+            (len(heritage), heritage[0], heritage[-2], heritage[-1]),
+            (10000, Path("0"), path.parent(), path),
+        )
+
+    def test_ancestors_are_not_kept_alive(self):
+        path = Path("a", "b", "c")
+        ancestors = path.ancestors()
+        next(ancestors)
+        parent = weakref.ref(next(ancestors))
+        ancestors.close()
+        gc.collect()
+        self.assertIsNone(parent())
+
+    def test_ancestors(self):
+        self.assertEqual(
+            list(Path("a", "b", "c").ancestors()), [
+                Path("a", "b", "c"),
+                Path("a", "b"),
+                Path("a"),
+            ],
+        )
+
+    def test_root_ancestors(self):
+        self.assertEqual(list(Path.root().ancestors()), [Path.root()])
+
+    def test_parent_of_child(self):
+        parent = Path("a", "b")
+        self.assertIs((parent / "c").parent(), parent)
+
+    def test_child_str(self):
+        parent = Path("a", "b")
+        str(parent)
+        self.assertEqual(str(parent / "c"), os.sep + os.sep.join("abc"))
+
     def test_from_string(self):
         self.assertEqual(
             Path.from_string(os.sep + os.sep.join("abc")),
@@ -119,12 +173,76 @@ class TestPath(TestCase):
         with self.assertRaises(exceptions.InvalidPath):
             Path.from_string("")
 
+    def test_from_string_interned(self):
+        path = os.sep + os.sep.join("abc")
+        self.assertIs(
+            Path.from_string(path, intern=True),
+            Path.from_string(path, intern=True),
+        )
+
+    def test_from_string_interned_relative(self):
+        path = os.sep.join("abc")
+        self.assertIs(
+            Path.from_string(path, intern=True),
+            Path.from_string(path, intern=True),
+        )
+
+    def test_from_string_not_interned(self):
+        path = os.sep + os.sep.join("abc")
+        self.assertIsNot(Path.from_string(path), Path.from_string(path))
+
+    def test_from_strings(self):
+        self.assertEqual(
+            Path.from_strings(
+                [os.sep + os.sep.join("ab"), os.sep.join("cd"), os.sep],
+            ),
+            [Path("a", "b"), RelativePath("c", "d"), Path.root()],
+        )
+
+    def test_from_strings_repeated(self):
+        path = os.sep + os.sep.join("ab")
+        self.assertEqual(
+            Path.from_strings(iter([path, path])),
+            [Path("a", "b"), Path("a", "b")],
+        )
+
+    def test_from_strings_interned(self):
+        path = os.sep + os.sep.join("ab")
+        first, second = Path.from_strings([path, path], intern=True)
+        self.assertIs(first, second)
+
+    def test_from_strings_empty_string(self):
+        with self.assertRaises(exceptions.InvalidPath):
+            Path.from_strings([os.sep + "a", ""])
+
+    def test_from_empty_string_interned(self):
+        with self.assertRaises(exceptions.InvalidPath):
+            Path.from_string("", intern=True)
+
     def test_str(self):
         self.assertEqual(
             str(Path.from_string(os.sep + os.sep.join("abc"))),
             os.sep + os.sep.join("abc"),
         )
 
+    def test_str_is_cached(self):
+        path = Path("a", "b", "c")
+        self.assertIs(str(path), str(path))
+
+    def test_hash(self):
+        self.assertEqual(hash(Path("a", "b")), hash(Path("a") / "b"))
+
+    def test_segments(self):
+        self.assertEqual((Path("a") / "b").segments, ("a", "b"))
+
+    def test_pickle(self):
+        path = Path("a", "b")
+        str(path), hash(path)
+        self.assertEqual(pickle.loads(pickle.dumps(path)), path)
+
+    def test_not_equal_to_relative_path(self):
+        self.assertNotEqual(Path("a", "b"), RelativePath("a", "b"))
+
     def test_cwd(self):
         self.assertEqual(Path.cwd(), Path.from_string(os.getcwd()))
 
@@ -175,6 +293,66 @@ class TestPath(TestCase):
         )
 
 
+class TestParseCache(TestCase):
+    def test_hits_and_misses(self):
+        cache = _ParseCache()
+        path = os.sep + os.sep.join("abc")
+        cache.split(path)
+        cache.split(path)
+        cache.split(os.sep.join("abc"))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_split(self):
+        cache = _ParseCache()
+        self.assertEqual(
+            cache.split_many([os.sep + os.sep.join("ab"), os.sep.join("ab")]),
+            [(False, ("a", "b")), (True, ("a", "b"))],
+        )
+
+    def test_evicts_least_recently_used(self):
+        cache = _ParseCache(maxsize=2)
+        cache.split("a")
+        cache.split("b")
+        cache.split("a")
+        cache.split("c")
+        cache.split("a")
+        cache.split("b")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (2, 4, 2))
+
+    def test_disabled(self):
+        cache = _ParseCache(maxsize=0)
+        cache.split("a")
+        cache.split("a")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 2, 0))
+
+    def test_lowering_maxsize(self):
+        cache = _ParseCache()
+        cache.split_many(["a", "b", "c"])
+        cache.maxsize = 1
+        cache.split("c")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 3, 1))
+
+    def test_disabling(self):
+        cache = _ParseCache()
+        cache.split_many(["a", "b", "c"])
+        cache.maxsize = 0
+        cache.split("a")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 4, 0))
+
+    def test_clear(self):
+        cache = _ParseCache()
+        cache.split("a")
+        cache.split("a")
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+    def test_invalid_paths_are_not_cached(self):
+        cache = _ParseCache()
+        with self.assertRaises(exceptions.InvalidPath):
+            cache.split("")
+        self.assertEqual(len(cache), 0)
+
+
 class TestRelativePath(TestCase):
     def test_div(self):
         self.assertEqual(
@@ -197,6 +375,16 @@ class TestRelativePath(TestCase):
             str(RelativePath("a", "b", "c")), os.path.join("a", "b", "c"),
         )
 
+    def test_str_is_cached(self):
+        path = RelativePath("a", "b", "c")
+        self.assertIs(str(path), str(path))
+
+    def test_hash(self):
+        self.assertEqual(
+            hash(RelativePath("a", "b")),
+            hash(RelativePath("a") / "b"),
+        )
+
     def test_repr(self):
         self.assertEqual(
             repr(RelativePath("a", "b", "c")),
@@ -225,6 +413,25 @@ class TestRelativePath(TestCase):
             ],
         )
 
+    def test_ancestors(self):
+        self.assertEqual(
+            list(RelativePath("a", "b", "c").ancestors()), [
+                RelativePath("a", "b", "c"),
+                RelativePath("a", "b"),
+                RelativePath("a"),
+            ],
+        )
+
+    def test_child_str(self):
+        parent = RelativePath("a", "b")
+        str(parent)
+        self.assertEqual(str(parent / "c"), os.sep.join("abc"))
+
+    def test_child_of_empty_str(self):
+        parent = RelativePath()
+        str(parent)
+        self.assertEqual(str(parent / "a"), "a")
+
     def test_sibling(self):
         self.assertEqual(
             RelativePath("a", "b").sibling("c"),
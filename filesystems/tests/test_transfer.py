@@ -0,0 +1,191 @@
+from unittest import TestCase
+
+from filesystems import Path, memory, native, transfer
+from filesystems._path import RelativePath
+
+
+class TestTransfer(TestCase):
+    def setUp(self):
+        self.memory = memory.from_mapping(
+            {
+                "tree": {
+                    "file": b"some things",
+                    "dir": {"empty": {}, "other": b"other things"},
+                    "link": RelativePath("file"),
+                    "dirlink": RelativePath("dir"),
+                },
+            },
+        )
+        self.native = native.FS()
+        self.tempdir = self.native.realpath(self.native.temporary_directory())
+        self.addCleanup(self.native.remove, self.tempdir)
+
+    def test_memory_to_native(self):
+        destination = self.tempdir / "tree"
+        transfer.copy(
+            source_fs=self.memory,
+            source=Path("tree"),
+            destination_fs=self.native,
+            destination=destination,
+        )
+        self.assertEqual(
+            (
+                set(self.native.list_directory(destination)),
+                set(self.native.list_directory(destination / "dir")),
+                self.native.get_contents(destination / "link", mode="b"),
+                self.native.readlink(destination / "dirlink"),
+                self.native.get_contents(destination / "dir" / "other"),
+            ),
+            (
+                {"file", "dir", "link", "dirlink"},
+                {"empty", "other"},
+                b"some things",
+                RelativePath("dir"),
+                u"other things",
+            ),
+        )
+
+    def test_native_to_memory(self):
+        self.native.create_directory(self.tempdir / "dir")
+        self.native.set_contents(self.tempdir / "dir" / "file", u"contents")
+
+        fs = memory.FS()
+        transfer.copy(
+            source_fs=self.native,
+            source=self.tempdir,
+            destination_fs=fs,
+            destination=Path("copy"),
+        )
+        self.assertEqual(
+            fs.get_contents(Path("copy", "dir", "file")),
+            u"contents",
+        )
+
+    def test_file(self):
+        transfer.copy(
+            source_fs=self.memory,
+            source=Path("tree", "file"),
+            destination_fs=self.native,
+            destination=self.tempdir / "file",
+        )
+        self.assertEqual(
+            self.native.get_contents(self.tempdir / "file", mode="b"),
+            b"some things",
+        )
+
+    def test_into_an_existing_tree(self):
+        destination = self.tempdir / "tree"
+        self.native.create_directory(destination)
+        self.native.set_contents(destination / "file", u"old")
+        self.native.link(source=Path("elsewhere"), to=destination / "link")
+
+        transfer.copy(
+            source_fs=self.memory,
+            source=Path("tree"),
+            destination_fs=self.native,
+            destination=destination,
+        )
+        self.assertEqual(
+            (
+                self.native.get_contents(destination / "file"),
+                self.native.readlink(destination / "link"),
+            ),
+            (u"some things", RelativePath("file")),
+        )
+
+    def test_in_parallel(self):
+        fs = memory.FS(thread_safe=True)
+        fs.create_directory(Path("tree"))
+        for i in range(20):
+            fs.set_contents(Path("tree", str(i)), str(i))
+
+        final = transfer.copy(
+            source_fs=fs,
+            source=Path("tree"),
+            destination_fs=self.native,
+            destination=self.tempdir / "tree",
+            parallelism=4,
+        )
+        self.assertEqual(
+            (
+                [
+                    self.native.get_contents(self.tempdir / "tree" / str(i))
+                    for i in range(20)
+                ],
+                final.files,
+            ),
+            ([str(i) for i in range(20)], 20),
+        )
+
+    def test_progress(self):
+        fs = memory.FS()
+        fs.set_contents(Path("file"), b"0123456789", mode="b")
+
+        seen = []
+        times = iter([0, 1, 2, 3, 4])
+        final = transfer.copy(
+            source_fs=fs,
+            source=Path("file"),
+            destination_fs=self.native,
+            destination=self.tempdir / "file",
+            chunk_size=4,
+            progress=seen.append,
+            clock=lambda: next(times),
+        )
+        self.assertEqual(
+            (
+                [(each.bytes, each.elapsed) for each in seen],
+                final,
+                final.throughput,
+            ),
+            (
+                [(4, 1), (8, 2), (10, 3), (10, 4)],
+                transfer.Progress(files=1, bytes=10, elapsed=4),
+                2.5,
+            ),
+        )
+
+    def test_skip_unchanged(self):
+        destination = self.tempdir / "tree"
+        arguments = dict(
+            source_fs=self.memory,
+            source=Path("tree"),
+            destination_fs=self.native,
+            destination=destination,
+            skip_unchanged=True,
+        )
+        transfer.copy(**arguments)
+
+        self.memory.set_contents(Path("tree", "file"), b"changed", mode="b")
+        final = transfer.copy(**arguments)
+
+        self.assertEqual(
+            (
+                (final.files, final.skipped),
+                self.native.get_contents(destination / "file", mode="b"),
+            ),
+            ((1, 1), b"changed"),
+        )
+
+    def test_within_one_filesystem(self):
+        transfer.copy(
+            source_fs=self.memory,
+            source=Path("tree"),
+            destination_fs=self.memory,
+            destination=Path("copy"),
+        )
+        self.assertIs(
+            self.memory.get_contents(Path("copy", "file"), mode="b"),
+            self.memory.get_contents(Path("tree", "file"), mode="b"),
+        )
+
+    def test_non_positive_chunk_size(self):
+        with self.assertRaises(ValueError):
+            transfer.copy(
+                source_fs=self.memory,
+                source=Path("tree", "file"),
+                destination_fs=self.native,
+                destination=self.tempdir / "file",
+                chunk_size=0,
+            )
+        self.assertFalse(self.native.exists(self.tempdir / "file"))
@@ -0,0 +1,222 @@
+"""
+Transfer files and trees between any two filesystems.
+"""
+
+from threading import Lock
+import stat
+import time
+
+import attr
+
+from filesystems import common, exceptions
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # pragma: no cover
+    ThreadPoolExecutor = None
+
+
+_clock = getattr(time, "monotonic", time.time)
+
+#: How much of a file is read (and then written) at once by default.
+_CHUNK_SIZE = 2 ** 20
+
+
+@attr.s(frozen=True)
+class Progress(object):
+    """
+    How much of a transfer has been done so far.
+    """
+
+    files = attr.ib(default=0)
+    skipped = attr.ib(default=0)
+    bytes = attr.ib(default=0)
+    elapsed = attr.ib(default=0.0)
+
+    @property
+    def throughput(self):
+        """
+        The bytes transferred per second.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.bytes / float(self.elapsed)
+
+
+def copy(
+    source_fs,
+    source,
+    destination_fs,
+    destination,
+    parallelism=None,
+    chunk_size=_CHUNK_SIZE,
+    skip_unchanged=False,
+    progress=None,
+    clock=_clock,
+):
+    """
+    Copy a file or directory tree from one filesystem to another.
+
+    Directories are created unless they already exist, links are recreated
+    pointing at the same (unresolved) paths, and files are streamed across
+    ``chunk_size`` bytes at a time, replacing any already there. When both
+    filesystems are the same one, its own ``copy`` is used for files
+    instead.
+
+    With a ``parallelism`` above 1, that many threads copy files at once, so
+    both filesystems must then be safe to use from many threads.
+
+    If ``skip_unchanged`` is true, files whose destination is the same size
+    and no older than their source are left alone.
+
+    ``progress`` is called (one call at a time) with a `Progress` after each
+    chunk and each skipped file. The final one is returned.
+    """
+
+    chunk_size = common._chunk_size(chunk_size)
+    tally = _Tally(callback=progress, clock=clock, started=clock())
+    files = _prepare(
+        source_fs=source_fs,
+        source=source,
+        destination_fs=destination_fs,
+        destination=destination,
+    )
+
+    def copy_file(each):
+        _copy_file(
+            source_fs=source_fs,
+            source=each[0],
+            destination_fs=destination_fs,
+            destination=each[1],
+            chunk_size=chunk_size,
+            skip_unchanged=skip_unchanged,
+            tally=tally,
+        )
+
+    if not parallelism or parallelism <= 1 or ThreadPoolExecutor is None:
+        for each in files:
+            copy_file(each)
+    else:
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            for _ in executor.map(copy_file, files):
+                pass
+    return tally.progress
+
+
+@attr.s
+class _Tally(object):
+    """
+    The progress of a transfer, which may be added to from many threads.
+    """
+
+    _callback = attr.ib()
+    _clock = attr.ib()
+    _started = attr.ib()
+    _lock = attr.ib(factory=Lock, repr=False)
+    progress = attr.ib(factory=Progress)
+
+    def add(self, files=0, skipped=0, bytes=0):
+        with self._lock:
+            progress = self.progress = Progress(
+                files=self.progress.files + files,
+                skipped=self.progress.skipped + skipped,
+                bytes=self.progress.bytes + bytes,
+                elapsed=self._clock() - self._started,
+            )
+            if self._callback is not None:
+                self._callback(progress)
+
+
+def _prepare(source_fs, source, destination_fs, destination):
+    """
+    Create the directories and links of a tree, returning its files to copy.
+    """
+
+    if source_fs.is_link(path=source):
+        _link(source_fs, source, destination_fs, destination)
+        return []
+    elif not source_fs.is_dir(path=source):
+        return [(source, destination)]
+
+    files = []
+    depth = len(source.segments)
+    for path, dirnames, filenames in source_fs.walk(path=source):
+        target = destination.descendant(*path.segments[depth:])
+        if not destination_fs.is_dir(path=target):
+            destination_fs.create_directory(path=target)
+
+        for name in dirnames:
+            if source_fs.is_link(path=path / name):
+                _link(source_fs, path / name, destination_fs, target / name)
+        for name in filenames:
+            if source_fs.is_link(path=path / name):
+                _link(source_fs, path / name, destination_fs, target / name)
+            else:
+                files.append((path / name, target / name))
+    return files
+
+
+def _link(source_fs, source, destination_fs, destination):
+    """
+    Recreate a link, replacing any file or other link already there.
+    """
+
+    value = source_fs.readlink(path=source)
+    if destination_fs.is_link(path=destination):
+        if destination_fs.readlink(path=destination) == value:
+            return
+        destination_fs.remove_file(path=destination)
+    elif destination_fs.is_file(path=destination):
+        destination_fs.remove_file(path=destination)
+    destination_fs.link(source=value, to=destination)
+
+
+def _unchanged(source_fs, source, destination_fs, destination):
+    """
+    Whether the destination is a file of the same size, and no older.
+    """
+
+    try:
+        theirs = destination_fs.stat(path=destination)
+    except (exceptions.FileNotFound, exceptions.NotADirectory):
+        return False
+    ours = source_fs.stat(path=source)
+    return (
+        stat.S_ISREG(theirs.st_mode) and
+        theirs.st_size == ours.st_size and
+        theirs.st_mtime >= ours.st_mtime
+    )
+
+
+def _copy_file(
+    source_fs,
+    source,
+    destination_fs,
+    destination,
+    chunk_size,
+    skip_unchanged,
+    tally,
+):
+    if skip_unchanged and _unchanged(
+        source_fs=source_fs,
+        source=source,
+        destination_fs=destination_fs,
+        destination=destination,
+    ):
+        tally.add(skipped=1)
+        return
+
+    if source_fs is destination_fs:
+        source_fs.copy(source=source, destination=destination)
+        tally.add(files=1, bytes=source_fs.stat(path=destination).st_size)
+        return
+
+    with source_fs.open(path=source, mode="rb") as reading:
+        with destination_fs.open(path=destination, mode="wb") as writing:
+            while True:
+                chunk = reading.read(chunk_size)
+                if not chunk:
+                    break
+                writing.write(chunk)
+                tally.add(bytes=len(chunk))
+    tally.add(files=1)